@@ -0,0 +1,46 @@
+import timeit
+import pygame
+from pygame.math import Vector2
+from pygame_helper import Rotator2, PositionalRect
+
+
+NUM_CONSTRUCTIONS = 100000
+REPEATS = 3
+
+rect = pygame.Rect(10, 20, 30, 40)
+vector = Vector2(3, -4)
+rotator_one = Rotator2(30)
+rotator_two = Rotator2(170)
+
+SCENARIOS = (
+    ("PositionalRect(rect)", lambda: PositionalRect(rect), lambda: PositionalRect.from_rect(rect)),
+    (
+        "PositionalRect(x, y, width, height)",
+        lambda: PositionalRect(10, 20, 30, 40),
+        lambda: PositionalRect.from_x_y_width_height(10, 20, 30, 40)
+    ),
+    ("Rotator2(float)", lambda: Rotator2(45.0), lambda: Rotator2.from_degrees(45.0)),
+    ("Rotator2(Vector2)", lambda: Rotator2(vector), lambda: Rotator2.from_vector(vector)),
+    ("Rotator2(Rotator2)", lambda: Rotator2(rotator_one), lambda: Rotator2.from_rotator(rotator_one)),
+    (
+        "rotator + rotator",
+        lambda: Rotator2(rotator_one.rotator + rotator_two.rotator),
+        lambda: rotator_one + rotator_two
+    ),
+)
+
+
+def main():
+    print(f"{NUM_CONSTRUCTIONS} constructions per scenario, best of {REPEATS}")
+    print(f"{'scenario':<38} {'dispatch':>12} {'factory':>12} {'speedup':>8}")
+    for name, dispatch_fn, factory_fn in SCENARIOS:
+        dispatch_time = min(timeit.repeat(dispatch_fn, number=NUM_CONSTRUCTIONS, repeat=REPEATS))
+        factory_time = min(timeit.repeat(factory_fn, number=NUM_CONSTRUCTIONS, repeat=REPEATS))
+        print(
+            f"{name:<38} {dispatch_time * 1000:>9.1f} ms {factory_time * 1000:>9.1f} ms"
+            f" {dispatch_time / factory_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
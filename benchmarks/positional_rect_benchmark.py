@@ -0,0 +1,82 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import timeit
+import tracemalloc
+import pygame
+from pygame_helper import PositionalRect, FastPositionalRect
+
+
+NUM_UPDATES = 100000
+REPEATS = 3
+
+
+def set_center_with_properties(positional_rect, other_rect):
+    for i in range(NUM_UPDATES):
+        positional_rect.centerx = i % 800
+        positional_rect.centery = i % 600
+
+
+def set_center_in_place(positional_rect, other_rect):
+    for i in range(NUM_UPDATES):
+        positional_rect.set_center(i % 800, i % 600)
+
+
+def move_and_collide(positional_rect, other_rect):
+    for i in range(NUM_UPDATES):
+        positional_rect.x += 1
+        positional_rect.rect.colliderect(other_rect)
+        positional_rect.rect.colliderect(other_rect)
+
+
+def read_center(positional_rect, other_rect):
+    for i in range(NUM_UPDATES):
+        positional_rect.center
+
+
+def read_rect(positional_rect, other_rect):
+    for i in range(NUM_UPDATES):
+        positional_rect.rect
+
+
+SCENARIOS = (
+    ("centerx/centery setters", set_center_with_properties, set_center_with_properties),
+    ("center setters vs set_center()", set_center_with_properties, set_center_in_place),
+    ("x += 1 then 2x rect.colliderect", move_and_collide, move_and_collide),
+    ("center reads", read_center, read_center),
+    ("rect reads without writes", read_rect, read_rect),
+)
+
+
+def measure_time(fn, rect_class):
+    other_rect = pygame.Rect(100, 100, 50, 50)
+    return min(timeit.repeat(lambda: fn(rect_class(0, 0, 20, 20), other_rect), number=1, repeat=REPEATS))
+
+
+def measure_instance_memory(rect_class):
+    tracemalloc.start()
+    # the peak is taken while the list is still alive, so nothing needs to hold on to it
+    [rect_class(i, i, 20, 20) for i in range(NUM_UPDATES)]
+    _, memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory
+
+
+def main():
+    print(f"{NUM_UPDATES} updates per scenario, best of {REPEATS}")
+    print(f"{'scenario':<34} {'PositionalRect':>16} {'FastPositionalRect':>20} {'speedup':>8}")
+    for name, positional_rect_fn, fast_positional_rect_fn in SCENARIOS:
+        time_before = measure_time(positional_rect_fn, PositionalRect)
+        time_after = measure_time(fast_positional_rect_fn, FastPositionalRect)
+        print(f"{name:<34} {time_before * 1000:>13.1f} ms {time_after * 1000:>17.1f} ms {time_before / time_after:>7.1f}x")
+
+    memory_before = measure_instance_memory(PositionalRect)
+    memory_after = measure_instance_memory(FastPositionalRect)
+    print(
+        f"{'memory of ' + str(NUM_UPDATES) + ' instances':<34} {memory_before / 1e6:>13.1f} MB"
+        f" {memory_after / 1e6:>17.1f} MB {memory_before / memory_after:>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
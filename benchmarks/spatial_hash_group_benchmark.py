@@ -0,0 +1,92 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import timeit
+import pygame
+from pygame_helper import SpatialHashGroup
+from pygame_helper.movement import AbstractMovementComponent, VelocityMovementComponent
+
+
+WORLD_GEOMETRY = (8000, 8000)
+SPRITE_COUNTS = (1000, 5000, 20000)
+NUM_MOVERS = 200
+REPEATS = 3
+
+
+class _Clock(object):
+
+    def get_time(self):
+        return 16
+
+
+class _GameMode(object):
+
+    def __init__(self):
+        self.clock = _Clock()
+
+
+class _Sprite(pygame.sprite.Sprite):
+
+    def __init__(self, position, geometry):
+        super().__init__()
+        self.image = None
+        self.rect = pygame.Rect(position, geometry)
+
+
+def create_walls(num_sprites):
+    return [
+        _Sprite((random.randrange(WORLD_GEOMETRY[0]), random.randrange(WORLD_GEOMETRY[1])), (32, 32))
+        for _ in range(num_sprites)
+    ]
+
+
+def create_movers(game_mode):
+    movers = list()
+    for _ in range(NUM_MOVERS):
+        mover = _Sprite((0, 0), (16, 16))
+        mover.movement = VelocityMovementComponent(
+            game_mode, mover, mover.rect,
+            constant_velocity_delta=(random.uniform(-300, 300), random.uniform(-300, 300)),
+            default_position=(random.randrange(WORLD_GEOMETRY[0]), random.randrange(WORLD_GEOMETRY[1])),
+            window_size=WORLD_GEOMETRY,
+            movement_type=AbstractMovementComponent.FOUR_WAY_MOVEMENT,
+            direction_control=AbstractMovementComponent.DIRECTION_ONLY
+        )
+        movers.append(mover)
+    return movers
+
+
+def move_all(movers, group):
+    for mover in movers:
+        mover.movement.move_with_collision(
+            mover.movement.get_x_collision,
+            mover.movement.get_y_collision,
+            group
+        )
+
+
+def main():
+    pygame.display.init()
+    random.seed(0)
+    game_mode = _GameMode()
+
+    print(f"{NUM_MOVERS} movers calling move_with_collision once per frame")
+    print(f"{'sprites':>8} {'Group (ms)':>12} {'SpatialHashGroup (ms)':>22} {'speedup':>8}")
+    for num_sprites in SPRITE_COUNTS:
+        walls = create_walls(num_sprites)
+        group = pygame.sprite.Group(*walls)
+        spatial_hash_group = SpatialHashGroup((64, 64), *walls)
+        movers = create_movers(game_mode)
+
+        group_time = min(timeit.repeat(lambda: move_all(movers, group), number=1, repeat=REPEATS))
+        spatial_hash_time = min(timeit.repeat(lambda: move_all(movers, spatial_hash_group), number=1, repeat=REPEATS))
+        print(
+            f"{num_sprites:>8} {group_time * 1000:>12.2f} {spatial_hash_time * 1000:>22.2f} "
+            f"{group_time / spatial_hash_time:>7.1f}x"
+        )
+        print(f"{'':>8} {spatial_hash_group.get_cell_occupancy_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import timeit
+import pygame
+from pygame_helper import Timer, TimerManager
+
+
+NUM_TIMERS = 10000
+NUM_FRAMES = 100
+FRAMETIME = 1 / 60
+REPEATS = 3
+
+
+def poll_timers(timers):
+    for _ in range(NUM_FRAMES):
+        [timer for timer in timers if timer.is_completed()]
+
+
+def tick_timer_manager(timer_manager):
+    for _ in range(NUM_FRAMES):
+        timer_manager.tick(FRAMETIME)
+
+
+def create_polled_timers():
+    random.seed(0)
+    return [Timer(random.uniform(0.5, 30), auto_start=True) for _ in range(NUM_TIMERS)]
+
+
+def create_timer_manager():
+    random.seed(0)
+    timer_manager = TimerManager()
+    for _ in range(NUM_TIMERS):
+        timer_manager.add_timer(random.uniform(0.5, 30))
+    return timer_manager
+
+
+def main():
+    pygame.display.init()
+    polled_time = min(timeit.repeat(lambda: poll_timers(create_polled_timers()), number=1, repeat=REPEATS))
+    managed_time = min(timeit.repeat(lambda: tick_timer_manager(create_timer_manager()), number=1, repeat=REPEATS))
+    print(f"{NUM_TIMERS} live timers, {NUM_FRAMES} frames, best of {REPEATS} (including setup)")
+    print(f"{'polling Timer.is_completed()':<32} {polled_time * 1000:>9.1f} ms")
+    print(f"{'TimerManager.tick()':<32} {managed_time * 1000:>9.1f} ms {polled_time / managed_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
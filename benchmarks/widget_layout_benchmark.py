@@ -0,0 +1,71 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import time
+import pygame
+from pygame_helper.widgets import WidgetLayout, BoxWidget
+
+
+NUM_WIDGETS = 10000
+NUM_FRAMES = 20
+NUM_MOVES = 1000
+NUM_SCALED_WIDGETS = 200
+NUM_SCALED_FRAMES = 200
+
+
+def measure(fn):
+    time_started = time.perf_counter()
+    fn()
+    return time.perf_counter() - time_started
+
+
+def main():
+    pygame.display.init()
+    window = pygame.Surface((1280, 720))
+    widget_layout = WidgetLayout((1280, 720))
+    widgets = [BoxWidget((4, 4), colour=(255, 255, 255)) for _ in range(NUM_WIDGETS)]
+
+    def add_widgets():
+        for i, widget in enumerate(widgets):
+            widget_layout.add_widget(widget, ((i * 7) % 1280, (i * 13) % 720))
+
+    def render_frames():
+        for _ in range(NUM_FRAMES):
+            widget_layout.render(window, size="original")
+
+    # each widget moves a few places back, as when bringing a widget in front of its neighbours
+    def move_widgets():
+        for i in range(NUM_MOVES):
+            widget_name = f"BoxWidget_{(i * 997) % NUM_WIDGETS}"
+            widget_layout.change_widget_render_position(widget_name, widget_layout._entry_indices[widget_name] + 3)
+
+    def delete_widgets():
+        for i in range(0, NUM_WIDGETS, 2):
+            widget_layout.delete_widget(f"BoxWidget_{i}")
+
+    print(f"{NUM_WIDGETS} widgets")
+    print(f"{'add all widgets':<34} {measure(add_widgets) * 1000:>9.1f} ms")
+    print(f"{'render, per frame':<34} {measure(render_frames) * 1000 / NUM_FRAMES:>9.1f} ms")
+    print(f"{f'move {NUM_MOVES} widgets':<34} {measure(move_widgets) * 1000:>9.1f} ms")
+    print(f"{'delete every other widget':<34} {measure(delete_widgets) * 1000:>9.1f} ms")
+    print(f"{'render after deletes, per frame':<34} {measure(render_frames) * 1000 / NUM_FRAMES:>9.1f} ms")
+
+    # a retained 800x600 layout scaled up to 1920x1080, with one widget changing every frame
+    scaled_window = pygame.Surface((1920, 1080))
+    scaled_widget_layout = WidgetLayout((800, 600), retained=True)
+    scaled_widgets = [BoxWidget((12, 12), colour=(255, 255, 255)) for _ in range(NUM_SCALED_WIDGETS)]
+    for i, widget in enumerate(scaled_widgets):
+        scaled_widget_layout.add_widget(widget, ((i * 37) % 780, (i * 53) % 580))
+    scaled_widget_layout.render(scaled_window)
+
+    def render_scaled_frames():
+        for frame in range(NUM_SCALED_FRAMES):
+            scaled_widgets[frame % NUM_SCALED_WIDGETS].set_colour((frame % 256, 0, 0))
+            scaled_widget_layout.render(scaled_window)
+
+    print(f"{NUM_SCALED_WIDGETS} widgets, 800x600 scaled to 1920x1080, one changed per frame")
+    print(f"{'retained render, per frame':<34} {measure(render_scaled_frames) * 1000 / NUM_SCALED_FRAMES:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,23 @@
-from pygame_helper.rotator2 import Rotator2
+from pygame_helper.rotator2 import Rotator2, Rotator2LookupTable
+from pygame_helper.rotator2_array import Rotator2Array
 from pygame_helper.positional_rect import PositionalRect
+from pygame_helper.fast_positional_rect import FastPositionalRect
+from pygame_helper.clocks import AbstractClock, RealClock, FixedStepClock, ManualClock, ScaledClock
 from pygame_helper.timer import Timer
+from pygame_helper.timer_manager import TimerManager, ManagedTimer
 from pygame_helper.keybinder import Keybinder
+from pygame_helper.keyboard_state import KeyboardState
+from pygame_helper.input_recorder import InputRecorder, InputPlayback
 from pygame_helper.utilities import XYTuple, WHTuple, NESWTuple
+from pygame_helper.binary_tile_map import BinaryTileMap, save_tile_map_as_binary, convert_json_tile_map_to_binary
+from pygame_helper.map_generation import get_autotile_index, describe_tile_map_in_parallel
 from pygame_helper.abstract_map import AbstractMap
+from pygame_helper.abstract_chunked_map import AbstractChunkedMap, MapChunk
+from pygame_helper.chunk_sources import TileMapChunkSource, ChunkDirectoryChunkSource, split_tile_map_into_chunk_files
+from pygame_helper.spatial_hash_group import SpatialHashGroup
 import pygame_helper.exceptions
 import pygame_helper.widgets
 import pygame_helper.movement
 from pygame_helper.game_mode import GameMode
-from pygame_helper.game_mode import GameModeType
\ No newline at end of file
+from pygame_helper.game_mode import GameModeType
+from pygame_helper.fixed_step_runner import FixedStepRunner
\ No newline at end of file
@@ -0,0 +1,173 @@
+import pygame
+from pygame_helper.utilities import XYTuple, WHTuple
+from pygame_helper.spatial_hash_group import SpatialHashGroup
+from abc import ABC, abstractmethod
+
+
+class MapChunk(object):
+
+    def __init__(self, chunk_position, tile_offset, tile_map, tile_geometry):
+        self.chunk_position = XYTuple(*chunk_position)
+        self.tile_offset = XYTuple(*tile_offset)
+        self.tile_map = tile_map
+        self.num_tiles = XYTuple(x=len(tile_map[0]) if tile_map else 0, y=len(tile_map))
+        self.rect = pygame.Rect(
+            self.tile_offset.x * tile_geometry.width,
+            self.tile_offset.y * tile_geometry.height,
+            self.num_tiles.x * tile_geometry.width,
+            self.num_tiles.y * tile_geometry.height
+        )
+        self.surface = pygame.Surface(self.rect.size)
+        self.tile_objects = pygame.sprite.Group()
+
+    # yields the map (not chunk) tile position of every tile with its key
+    def iterate_tiles(self):
+        for row_index, row in enumerate(self.tile_map):
+            for column_index, tile in enumerate(row):
+                yield self.tile_offset.x + column_index, self.tile_offset.y + row_index, tile
+
+    def delete_all_tile_objects(self):
+        for tile_object in self.tile_objects.sprites():
+            tile_object.kill()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(chunk_position={self.chunk_position}, num_tiles={self.num_tiles})"
+
+
+class AbstractChunkedMap(ABC):
+
+    # the world is split into chunks which are only loaded (and generated) once the camera
+    # gets within load_radius chunks of them, and evicted again beyond evict_radius chunks,
+    # so neither the whole tile map nor a world-sized surface is ever held in memory
+    def __init__(self, game_mode, chunk_source, tile_geometry, chunk_geometry=(32, 32), load_radius=1, evict_radius=2):
+        if evict_radius < load_radius:
+            raise ValueError("evict_radius cannot be smaller than load_radius")
+
+        self.game_mode = game_mode
+        self.chunk_source = chunk_source
+        self.tile_key_to_class_mapping = {tile: None for tile in chunk_source.tile_keys}
+
+        self.num_tiles = XYTuple(*chunk_source.num_tiles)
+        self.tile_geometry = WHTuple(*tile_geometry)
+        self.chunk_geometry = WHTuple(*chunk_geometry)
+        self.num_chunks = XYTuple(
+            x=-(-self.num_tiles.x // self.chunk_geometry.width),
+            y=-(-self.num_tiles.y // self.chunk_geometry.height)
+        )
+        self.window_geometry = WHTuple(
+            self.tile_geometry.width * self.num_tiles.x,
+            self.tile_geometry.height * self.num_tiles.y
+        )
+        self.load_radius = load_radius
+        self.evict_radius = evict_radius
+
+        self.chunks = dict()
+        self.tile_objects = SpatialHashGroup(self.tile_geometry)
+
+    @abstractmethod
+    def generate_chunk(self, chunk):
+        pass
+
+
+    ### Chunk Streaming Section ###
+    def update_loaded_chunks(self, camera_rect):
+        camera_chunks = self.get_chunks_in_rect(camera_rect)
+        for chunk_position in self._get_chunk_positions_around(camera_chunks, self.evict_radius, invert=True):
+            self.evict_chunk(chunk_position)
+        for chunk_position in self._get_chunk_positions_around(camera_chunks, self.load_radius):
+            if chunk_position not in self.chunks:
+                self.load_chunk(chunk_position)
+
+    def get_chunks_in_rect(self, rect):
+        rect = pygame.Rect(rect)
+        chunk_width = self.tile_geometry.width * self.chunk_geometry.width
+        chunk_height = self.tile_geometry.height * self.chunk_geometry.height
+        return pygame.Rect(
+            rect.left // chunk_width,
+            rect.top // chunk_height,
+            (rect.right - 1) // chunk_width - rect.left // chunk_width + 1,
+            (rect.bottom - 1) // chunk_height - rect.top // chunk_height + 1
+        )
+
+    def _get_chunk_positions_around(self, chunks_rect, radius, invert=False):
+        area = chunks_rect.inflate(radius * 2, radius * 2).clip(pygame.Rect((0, 0), self.num_chunks))
+        if invert:
+            return [chunk_position for chunk_position in self.chunks if not area.collidepoint(chunk_position)]
+        return [(x, y) for y in range(area.top, area.bottom) for x in range(area.left, area.right)]
+
+    def load_chunk(self, chunk_position):
+        chunk_x, chunk_y = chunk_position
+        if not (0 <= chunk_x < self.num_chunks.x and 0 <= chunk_y < self.num_chunks.y):
+            raise IndexError(f"Chunk {chunk_position} is outside of the map")
+
+        if chunk_position in self.chunks:
+            self.evict_chunk(chunk_position)
+
+        tile_offset = (chunk_x * self.chunk_geometry.width, chunk_y * self.chunk_geometry.height)
+        tile_map = self.chunk_source.get_chunk(
+            tile_offset[0], tile_offset[1],
+            min(self.chunk_geometry.width, self.num_tiles.x - tile_offset[0]),
+            min(self.chunk_geometry.height, self.num_tiles.y - tile_offset[1])
+        )
+        chunk = MapChunk(chunk_position, tile_offset, tile_map, self.tile_geometry)
+        self.chunks[chunk.chunk_position] = chunk
+        self.generate_chunk(chunk)
+        self.tile_objects.add(chunk.tile_objects.sprites())
+        return chunk
+
+    def evict_chunk(self, chunk_position):
+        chunk = self.chunks.pop(tuple(chunk_position), None)
+        if chunk is not None:
+            chunk.delete_all_tile_objects()
+        return chunk
+
+    def evict_all_chunks(self):
+        for chunk_position in list(self.chunks):
+            self.evict_chunk(chunk_position)
+
+    # generate_map/regenerate_map keep AbstractMap's vocabulary: they regenerate every loaded chunk
+    def generate_map(self):
+        for chunk_position in list(self.chunks):
+            self.load_chunk(chunk_position)
+
+    def regenerate_map(self):
+        self.generate_map()
+
+
+    ### Queries Section ###
+    def get_chunk_at(self, tile_position):
+        return self.chunks.get((tile_position[0] // self.chunk_geometry.width, tile_position[1] // self.chunk_geometry.height))
+
+    def get_tile_key_at(self, tile_position):
+        chunk = self.get_chunk_at(tile_position)
+        if chunk is not None:
+            return chunk.tile_map[tile_position[1] - chunk.tile_offset.y][tile_position[0] - chunk.tile_offset.x]
+        return self.chunk_source.get_chunk(tile_position[0], tile_position[1], 1, 1)[0][0]
+
+    def get_tile_objects_at(self, tile_position):
+        return self.tile_objects.get_sprites_in_rect((
+            tile_position[0] * self.tile_geometry.width,
+            tile_position[1] * self.tile_geometry.height,
+            self.tile_geometry.width,
+            self.tile_geometry.height
+        ))
+
+
+    ### Render Section ###
+    def render(self, window, camera_position=(0, 0)):
+        camera_rect = pygame.Rect(camera_position, window.get_size())
+        for chunk in self.chunks.values():
+            if chunk.rect.colliderect(camera_rect):
+                window.blit(chunk.surface, (chunk.rect.x - camera_rect.x, chunk.rect.y - camera_rect.y))
+
+    def draw_grid(self, colour=(138, 138, 134)):
+        for chunk in self.chunks.values():
+            width, height = chunk.rect.size
+            for x in range(0, width, self.tile_geometry.width):
+                pygame.draw.line(chunk.surface, colour, (x, 0), (x, height))
+            for y in range(0, height, self.tile_geometry.height):
+                pygame.draw.line(chunk.surface, colour, (0, y), (width, y))
+
+    def delete_all_tile_objects(self):
+        for tile_object in self.tile_objects.sprites():
+            tile_object.kill()
@@ -1,5 +1,8 @@
 import pygame
 from pygame_helper.utilities import XYTuple, WHTuple
+from pygame_helper.spatial_hash_group import SpatialHashGroup
+from pygame_helper.binary_tile_map import BinaryTileMap
+from pygame_helper.map_generation import describe_tile_map_in_parallel
 from abc import ABC, abstractmethod
 import json
 
@@ -11,11 +14,22 @@ class AbstractMap(ABC):
         self.window = None
         self.tile_map = None
         self.tile_key_to_class_mapping = dict()
-        self.tile_objects = pygame.sprite.Group()
 
         self.num_tiles = None
         self.tile_geometry = WHTuple(*tile_geometry)
+        self.tile_objects = SpatialHashGroup(self.tile_geometry)
+        self.tile_objects.add_rect_change_listener(self.invalidate_static_layer_rect)
         self.window_geometry = None
+        self.viewport = None
+        self.smooth_scale = False
+        self.cache_scaled = False
+        self._scaled_surface = None
+        self._scaled_surface_key = None
+        self._is_window_only_static_layer = False
+        self.static_layer = None
+        self.static_layer_background_colour = None
+        self.static_layer_grid_colour = None
+        self._static_layer_dirty_rects = set()
 
         self._load_tile_map(map_path)
         self._load_tile_keys_from_tile_map()
@@ -23,17 +37,21 @@ class AbstractMap(ABC):
         self._create_window_from_geometry()
         self.generate_map()
 
-        self.regenerate_map = self.generate_map
-
     def _load_tile_map(self, map_path):
         try:
+            if BinaryTileMap.is_binary_tile_map(map_path):
+                self.tile_map = BinaryTileMap(map_path)
+                return
             with open(map_path, "r", encoding="utf-8") as f:
                 self.tile_map = json.load(f)
         except (FileNotFoundError, TypeError) as e:
             self.tile_map = None
 
     def _load_tile_keys_from_tile_map(self):
-        if self.tile_map is not None:
+        if isinstance(self.tile_map, BinaryTileMap):
+            for tile in self.tile_map.palette:
+                self.tile_key_to_class_mapping[tile] = None
+        elif self.tile_map is not None:
             for row in self.tile_map:
                 for tile in row:
                     self.tile_key_to_class_mapping[tile] = None
@@ -59,15 +77,183 @@ class AbstractMap(ABC):
     def generate_map(self):
         pass
 
+    def regenerate_map(self):
+        self.generate_map()
+        self.invalidate_window()
+
+    ### Viewport Section: without a viewport the whole map is rendered onto the window ###
+    def set_viewport(self, viewport_rect):
+        if self.window is None:
+            raise ValueError("A viewport cannot be set on a map without a loaded tile map")
+        self.viewport = pygame.Rect(viewport_rect)
+        self.viewport.clamp_ip(self.window.get_rect())
+
+    def clear_viewport(self):
+        self.viewport = None
+
+    def scroll_viewport(self, dx, dy):
+        self.set_viewport(self._get_viewport_or_raise().move(dx, dy))
+
+    def center_viewport_on(self, position):
+        viewport = self._get_viewport_or_raise().copy()
+        viewport.center = position
+        self.set_viewport(viewport)
+
+    def _get_viewport_or_raise(self):
+        if self.viewport is None:
+            raise ValueError("No viewport has been set, call set_viewport first")
+        return self.viewport
+
+    def get_tiles_in_viewport(self):
+        area = self._get_render_area()
+        first_tile_x, first_tile_y = area.left // self.tile_geometry.width, area.top // self.tile_geometry.height
+        return pygame.Rect(
+            first_tile_x,
+            first_tile_y,
+            (area.right - 1) // self.tile_geometry.width - first_tile_x + 1,
+            (area.bottom - 1) // self.tile_geometry.height - first_tile_y + 1
+        )
+
+    def get_tile_objects_in_viewport(self):
+        return self.tile_objects.get_sprites_in_rect(self._get_render_area())
+
+    def get_map_position_from_window_position(self, window, window_position):
+        area = self._get_render_area()
+        window_width, window_height = window.get_size()
+        return (
+            area.x + window_position[0] * area.width / window_width,
+            area.y + window_position[1] * area.height / window_height
+        )
+
+    def _get_render_area(self):
+        if self.viewport is None:
+            return self.window.get_rect()
+        return self.viewport.clip(self.window.get_rect())
+
+    # describe_tile runs across worker processes (see describe_tile_map_in_parallel), while
+    # create_tile_object(tile_class, tile_position, descriptor) builds the sprites/surfaces on this
+    # process; tile keys mapped to None in tile_key_to_class_mapping are neither described nor created
+    def generate_tile_objects_in_parallel(self, describe_tile, create_tile_object, chunk_geometry=(64, 64), max_workers=None):
+        tile_keys = {tile_key for tile_key, tile_class in self.tile_key_to_class_mapping.items() if tile_class is not None}
+        described_chunks = describe_tile_map_in_parallel(self.tile_map, describe_tile, chunk_geometry, max_workers, tile_keys)
+        for (tile_x, tile_y), descriptors in described_chunks:
+            for row_index, descriptor_row in enumerate(descriptors):
+                for column_index, tile_descriptor in enumerate(descriptor_row):
+                    if tile_descriptor is not None and tile_descriptor[1] is not None:
+                        tile_key, descriptor = tile_descriptor
+                        tile_position = (tile_x + column_index, tile_y + row_index)
+                        create_tile_object(self.tile_key_to_class_mapping[tile_key], tile_position, descriptor)
+
+    # with cache_scaled set, the scaled render area is reused until the viewport, the window's size or
+    # the map changes, so anything drawn straight onto self.window must be followed by invalidate_window()
+    def invalidate_window(self):
+        self._scaled_surface_key = None
+        self._is_window_only_static_layer = False
+
     def render(self, window):
-        window.blit(pygame.transform.scale(self.window, window.get_size()), (0, 0))
+        area = self._get_render_area()
+        window_size = window.get_size()
+        if area.size == window_size:
+            window.blit(self.window, (0, 0), area)
+        else:
+            window.blit(self._scale_render_area(area, window_size), (0, 0))
+
+    def _scale_render_area(self, area, size):
+        # only the visible area is resampled, into a surface which is reused until the window is resized;
+        # it is resampled every frame unless cache_scaled is set
+        if self._scaled_surface is None or self._scaled_surface.get_size() != size:
+            self._scaled_surface = pygame.Surface(size, 0, self.window)
+            self._scaled_surface_key = None
+
+        scaled_surface_key = (tuple(area), self.smooth_scale)
+        if not self.cache_scaled or scaled_surface_key != self._scaled_surface_key:
+            source = self.window if area == self.window.get_rect() else self.window.subsurface(area)
+            if self.smooth_scale:
+                pygame.transform.smoothscale(source, size, self._scaled_surface)
+            else:
+                pygame.transform.scale(source, size, self._scaled_surface)
+            self._scaled_surface_key = scaled_surface_key
+        return self._scaled_surface
 
     def draw_grid(self, colour=(138, 138, 134)):
+        self.invalidate_window()
         for x in range(0, self.window_geometry.width, self.tile_geometry.width):
             pygame.draw.line(self.window, colour, (x, 0), (x, self.window_geometry.height))
         for y in range(0, self.window_geometry.height, self.tile_geometry.height):
             pygame.draw.line(self.window, colour, (0, y), (self.window_geometry.width, y))
 
+    ### Static Layer Section: tile objects and grid lines drawn once, then kept up to date ###
+    ### by redrawing only the areas where tile objects were added, moved or killed       ###
+    def bake_static_layer(self, background_colour=(0, 0, 0), grid_colour=None):
+        self.static_layer = pygame.Surface(self.window_geometry, 0, self.window)
+        self.static_layer_background_colour = background_colour
+        self.static_layer_grid_colour = grid_colour
+        self._static_layer_dirty_rects.clear()
+        self.tile_objects.refresh()
+        self._static_layer_dirty_rects.clear()
+        self._redraw_static_layer_rect(self.static_layer.get_rect())
+        self._is_window_only_static_layer = False
+
+    def invalidate_static_layer_rect(self, rect):
+        if self.static_layer is not None:
+            self._static_layer_dirty_rects.add(tuple(rect))
+
+    def invalidate_tile(self, tile_position):
+        self.invalidate_static_layer_rect((
+            tile_position[0] * self.tile_geometry.width,
+            tile_position[1] * self.tile_geometry.height,
+            self.tile_geometry.width,
+            self.tile_geometry.height
+        ))
+
+    def update_static_layer(self):
+        self._raise_value_error_if_static_layer_not_baked()
+        self.tile_objects.refresh(include_moved_sprites=False)
+        redrawn_rects = list()
+        static_layer_rect = self.static_layer.get_rect()
+        while self._static_layer_dirty_rects:
+            rect = pygame.Rect(self._static_layer_dirty_rects.pop()).clip(static_layer_rect)
+            if rect.width and rect.height:
+                self._redraw_static_layer_rect(rect)
+                redrawn_rects.append(rect)
+        return redrawn_rects
+
+    def _raise_value_error_if_static_layer_not_baked(self):
+        if self.static_layer is None:
+            raise ValueError("No static layer has been baked, call bake_static_layer first")
+
+    def _redraw_static_layer_rect(self, rect):
+        self.static_layer.set_clip(rect)
+        self.static_layer.fill(self.static_layer_background_colour, rect)
+        self.static_layer.blits(
+            [(tile_object.image, tile_object.rect) for tile_object in self.tile_objects.get_sprites_in_rect(rect)],
+            doreturn=False
+        )
+        if self.static_layer_grid_colour is not None:
+            first_x = rect.left - rect.left % self.tile_geometry.width
+            for x in range(first_x, rect.right, self.tile_geometry.width):
+                pygame.draw.line(self.static_layer, self.static_layer_grid_colour, (x, 0), (x, self.window_geometry.height))
+            first_y = rect.top - rect.top % self.tile_geometry.height
+            for y in range(first_y, rect.bottom, self.tile_geometry.height):
+                pygame.draw.line(self.static_layer, self.static_layer_grid_colour, (0, y), (self.window_geometry.width, y))
+        self.static_layer.set_clip(None)
+
+    # the window is only redrawn when the static layer changed or something else was drawn onto it
+    def draw_static_layer(self):
+        self._raise_value_error_if_static_layer_not_baked()
+        if self.update_static_layer() or not self._is_window_only_static_layer:
+            self.window.blit(self.static_layer, (0, 0))
+            self._scaled_surface_key = None
+            self._is_window_only_static_layer = True
+
+    def get_tile_objects_at(self, tile_position):
+        return self.tile_objects.get_sprites_in_rect((
+            tile_position[0] * self.tile_geometry.width,
+            tile_position[1] * self.tile_geometry.height,
+            self.tile_geometry.width,
+            self.tile_geometry.height
+        ))
+
     def delete_all_tile_objects(self):
         for tile_object in self.tile_objects:
             tile_object.kill()
\ No newline at end of file
@@ -0,0 +1,105 @@
+import json
+import struct
+import numpy as np
+from pygame_helper.utilities import XYTuple
+
+
+# header: magic, version, bytes per tile, width, height, palette length, then the palette
+# (a JSON list of tile keys); it is padded so the grid of palette indices which follows
+# is aligned, letting numpy.memmap map it without parsing or copying
+MAGIC = b"PGTM"
+FORMAT_VERSION = 1
+_HEADER_FORMAT = "<4sBBIII"
+_GRID_ALIGNMENT = 8
+_BYTES_PER_TILE_TO_DTYPE = {1: np.dtype("<u1"), 2: np.dtype("<u2")}
+
+
+class BinaryTileMap(object):
+
+    # behaves like the JSON tile map (rows of tile keys, tile_map[y][x]) and is also a
+    # chunk source for AbstractChunkedMap
+    def __init__(self, map_path):
+        self.map_path = map_path
+        with open(map_path, "rb") as f:
+            header = f.read(struct.calcsize(_HEADER_FORMAT))
+            magic, version, bytes_per_tile, width, height, palette_length = struct.unpack(_HEADER_FORMAT, header)
+            if magic != MAGIC or version != FORMAT_VERSION or bytes_per_tile not in _BYTES_PER_TILE_TO_DTYPE:
+                raise ValueError(f"{map_path} is not a recognised binary tile map")
+            self.palette = json.loads(f.read(palette_length).decode("utf-8"))
+
+        self.num_tiles = XYTuple(x=width, y=height)
+        self.tile_keys = set(self.palette)
+        # numpy.memmap cannot map zero bytes, so an empty map's grid is held in memory
+        if width == 0 or height == 0:
+            self.grid = np.zeros((height, width), dtype=_BYTES_PER_TILE_TO_DTYPE[bytes_per_tile])
+            return
+        self.grid = np.memmap(
+            map_path,
+            dtype=_BYTES_PER_TILE_TO_DTYPE[bytes_per_tile],
+            mode="r",
+            offset=_get_grid_offset(palette_length),
+            shape=(height, width)
+        )
+
+    @staticmethod
+    def is_binary_tile_map(map_path):
+        with open(map_path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+
+    def _get_tile_keys_for_indices(self, palette_indices):
+        palette = self.palette
+        return [palette[palette_index] for palette_index in palette_indices.tolist()]
+
+    def get_chunk(self, tile_x, tile_y, num_tiles_x, num_tiles_y):
+        chunk_grid = self.grid[tile_y:tile_y + num_tiles_y, tile_x:tile_x + num_tiles_x]
+        return [self._get_tile_keys_for_indices(row) for row in chunk_grid]
+
+    def to_tile_map(self):
+        return self.get_chunk(0, 0, self.num_tiles.x, self.num_tiles.y)
+
+
+    def __len__(self):
+        return self.num_tiles.y
+
+    def __getitem__(self, row_index):
+        if isinstance(row_index, slice):
+            return [self._get_tile_keys_for_indices(row) for row in self.grid[row_index]]
+        return self._get_tile_keys_for_indices(self.grid[row_index])
+
+    def __iter__(self):
+        for row in self.grid:
+            yield self._get_tile_keys_for_indices(row)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.map_path!r})"
+
+
+def _get_grid_offset(palette_length):
+    header_length = struct.calcsize(_HEADER_FORMAT) + palette_length
+    return -(-header_length // _GRID_ALIGNMENT) * _GRID_ALIGNMENT
+
+
+def save_tile_map_as_binary(tile_map, binary_map_path):
+    palette = list(dict.fromkeys(tile for row in tile_map for tile in row))
+    if len(palette) > 2 ** 16:
+        raise ValueError("A binary tile map can hold at most 65536 distinct tile keys")
+
+    bytes_per_tile = 1 if len(palette) <= 2 ** 8 else 2
+    palette_indices = {tile: palette_index for palette_index, tile in enumerate(palette)}
+    num_tiles_x = len(tile_map[0]) if len(tile_map) > 0 else 0
+    grid = np.array(
+        [[palette_indices[tile] for tile in row] for row in tile_map],
+        dtype=_BYTES_PER_TILE_TO_DTYPE[bytes_per_tile]
+    ).reshape(len(tile_map), num_tiles_x)
+
+    encoded_palette = json.dumps(palette).encode("utf-8")
+    header = struct.pack(_HEADER_FORMAT, MAGIC, FORMAT_VERSION, bytes_per_tile, grid.shape[1], grid.shape[0], len(encoded_palette))
+    with open(binary_map_path, "wb") as f:
+        f.write(header + encoded_palette)
+        f.write(b"\0" * (_get_grid_offset(len(encoded_palette)) - len(header) - len(encoded_palette)))
+        f.write(grid.tobytes())
+
+
+def convert_json_tile_map_to_binary(map_path, binary_map_path):
+    with open(map_path, "r", encoding="utf-8") as f:
+        save_tile_map_as_binary(json.load(f), binary_map_path)
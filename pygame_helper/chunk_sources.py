@@ -0,0 +1,92 @@
+import os
+import json
+from pygame_helper.utilities import XYTuple, WHTuple
+
+
+# a chunk source gives AbstractChunkedMap the size of the map, its distinct tile keys,
+# and the tile keys of any rectangular chunk (as rows, like the JSON tile maps)
+class TileMapChunkSource(object):
+
+    def __init__(self, tile_map):
+        self.tile_map = tile_map
+        self.num_tiles = XYTuple(x=len(tile_map[0]), y=len(tile_map))
+        self.tile_keys = {tile for row in tile_map for tile in row}
+
+    @classmethod
+    def from_json(cls, map_path):
+        with open(map_path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def get_chunk(self, tile_x, tile_y, num_tiles_x, num_tiles_y):
+        return [row[tile_x:tile_x + num_tiles_x] for row in self.tile_map[tile_y:tile_y + num_tiles_y]]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(num_tiles={self.num_tiles})"
+
+
+class ChunkDirectoryChunkSource(object):
+
+    # a directory holding map_info.json and one chunk_{x}_{y}.json per chunk,
+    # as written by split_tile_map_into_chunk_files; only requested chunks are read
+    MAP_INFO_FILENAME = "map_info.json"
+    CHUNK_FILENAME = "chunk_{}_{}.json"
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, self.MAP_INFO_FILENAME), "r", encoding="utf-8") as f:
+            map_info = json.load(f)
+
+        self.num_tiles = XYTuple(*map_info["num_tiles"])
+        self.chunk_geometry = WHTuple(*map_info["chunk_geometry"])
+        self.tile_keys = set(map_info["tile_keys"])
+
+    def get_chunk(self, tile_x, tile_y, num_tiles_x, num_tiles_y):
+        num_tiles_x = min(num_tiles_x, self.num_tiles.x - tile_x)
+        num_tiles_y = min(num_tiles_y, self.num_tiles.y - tile_y)
+        if tile_x % self.chunk_geometry.width == 0 and tile_y % self.chunk_geometry.height == 0 \
+                and num_tiles_x <= self.chunk_geometry.width and num_tiles_y <= self.chunk_geometry.height:
+            stored_chunk = self._read_chunk_file(tile_x // self.chunk_geometry.width, tile_y // self.chunk_geometry.height)
+            return [row[:num_tiles_x] for row in stored_chunk[:num_tiles_y]]
+
+        # the requested area does not line up with the stored chunks, so it is stitched together
+        chunk = [list() for _ in range(num_tiles_y)]
+        first_chunk_x, last_chunk_x = tile_x // self.chunk_geometry.width, (tile_x + num_tiles_x - 1) // self.chunk_geometry.width
+        first_chunk_y, last_chunk_y = tile_y // self.chunk_geometry.height, (tile_y + num_tiles_y - 1) // self.chunk_geometry.height
+        for chunk_y in range(first_chunk_y, last_chunk_y + 1):
+            for chunk_x in range(first_chunk_x, last_chunk_x + 1):
+                stored_chunk = self._read_chunk_file(chunk_x, chunk_y)
+                for row_index, row in enumerate(stored_chunk):
+                    map_y = chunk_y * self.chunk_geometry.height + row_index
+                    if tile_y <= map_y < tile_y + num_tiles_y:
+                        start_x = chunk_x * self.chunk_geometry.width
+                        chunk[map_y - tile_y].extend(row[max(tile_x - start_x, 0):tile_x + num_tiles_x - start_x])
+        return chunk
+
+    def _read_chunk_file(self, chunk_x, chunk_y):
+        chunk_path = os.path.join(self.directory, self.CHUNK_FILENAME.format(chunk_x, chunk_y))
+        with open(chunk_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.directory!r})"
+
+
+def split_tile_map_into_chunk_files(map_path, directory, chunk_geometry=(32, 32)):
+    chunk_geometry = WHTuple(*chunk_geometry)
+    source = TileMapChunkSource.from_json(map_path)
+    os.makedirs(directory, exist_ok=True)
+
+    for tile_y in range(0, source.num_tiles.y, chunk_geometry.height):
+        for tile_x in range(0, source.num_tiles.x, chunk_geometry.width):
+            chunk_filename = ChunkDirectoryChunkSource.CHUNK_FILENAME.format(
+                tile_x // chunk_geometry.width, tile_y // chunk_geometry.height
+            )
+            with open(os.path.join(directory, chunk_filename), "w", encoding="utf-8") as f:
+                json.dump(source.get_chunk(tile_x, tile_y, chunk_geometry.width, chunk_geometry.height), f)
+
+    with open(os.path.join(directory, ChunkDirectoryChunkSource.MAP_INFO_FILENAME), "w", encoding="utf-8") as f:
+        json.dump({
+            "num_tiles": list(source.num_tiles),
+            "chunk_geometry": list(chunk_geometry),
+            "tile_keys": sorted(source.tile_keys, key=str)
+        }, f)
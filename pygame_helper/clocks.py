@@ -0,0 +1,120 @@
+import pygame
+from abc import ABC, abstractmethod
+
+
+# every clock reports time in milliseconds, like pygame.time.Clock:
+#   get_time()  -> duration of the last tick
+#   get_ticks() -> time elapsed since the clock started
+class AbstractClock(ABC):
+
+    @abstractmethod
+    def tick(self, *args):
+        pass
+
+    @abstractmethod
+    def get_time(self):
+        pass
+
+    @abstractmethod
+    def get_ticks(self):
+        pass
+
+
+class RealClock(AbstractClock):
+
+    def __init__(self):
+        self._clock = pygame.time.Clock()
+
+    def tick(self, framerate=0):
+        return self._clock.tick(framerate)
+
+    def get_time(self):
+        return self._clock.get_time()
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+    def get_fps(self):
+        return self._clock.get_fps()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class FixedStepClock(AbstractClock):
+
+    def __init__(self, frametime_ms=1000 / 60):
+        if frametime_ms < 0:
+            raise ValueError("Must provide a valid frametime (in milliseconds)")
+        self.frametime_ms = frametime_ms
+        self._ticks = 0
+        self._time = 0
+
+    def tick(self, *args):
+        self._ticks += self.frametime_ms
+        self._time = self.frametime_ms
+        return self._time
+
+    def get_time(self):
+        return self._time
+
+    def get_ticks(self):
+        return self._ticks
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(frametime_ms={self.frametime_ms})"
+
+
+class ManualClock(AbstractClock):
+
+    def __init__(self, start_ticks=0):
+        self._ticks = start_ticks
+        self._time = 0
+
+    def advance(self, elapsed_ms):
+        if elapsed_ms < 0:
+            raise ValueError("Cannot advance a clock backwards")
+        self._ticks += elapsed_ms
+        self._time = elapsed_ms
+        return self._time
+
+    def tick(self, elapsed_ms=0):
+        return self.advance(elapsed_ms)
+
+    def set_ticks(self, ticks):
+        self._time = 0
+        self._ticks = ticks
+
+    def get_time(self):
+        return self._time
+
+    def get_ticks(self):
+        return self._ticks
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(ticks={self._ticks})"
+
+
+class ScaledClock(AbstractClock):
+
+    def __init__(self, source_clock, time_scale=1.0):
+        self.source_clock = source_clock
+        self.time_scale = time_scale
+        self._ticks = 0
+        self._time = 0
+
+    # the source clock must be ticked through this clock, so that changing
+    # time_scale only affects time from then on
+    def tick(self, *args):
+        self._time = self.source_clock.tick(*args) * self.time_scale
+        self._ticks += self._time
+        return self._time
+
+    def get_time(self):
+        return self._time
+
+    def get_ticks(self):
+        return self._ticks
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.source_clock!r}, time_scale={self.time_scale})"
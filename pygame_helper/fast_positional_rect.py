@@ -0,0 +1,275 @@
+import pygame
+from pygame.math import Vector2
+from pygame_helper.utilities import WHTuple
+
+
+class FastPositionalRect(object):
+
+    __slots__ = ("_x", "_y", "_width", "_height", "_rect")
+
+    def __init__(self, *args):
+        if len(args) == 4:
+            x, y, width, height = args
+        elif len(args) == 2:
+            (x, y), (width, height) = args[0][:2], args[1][:2]
+        elif len(args) == 1:
+            x, y, width, height = args[0].x, args[0].y, args[0].width, args[0].height
+        else:
+            raise TypeError("Must provide a pygame.Rect, (coords, geometry) or (x, y, width, height)")
+
+        self._x = float(x)
+        self._y = float(y)
+        self._width = int(width)
+        self._height = int(height)
+        self._rect = None
+
+
+    ### In-place Section: update several values with a single invalidation ###
+    def update(self, x, y, width, height):
+        self._x = float(x)
+        self._y = float(y)
+        self._width = int(width)
+        self._height = int(height)
+        self._rect = None
+
+    def move_ip(self, dx, dy):
+        # moves the unrounded position, unlike x += dx which starts from the rounded x
+        self._x += dx
+        self._y += dy
+        self._rect = None
+
+    def set_topleft(self, x, y):
+        self._x = float(x)
+        self._y = float(y)
+        self._rect = None
+
+    def set_center(self, x, y):
+        self._x = float(x - (self._width / 2))
+        self._y = float(y - (self._height / 2))
+        self._rect = None
+
+
+    # the same pygame.Rect is returned until a value is written, so it must
+    # not be modified by the caller
+    @property
+    def rect(self):
+        if self._rect is None:
+            self._rect = pygame.Rect(round(self._x), round(self._y), self._width, self._height)
+        return self._rect
+
+
+    @property
+    def width(self):
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        self._width = int(value)
+        self._rect = None
+
+    @property
+    def w(self):
+        return self._width
+
+    @w.setter
+    def w(self, value):
+        self._width = int(value)
+        self._rect = None
+
+    @property
+    def height(self):
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        self._height = int(value)
+        self._rect = None
+
+    @property
+    def h(self):
+        return self._height
+
+    @h.setter
+    def h(self, value):
+        self._height = int(value)
+        self._rect = None
+
+    @property
+    def size(self):
+        return WHTuple(self._width, self._height)
+
+    @size.setter
+    def size(self, value):
+        self._width = int(value[0])
+        self._height = int(value[1])
+        self._rect = None
+
+
+    @property
+    def x(self):
+        return round(self._x)
+
+    @x.setter
+    def x(self, value):
+        self._x = float(value)
+        self._rect = None
+
+    @property
+    def y(self):
+        return round(self._y)
+
+    @y.setter
+    def y(self, value):
+        self._y = float(value)
+        self._rect = None
+
+
+    @property
+    def top(self):
+        return round(self._y)
+
+    @top.setter
+    def top(self, value):
+        self._y = float(value)
+        self._rect = None
+
+    @property
+    def left(self):
+        return round(self._x)
+
+    @left.setter
+    def left(self, value):
+        self._x = float(value)
+        self._rect = None
+
+    @property
+    def bottom(self):
+        return round(self._y) + self._height
+
+    @bottom.setter
+    def bottom(self, value):
+        self._y = float(value - self._height)
+        self._rect = None
+
+    @property
+    def right(self):
+        return round(self._x) + self._width
+
+    @right.setter
+    def right(self, value):
+        self._x = float(value - self._width)
+        self._rect = None
+
+
+    @property
+    def centerx(self):
+        return round(self._x + (self._width / 2))
+
+    @centerx.setter
+    def centerx(self, value):
+        self._x = float(value - (self._width / 2))
+        self._rect = None
+
+    @property
+    def centery(self):
+        return round(self._y + (self._height / 2))
+
+    @centery.setter
+    def centery(self, value):
+        self._y = float(value - (self._height / 2))
+        self._rect = None
+
+    @property
+    def center(self):
+        return Vector2(self.centerx, self.centery)
+
+    @center.setter
+    def center(self, value):
+        self.set_center(value[0], value[1])
+
+
+    @property
+    def topleft(self):
+        return Vector2(self.left, self.top)
+
+    @topleft.setter
+    def topleft(self, value):
+        self.set_topleft(value[0], value[1])
+
+    @property
+    def bottomleft(self):
+        return Vector2(self.left, self.bottom)
+
+    @bottomleft.setter
+    def bottomleft(self, value):
+        self._x = float(value[0])
+        self._y = float(value[1] - self._height)
+        self._rect = None
+
+    @property
+    def topright(self):
+        return Vector2(self.right, self.top)
+
+    @topright.setter
+    def topright(self, value):
+        self._x = float(value[0] - self._width)
+        self._y = float(value[1])
+        self._rect = None
+
+    @property
+    def bottomright(self):
+        return Vector2(self.right, self.bottom)
+
+    @bottomright.setter
+    def bottomright(self, value):
+        self._x = float(value[0] - self._width)
+        self._y = float(value[1] - self._height)
+        self._rect = None
+
+
+    @property
+    def midtop(self):
+        return Vector2(self.centerx, self.top)
+
+    @midtop.setter
+    def midtop(self, value):
+        self._x = float(value[0] - (self._width / 2))
+        self._y = float(value[1])
+        self._rect = None
+
+    @property
+    def midleft(self):
+        return Vector2(self.left, self.centery)
+
+    @midleft.setter
+    def midleft(self, value):
+        self._x = float(value[0])
+        self._y = float(value[1] - (self._height / 2))
+        self._rect = None
+
+    @property
+    def midbottom(self):
+        return Vector2(self.centerx, self.bottom)
+
+    @midbottom.setter
+    def midbottom(self, value):
+        self._x = float(value[0] - (self._width / 2))
+        self._y = float(value[1] - self._height)
+        self._rect = None
+
+    @property
+    def midright(self):
+        return Vector2(self.right, self.centery)
+
+    @midright.setter
+    def midright(self, value):
+        self._x = float(value[0] - self._width)
+        self._y = float(value[1] - (self._height / 2))
+        self._rect = None
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(x={self.x}, y={self.y}, width={self.width}, height={self.height})"
+
+    def __str__(self):
+        return f"{self.__class__.__name__}(({self.x}, {self.y}), ({self.width}, {self.height}))"
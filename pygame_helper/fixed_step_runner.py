@@ -0,0 +1,79 @@
+class FixedStepRunner(object):
+
+    def __init__(self, game_mode, tick_rate=60, max_steps_per_frame=5, skip_render_when_behind=False, max_skipped_renders=3):
+        if tick_rate <= 0:
+            raise ValueError("Tick rate must be positive")
+        if max_steps_per_frame < 1:
+            raise ValueError("Must allow at least one step per frame")
+        if max_skipped_renders < 0:
+            raise ValueError("Cannot skip a negative number of renders")
+
+        self.game_mode = game_mode
+        self.tick_rate = tick_rate
+        self.fixed_timestep = 1 / tick_rate
+        self.max_steps_per_frame = max_steps_per_frame
+        self.skip_render_when_behind = skip_render_when_behind
+        self.max_skipped_renders = max_skipped_renders
+        self.skipped_renders = 0
+
+        self.accumulator = float(0)
+        self.interpolation_alpha = float(0)
+        self.total_steps = 0
+        self.steps_last_frame = 0
+
+    @property
+    def _elapsed_time(self):
+        try:
+            elapsed_time_ms = self.game_mode.game.clock.get_time()
+        except AttributeError:
+            elapsed_time_ms = self.game_mode.clock.get_time()
+        return elapsed_time_ms / 1000
+
+    def run_frame(self, window, elapsed_time=None):
+        if elapsed_time is None:
+            elapsed_time = self._elapsed_time
+
+        self.accumulator += elapsed_time
+        self._step_simulation()
+
+        is_behind = self.accumulator >= self.fixed_timestep
+        if is_behind:
+            # never carry more than one frame's worth of steps, otherwise a slow
+            # frame makes the next one slower still
+            self.accumulator = min(self.accumulator, self.max_steps_per_frame * self.fixed_timestep)
+            # updates which are always slow would otherwise never let a frame be rendered
+            if self.skip_render_when_behind and self.skipped_renders < self.max_skipped_renders:
+                self.skipped_renders += 1
+                return False
+
+        self.skipped_renders = 0
+
+        self.interpolation_alpha = min(self.accumulator / self.fixed_timestep, 1.0)
+        self.game_mode.interpolation_alpha = self.interpolation_alpha
+        self.game_mode.render(window)
+        return True
+
+    def _step_simulation(self):
+        self.steps_last_frame = 0
+        # only the steps run with the fixed frametime, e.g. menus updated outside the runner do not
+        previous_fixed_frametime = getattr(self.game_mode, "fixed_frametime", None)
+        self.game_mode.fixed_frametime = self.fixed_timestep
+        try:
+            while self.accumulator >= self.fixed_timestep and self.steps_last_frame < self.max_steps_per_frame:
+                self.game_mode.process_input()
+                self.game_mode.update_game_state()
+                self.accumulator -= self.fixed_timestep
+                self.steps_last_frame += 1
+                self.total_steps += 1
+        finally:
+            self.game_mode.fixed_frametime = previous_fixed_frametime
+
+    def reset(self):
+        self.accumulator = float(0)
+        self.interpolation_alpha = float(0)
+        self.total_steps = 0
+        self.steps_last_frame = 0
+        self.skipped_renders = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(tick_rate={self.tick_rate}, max_steps_per_frame={self.max_steps_per_frame})"
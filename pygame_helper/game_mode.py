@@ -7,6 +7,8 @@ class GameMode(ABC):
     def __init__(self, game):
         super().__init__()
         self.game = game
+        self.fixed_frametime = None
+        self.interpolation_alpha = 1.0
 
     @abstractmethod
     def process_input(self):
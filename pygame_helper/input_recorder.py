@@ -0,0 +1,130 @@
+import struct
+
+
+# header:    magic, version, number of keybinders, then every keybinder's option names
+# per frame: frametime, then for every keybinder its pressed options mask and pressed keys order
+MAGIC = b"PGHI"
+FORMAT_VERSION = 1
+_HEADER_FORMAT = "<4sBH"
+_FRAMETIME_FORMAT = "<d"
+_KEYBINDER_FRAME_FORMAT = "<QB"
+_KEY_FORMAT = "<i"
+# limits of the "<Q" options mask and the "<B" option, option name and pressed key counts
+MAX_OPTIONS_PER_KEYBINDER = 64
+MAX_COUNT = 255
+
+
+class InputRecorder(object):
+
+    def __init__(self, *keybinders):
+        for keybinder in keybinders:
+            self._raise_value_error_if_keybinder_unrecordable(keybinder)
+        self.keybinders = keybinders
+        self.num_frames = 0
+        self._frames = list()
+
+    @staticmethod
+    def _raise_value_error_if_keybinder_unrecordable(keybinder):
+        if len(keybinder) > MAX_OPTIONS_PER_KEYBINDER:
+            raise ValueError(f"A recorded keybinder can have at most {MAX_OPTIONS_PER_KEYBINDER} options, {keybinder!r} has {len(keybinder)}")
+        for option_name in keybinder:
+            if len(option_name.encode("utf-8")) > MAX_COUNT:
+                raise ValueError(f"Option name '{option_name}' is longer than {MAX_COUNT} bytes")
+
+    def record_frame(self, frametime):
+        # call once per frame, after update_game_state, so the pressed keys order
+        # already includes this frame's changes
+        frame = [struct.pack(_FRAMETIME_FORMAT, frametime)]
+        for keybinder in self.keybinders:
+            pressed_keys_order = keybinder.pressed_keys_order
+            # options may have been added since the recorder was created
+            if len(keybinder) > MAX_OPTIONS_PER_KEYBINDER:
+                self._raise_value_error_if_keybinder_unrecordable(keybinder)
+            if len(pressed_keys_order) > MAX_COUNT:
+                raise ValueError(f"Cannot record more than {MAX_COUNT} pressed keys for {keybinder!r}")
+            frame.append(struct.pack(_KEYBINDER_FRAME_FORMAT, keybinder.get_pressed_options_mask(), len(pressed_keys_order)))
+            frame.extend(struct.pack(_KEY_FORMAT, key) for key in pressed_keys_order)
+        self._frames.append(b"".join(frame))
+        self.num_frames += 1
+
+    def to_bytes(self):
+        header = [struct.pack(_HEADER_FORMAT, MAGIC, FORMAT_VERSION, len(self.keybinders))]
+        for keybinder in self.keybinders:
+            header.append(struct.pack("<B", len(keybinder)))
+            for option_name in keybinder:
+                encoded_option_name = option_name.encode("utf-8")
+                header.append(struct.pack("<B", len(encoded_option_name)) + encoded_option_name)
+        return b"".join(header + self._frames)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    def clear(self):
+        self.num_frames = 0
+        self._frames = list()
+
+
+class InputPlayback(object):
+
+    def __init__(self, recording, *keybinders, game_mode=None):
+        if isinstance(recording, (bytes, bytearray)):
+            self._data = bytes(recording)
+        else:
+            with open(recording, "rb") as f:
+                self._data = f.read()
+
+        self.keybinders = keybinders
+        self.game_mode = game_mode
+        self.frametime = None
+        self.frame_number = 0
+        self._offset = 0
+        self._read_header()
+
+    def _read_header(self):
+        magic, version, num_keybinders = struct.unpack_from(_HEADER_FORMAT, self._data, 0)
+        self._offset = struct.calcsize(_HEADER_FORMAT)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a recognised input recording")
+        if num_keybinders != len(self.keybinders):
+            raise ValueError(f"Recording has {num_keybinders} keybinders but {len(self.keybinders)} were given")
+
+        for keybinder in self.keybinders:
+            num_options, = struct.unpack_from("<B", self._data, self._offset)
+            self._offset += 1
+            option_names = list()
+            for _ in range(num_options):
+                length, = struct.unpack_from("<B", self._data, self._offset)
+                self._offset += 1
+                option_names.append(self._data[self._offset:self._offset + length].decode("utf-8"))
+                self._offset += length
+
+            if option_names != list(keybinder):
+                raise ValueError(f"Recording options {option_names} do not match {keybinder!r}")
+
+    def is_finished(self):
+        return self._offset >= len(self._data)
+
+    def apply_next_frame(self):
+        if self.is_finished():
+            return False
+
+        self.frametime, = struct.unpack_from(_FRAMETIME_FORMAT, self._data, self._offset)
+        self._offset += struct.calcsize(_FRAMETIME_FORMAT)
+        for keybinder in self.keybinders:
+            pressed_options_mask, num_keys = struct.unpack_from(_KEYBINDER_FRAME_FORMAT, self._data, self._offset)
+            self._offset += struct.calcsize(_KEYBINDER_FRAME_FORMAT)
+            pressed_keys_order = struct.unpack_from(f"<{num_keys}i", self._data, self._offset)
+            self._offset += num_keys * struct.calcsize(_KEY_FORMAT)
+            keybinder.set_input_snapshot(pressed_options_mask, pressed_keys_order)
+
+        if self.game_mode is not None:
+            self.game_mode.fixed_frametime = self.frametime
+        self.frame_number += 1
+        return True
+
+    def stop(self):
+        for keybinder in self.keybinders:
+            keybinder.clear_input_snapshot()
+        if self.game_mode is not None:
+            self.game_mode.fixed_frametime = None
@@ -3,17 +3,47 @@ import pygame
 
 class Keybinder(dict):
 
-    def __init__(self, *args):
+    def __init__(self, *args, keyboard_state=None):
         super().__init__()
         self.tracked_keys = set()
+        self.keyboard_state = keyboard_state
+        self.pressed_options = dict()
+        self.pressed_options_mask = 0
+        self._option_bits = dict()
+        self._pressed_options_version = None
+        self._tracked_options = set()
         self.pressed_keys_order = list()
+        self._pressed_keys_order_version = None
+        self._is_input_snapshot_active = False
 
         for arg in args:
             self.add_new_option(arg)
 
+    def set_keyboard_state(self, keyboard_state):
+        self.keyboard_state = keyboard_state
+        self._invalidate_pressed_options()
+        self._invalidate_pressed_keys_order()
+
+    # replaces live keyboard input, e.g. when replaying a recording, until
+    # clear_input_snapshot() is called
+    def set_input_snapshot(self, pressed_options_mask, pressed_keys_order):
+        self._is_input_snapshot_active = True
+        self.pressed_options_mask = pressed_options_mask
+        for option_name, option_bit in self._option_bits.items():
+            self.pressed_options[option_name] = bool(pressed_options_mask & option_bit)
+        self.pressed_keys_order[:] = pressed_keys_order
+
+    def clear_input_snapshot(self):
+        self._is_input_snapshot_active = False
+        self._invalidate_pressed_options()
+        self._invalidate_pressed_keys_order()
+
 
     def add_new_option(self, option_name):
         self[option_name] = {"keybinds": set(), "value": 0}
+        if option_name not in self._option_bits:
+            self._option_bits[option_name] = 1 << len(self._option_bits)
+        self._invalidate_pressed_options()
 
     def add_keybinds_and_value_to_multiple_options(self, *args):
         for arg in args:
@@ -35,6 +65,10 @@ class Keybinder(dict):
     def add_keybind_to_option(self, option_name, key):
         self._raise_key_error_if_option_name_invalid(option_name)
         self[option_name]["keybinds"].add(key)
+        if option_name in self._tracked_options and key not in self.tracked_keys:
+            self.tracked_keys.add(key)
+            self._invalidate_pressed_keys_order()
+        self._invalidate_pressed_options()
 
     def assign_value_to_option(self, option_name, value):
         self._raise_key_error_if_option_name_invalid(option_name)
@@ -45,9 +79,16 @@ class Keybinder(dict):
             self.track_keys_for_option(option_name)
 
     def track_keys_for_option(self, option_name):
+        # keybinds added later are tracked by add_keybind_to_option, so an
+        # option only has to be walked the first time it is tracked
+        if option_name in self._tracked_options:
+            return
+
         self._raise_key_error_if_option_name_invalid(option_name)
+        self._tracked_options.add(option_name)
         for key in self[option_name]["keybinds"]:
             self.tracked_keys.add(key)
+        self._invalidate_pressed_keys_order()
 
 
     def reset(self):
@@ -58,16 +99,21 @@ class Keybinder(dict):
         for option_name in self:
             self[option_name]["keybinds"] = set()
         self.tracked_keys = set()
+        self._tracked_options = set()
+        self._invalidate_pressed_options()
+        self._invalidate_pressed_keys_order()
 
     def remove_all_keybinds_from_option(self, option_name):
         self._raise_key_error_if_option_name_invalid(option_name)
         self.remove_tracked_keys_for_option(option_name)
         self[option_name]["keybinds"] = set()
+        self._invalidate_pressed_options()
 
     def remove_keybind_from_option(self, option_name, key):
         self._raise_key_error_if_option_name_invalid(option_name)
         self[option_name]["keybinds"].discard(key)
         self.remove_tracked_key(key)
+        self._invalidate_pressed_options()
 
     def reset_all_values(self):
         for option_name in self:
@@ -80,9 +126,21 @@ class Keybinder(dict):
 
     def remove_tracked_key(self, key):
         self.tracked_keys.discard(key)
+        # options still holding the key must be walked again when next tracked
+        for option_name in list(self._tracked_options):
+            if key in self[option_name]["keybinds"]:
+                self._tracked_options.discard(option_name)
+        self._invalidate_pressed_keys_order()
 
         
     def is_key_pressed_for_option(self, option_name):
+        if self.keyboard_state is not None or self._is_input_snapshot_active:
+            self._update_pressed_options()
+            try:
+                return self.pressed_options[option_name]
+            except KeyError:
+                raise KeyError(f"'{option_name}' is not in keybinder")
+
         self._raise_key_error_if_option_name_invalid(option_name)
         keys_pressed = pygame.key.get_pressed()
         for key in self[option_name]["keybinds"]:
@@ -90,28 +148,62 @@ class Keybinder(dict):
                 return True
         return False
 
+    def get_pressed_options_mask(self):
+        if self.keyboard_state is not None or self._is_input_snapshot_active:
+            self._update_pressed_options()
+        else:
+            self._set_pressed_options(pygame.key.get_pressed().__getitem__)
+        return self.pressed_options_mask
+
+    def _update_pressed_options(self):
+        # recomputed once per change of the keyboard state or keybinds,
+        # every query in between is a dictionary read
+        if self._is_input_snapshot_active:
+            return
+        if self._pressed_options_version != self.keyboard_state.version:
+            self._set_pressed_options(self.keyboard_state.is_key_pressed)
+            self._pressed_options_version = self.keyboard_state.version
+
+    def _set_pressed_options(self, is_key_pressed):
+        self.pressed_options_mask = 0
+        for option_name, option in self.items():
+            is_pressed = any(is_key_pressed(key) for key in option["keybinds"])
+            self.pressed_options[option_name] = is_pressed
+            if is_pressed:
+                self.pressed_options_mask |= self._option_bits[option_name]
+
+    def _invalidate_pressed_options(self):
+        self._pressed_options_version = None
+
     def is_key_most_recently_pressed_for_option(self, option_name):
         if len(self.pressed_keys_order) == 0:
             return False
 
         most_recently_pressed_key = self.pressed_keys_order[-1]
-        for key in self[option_name]["keybinds"]:
-            if key == most_recently_pressed_key:
-                return True
-        return False
+        return most_recently_pressed_key in self[option_name]["keybinds"]
 
     def update_pressed_keys_order(self):
-        pressed_keys = pygame.key.get_pressed()
-
+        if self._is_input_snapshot_active:
+            return
+        if self.keyboard_state is not None:
+            # edge triggered: nothing to do unless a key or the tracked keys changed
+            if self._pressed_keys_order_version == self.keyboard_state.version:
+                return
+            self._pressed_keys_order_version = self.keyboard_state.version
+            is_key_pressed = self.keyboard_state.is_key_pressed
+        else:
+            is_key_pressed = pygame.key.get_pressed().__getitem__
+
+        # the list only holds tracked keys which are held down, so scanning it stays cheap
         for key in self.tracked_keys:
-            if pressed_keys[key]:
+            if is_key_pressed(key):
                 if key not in self.pressed_keys_order:
                     self.pressed_keys_order.append(key)
-            else:
-                try:
-                    self.pressed_keys_order.remove(key)
-                except ValueError:
-                    pass
+            elif key in self.pressed_keys_order:
+                self.pressed_keys_order.remove(key)
+
+    def _invalidate_pressed_keys_order(self):
+        self._pressed_keys_order_version = None
 
     def get_value_for_option(self, option_name):
         self._raise_key_error_if_option_name_invalid(option_name)
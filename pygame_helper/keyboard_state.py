@@ -0,0 +1,49 @@
+import pygame
+
+
+class KeyboardState(object):
+
+    def __init__(self):
+        self.version = 0
+        self._pressed_keys = set()
+        self._snapshot = None
+        self._snapshot_values = None
+
+    def update(self):
+        snapshot = pygame.key.get_pressed()
+        snapshot_values = tuple(snapshot)
+        if snapshot_values != self._snapshot_values:
+            self._snapshot = snapshot
+            self._snapshot_values = snapshot_values
+            self.version += 1
+
+    def process_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key not in self._pressed_keys:
+            self._pressed_keys.add(event.key)
+            self.version += 1
+        elif event.type == pygame.KEYUP and event.key in self._pressed_keys:
+            self._pressed_keys.discard(event.key)
+            self.version += 1
+
+    def process_events(self, events):
+        for event in events:
+            self.process_event(event)
+
+    def set_pressed_keys(self, keys):
+        keys = set(keys)
+        if keys != self._pressed_keys or self._snapshot is not None:
+            self._pressed_keys = keys
+            self._snapshot = None
+            self._snapshot_values = None
+            self.version += 1
+
+    def reset(self):
+        self.set_pressed_keys(())
+
+    def is_key_pressed(self, key):
+        if key in self._pressed_keys:
+            return True
+        return self._snapshot is not None and bool(self._snapshot[key])
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(version={self.version})"
@@ -0,0 +1,109 @@
+from concurrent.futures import ProcessPoolExecutor
+from pygame_helper.utilities import WHTuple
+from pygame_helper.binary_tile_map import BinaryTileMap
+
+
+### autotile bits, one per neighbour with the same tile key ###
+AUTOTILE_NORTH = 1
+AUTOTILE_EAST = 2
+AUTOTILE_SOUTH = 4
+AUTOTILE_WEST = 8
+
+
+def get_autotile_index(tile_map, x, y):
+    tile = tile_map[y][x]
+    autotile_index = 0
+    if y > 0 and tile_map[y - 1][x] == tile:
+        autotile_index |= AUTOTILE_NORTH
+    if x < len(tile_map[y]) - 1 and tile_map[y][x + 1] == tile:
+        autotile_index |= AUTOTILE_EAST
+    if y < len(tile_map) - 1 and tile_map[y + 1][x] == tile:
+        autotile_index |= AUTOTILE_SOUTH
+    if x > 0 and tile_map[y][x - 1] == tile:
+        autotile_index |= AUTOTILE_WEST
+    return autotile_index
+
+
+# the chunk is read with a one tile border (where the map has one), so autotile indices
+# are the same as if the whole map had been described at once
+def _describe_chunk(tile_map, describe_tile, tile_keys, tile_x, tile_y, num_tiles_x, num_tiles_y):
+    bordered_chunk, (border_x, border_y) = _get_bordered_chunk(tile_map, tile_x, tile_y, num_tiles_x, num_tiles_y)
+    descriptors = list()
+    for y in range(border_y, border_y + num_tiles_y):
+        descriptor_row = list()
+        for x in range(border_x, border_x + num_tiles_x):
+            tile_key = bordered_chunk[y][x]
+            if tile_keys is not None and tile_key not in tile_keys:
+                descriptor_row.append(None)
+            else:
+                descriptor_row.append((tile_key, describe_tile(tile_key, get_autotile_index(bordered_chunk, x, y))))
+        descriptors.append(descriptor_row)
+    return descriptors
+
+
+def _get_bordered_chunk(tile_map, tile_x, tile_y, num_tiles_x, num_tiles_y):
+    first_x, first_y = max(tile_x - 1, 0), max(tile_y - 1, 0)
+    last_x = min(tile_x + num_tiles_x + 1, len(tile_map[0]))
+    last_y = min(tile_y + num_tiles_y + 1, len(tile_map))
+    if hasattr(tile_map, "get_chunk"):
+        bordered_chunk = tile_map.get_chunk(first_x, first_y, last_x - first_x, last_y - first_y)
+    else:
+        bordered_chunk = [list(row[first_x:last_x]) for row in tile_map[first_y:last_y]]
+    return bordered_chunk, (tile_x - first_x, tile_y - first_y)
+
+
+### Worker Section: every worker process is handed the map once, then only chunk positions ###
+_worker_state = dict()
+
+
+# a binary tile map arrives as its path, and each worker maps the file itself
+def _initialise_worker(tile_map, binary_map_path, describe_tile, tile_keys):
+    if binary_map_path is not None:
+        tile_map = BinaryTileMap(binary_map_path)
+    _worker_state["tile_map"] = tile_map
+    _worker_state["describe_tile"] = describe_tile
+    _worker_state["tile_keys"] = tile_keys
+
+
+def _describe_chunk_in_worker(tile_x, tile_y, num_tiles_x, num_tiles_y):
+    return _describe_chunk(
+        _worker_state["tile_map"], _worker_state["describe_tile"], _worker_state["tile_keys"],
+        tile_x, tile_y, num_tiles_x, num_tiles_y
+    )
+
+
+# describe_tile(tile_key, autotile_index) must be a module level (picklable) function returning
+# picklable data, e.g. a tuple of sprite class name, collision flags and image index; chunks are
+# yielded in map order as (tile_offset, rows of (tile_key, descriptor)) while later chunks are still
+# described. Tiles whose key is not in tile_keys (when given) are not described and are None
+def describe_tile_map_in_parallel(tile_map, describe_tile, chunk_geometry=(64, 64), max_workers=None, tile_keys=None):
+    chunk_geometry = WHTuple(*chunk_geometry)
+    num_tiles_x, num_tiles_y = len(tile_map[0]), len(tile_map)
+
+    chunk_areas = list()
+    for tile_y in range(0, num_tiles_y, chunk_geometry.height):
+        for tile_x in range(0, num_tiles_x, chunk_geometry.width):
+            chunk_areas.append((
+                tile_x, tile_y,
+                min(chunk_geometry.width, num_tiles_x - tile_x),
+                min(chunk_geometry.height, num_tiles_y - tile_y)
+            ))
+
+    if max_workers == 1 or len(chunk_areas) == 1:
+        for chunk_area in chunk_areas:
+            yield chunk_area[:2], _describe_chunk(tile_map, describe_tile, tile_keys, *chunk_area)
+        return
+
+    if isinstance(tile_map, BinaryTileMap):
+        tile_map, binary_map_path = None, tile_map.map_path
+    else:
+        binary_map_path = None
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialise_worker,
+        initargs=(tile_map, binary_map_path, describe_tile, tile_keys)
+    ) as executor:
+        described_chunks = executor.map(_describe_chunk_in_worker, *zip(*chunk_areas))
+        for chunk_area, descriptors in zip(chunk_areas, described_chunks):
+            yield chunk_area[:2], descriptors
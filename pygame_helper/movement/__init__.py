@@ -1,4 +1,7 @@
 from pygame_helper.movement.abstract_movement_component import AbstractMovementComponent
 from pygame_helper.movement.acceleration_movement_component import AccelerationMovementComponent
 from pygame_helper.movement.velocity_movement_component import VelocityMovementComponent
-from pygame_helper.movement.tile_movement_component import TileMovementComponent
\ No newline at end of file
+from pygame_helper.movement.tile_movement_component import TileMovementComponent
+from pygame_helper.movement.abstract_movement_system import AbstractMovementSystem
+from pygame_helper.movement.velocity_movement_system import VelocityMovementSystem
+from pygame_helper.movement.acceleration_movement_system import AccelerationMovementSystem
\ No newline at end of file
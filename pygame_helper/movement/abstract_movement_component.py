@@ -1,3 +1,5 @@
+import pygame
+from pygame_helper.spatial_hash_group import SpatialHashGroup
 from abc import ABC, abstractmethod
 
 
@@ -13,13 +15,21 @@ class AbstractMovementComponent(ABC):
     DIRECTION_AND_MAGNITUDE = "direction_and_magnitude"
 
     
-    def __init__(self, game_mode, parent_sprite, rect):
+    def __init__(self, game_mode, parent_sprite, rect, clock=None):
         self.game_mode = game_mode
         self.parent_sprite = parent_sprite
         self.rect = rect
+        self.clock = clock
 
     @property
     def frametime(self):
+        # an injected clock wins, then a fixed frametime (e.g. from a FixedStepRunner), then the game's clock
+        if self.clock is not None:
+            return self.clock.get_time() / 1000
+        fixed_frametime = getattr(self.game_mode, "fixed_frametime", None)
+        if fixed_frametime is not None:
+            return fixed_frametime
+
         try:
             frametime_ms = self.game_mode.game.clock.get_time()
         except AttributeError:
@@ -37,7 +47,7 @@ class AbstractMovementComponent(ABC):
     def move(self):
         pass
 
-    def move_with_collision(self, collide_fn_x, collide_fn_y, group, dokill=None, collide_callback=None):
+    def move_with_collision(self, collide_fn_x, collide_fn_y, group, dokill=None, collide_callback=None, continuous=False):
         raise NotImplementedError
 
 
@@ -45,6 +55,115 @@ class AbstractMovementComponent(ABC):
     def _process_movement_input(self):
         pass
 
+
+    def _spritecollide(self, group, dokill, collide_callback):
+        if isinstance(group, SpatialHashGroup):
+            query_rect = self._get_collision_query_rect(collide_callback)
+            if query_rect is not None:
+                return group.spritecollide(self.parent_sprite, dokill, collide_callback, query_rect)
+        return pygame.sprite.spritecollide(self.parent_sprite, group, dokill, collide_callback)
+
+    # only callbacks which never report sprites beyond the rects can be answered from the cells the
+    # rects overlap; any other (e.g. collide_circle) is tested against the whole group
+    def _get_collision_query_rect(self, collide_callback):
+        if collide_callback is None or collide_callback in self._get_rect_bounded_collide_callbacks() \
+                or (isinstance(collide_callback, pygame.sprite.collide_rect_ratio) and collide_callback.ratio <= 1):
+            return self.rect.union(self.position.rect)
+        return None
+
+    @staticmethod
+    def _get_rect_bounded_collide_callbacks():
+        return (
+            AbstractMovementComponent.collide_positional_rect,
+            AbstractMovementComponent.collide_positional_rect_if_possible,
+            pygame.sprite.collide_rect,
+            pygame.sprite.collide_mask
+        )
+
+
+    ### Swept Collision Section: earliest time of impact of the last move along one axis ###
+    # the sweep tests rects, so it only stands in for the component's own collide functions with a
+    # rect based collide callback, and reports the same sides; None means the discrete test is used
+    def _get_swept_sides(self, collide_fn, collide_callback):
+        if collide_callback not in (
+            None,
+            AbstractMovementComponent.collide_positional_rect,
+            AbstractMovementComponent.collide_positional_rect_if_possible,
+            pygame.sprite.collide_rect
+        ):
+            return None
+        return {
+            self.get_x_collision: ("left", "right"),
+            self.get_collision_left: ("left",),
+            self.get_collision_right: ("right",),
+            self.get_y_collision: ("top", "bottom"),
+            self.get_collision_top: ("top",),
+            self.get_collision_bottom: ("bottom",),
+        }.get(collide_fn)
+
+    def can_sweep_x(self, previous_rect):
+        displacement = self.position.rect.x - previous_rect.x
+        return displacement != 0 and abs(displacement) <= self.window_size.width / 2
+
+    def can_sweep_y(self, previous_rect):
+        displacement = self.position.rect.y - previous_rect.y
+        return displacement != 0 and abs(displacement) <= self.window_size.height / 2
+
+    def get_swept_x_collision(self, previous_rect, group, dokill=False, sides=("left", "right")):
+        current_rect = self.position.rect
+        displacement = current_rect.x - previous_rect.x
+        side = "right" if displacement > 0 else "left"
+        if side not in sides:
+            return None
+        if displacement > 0:
+            get_distance = lambda rect: rect.left - previous_rect.right
+        else:
+            get_distance = lambda rect: rect.right - previous_rect.left
+
+        sprite = self._get_earliest_swept_collision(previous_rect.union(current_rect), group, displacement, get_distance)
+        return self._swept_collision_result(sprite, dokill, side)
+
+    def get_swept_y_collision(self, previous_rect, group, dokill=False, sides=("top", "bottom")):
+        current_rect = self.position.rect
+        displacement = current_rect.y - previous_rect.y
+        side = "bottom" if displacement > 0 else "top"
+        if side not in sides:
+            return None
+        if displacement > 0:
+            get_distance = lambda rect: rect.top - previous_rect.bottom
+        else:
+            get_distance = lambda rect: rect.bottom - previous_rect.top
+
+        sprite = self._get_earliest_swept_collision(previous_rect.union(current_rect), group, displacement, get_distance)
+        return self._swept_collision_result(sprite, dokill, side)
+
+    def _get_earliest_swept_collision(self, swept_rect, group, displacement, get_distance):
+        if isinstance(group, SpatialHashGroup):
+            candidates = group.get_sprites_in_rect(swept_rect)
+        else:
+            candidates = group.sprites()
+
+        earliest_sprite = None
+        earliest_time_of_impact = None
+        for sprite in candidates:
+            if sprite is not self.parent_sprite and swept_rect.colliderect(sprite.rect):
+                # sprites behind the mover, or already overlapping where it started, are not in its way
+                time_of_impact = get_distance(sprite.rect) / displacement
+                if time_of_impact < 0:
+                    continue
+                if earliest_time_of_impact is None or time_of_impact < earliest_time_of_impact:
+                    earliest_sprite = sprite
+                    earliest_time_of_impact = time_of_impact
+        return earliest_sprite
+
+    @staticmethod
+    def _swept_collision_result(sprite, dokill, side):
+        if sprite is None:
+            return None
+        if dokill:
+            sprite.kill()
+        return {"sprite": sprite, "side": side}
+
     
     @staticmethod
     def collide_positional_rect(sprite_one, sprite_two):
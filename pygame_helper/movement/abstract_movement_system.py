@@ -0,0 +1,216 @@
+import numpy as np
+from abc import ABC, abstractmethod
+
+
+class AbstractMovementSystem(ABC):
+
+    # (name, number of columns, dtype) for every structure-of-arrays field
+    ARRAY_FIELDS = (
+        ("position", 2, np.float64),
+        ("size", 2, np.float64),
+        ("velocity", 2, np.float64),
+        ("window_size", 2, np.float64),
+        ("should_wrap_screen", 2, np.bool_),
+        ("synced_position", 2, np.float64),
+        ("synced_velocity", 2, np.float64),
+    )
+    # Vector2 fields the system changes itself, each with a "synced_" array holding the value
+    # last copied to or from the component
+    SYSTEM_OWNED_FIELDS = ("velocity",)
+
+    def __init__(self, game_mode, capacity=256, clock=None):
+        self.game_mode = game_mode
+        self.clock = clock
+        self.components = list()
+        self._component_indices = dict()
+        self._capacity = 0
+        self._allocate_arrays(max(int(capacity), 1))
+
+    def _allocate_arrays(self, capacity):
+        for name, columns, dtype in self.ARRAY_FIELDS:
+            new_array = np.zeros((capacity, columns), dtype=dtype)
+            if self._capacity > 0:
+                new_array[:self._capacity] = getattr(self, name)
+            setattr(self, name, new_array)
+        self._capacity = capacity
+
+    @property
+    def frametime(self):
+        # an injected clock wins, then a fixed frametime (e.g. from a FixedStepRunner), then the game's clock
+        if self.clock is not None:
+            return self.clock.get_time() / 1000
+        fixed_frametime = getattr(self.game_mode, "fixed_frametime", None)
+        if fixed_frametime is not None:
+            return fixed_frametime
+
+        try:
+            frametime_ms = self.game_mode.game.clock.get_time()
+        except AttributeError:
+            frametime_ms = self.game_mode.clock.get_time()
+        frametime_seconds = frametime_ms / 1000
+        return frametime_seconds
+
+    def __len__(self):
+        return len(self.components)
+
+    def __contains__(self, component):
+        return component in self._component_indices
+
+
+    ### Registration Section: components are copied in and out of the arrays ###
+    def add_component(self, component):
+        if component in self._component_indices:
+            return
+
+        index = len(self.components)
+        if index >= self._capacity:
+            self._allocate_arrays(self._capacity * 2)
+
+        self.components.append(component)
+        self._component_indices[component] = index
+        self._load_component_state(index, component)
+        self._mark_system_owned_fields_synced(index)
+
+    def add_multiple_components(self, *components):
+        for component in components:
+            self.add_component(component)
+
+    def remove_component(self, component):
+        index = self._component_indices.pop(component)
+        self._store_component_state(index, component)
+        self._mark_system_owned_fields_synced(index)
+
+        last_index = len(self.components) - 1
+        last_component = self.components.pop()
+        if index != last_index:
+            for name, _, _ in self.ARRAY_FIELDS:
+                array = getattr(self, name)
+                array[index] = array[last_index]
+            self.components[index] = last_component
+            self._component_indices[last_component] = index
+
+    def remove_all_components(self):
+        self.sync_components()
+        self.components = list()
+        self._component_indices = dict()
+
+    def sync_components(self):
+        for index, component in enumerate(self.components):
+            self._store_component_state(index, component)
+            self._mark_system_owned_fields_synced(index)
+
+    # the arrays are copied from the components when they are added, so anything changed on a
+    # component afterwards (e.g. its constant velocity delta, friction or a teleported position)
+    # is ignored by the system until it is synced back in. System owned fields, e.g. an
+    # integrated velocity, are only reloaded if the component's own value was changed
+    def sync_from_components(self):
+        for component in self.components:
+            self.sync_from_component(component)
+
+    def sync_from_component(self, component):
+        index = self._component_indices[component]
+        kept_values = dict()
+        for name in self.SYSTEM_OWNED_FIELDS:
+            component_value = getattr(component, name)
+            if tuple(getattr(self, "synced_" + name)[index]) == (component_value.x, component_value.y):
+                kept_values[name] = getattr(self, name)[index].copy()
+
+        self._load_component_state(index, component)
+        for name, value in kept_values.items():
+            getattr(self, name)[index] = value
+        self._mark_system_owned_fields_synced(index)
+
+    def _mark_system_owned_fields_synced(self, index):
+        for name in self.SYSTEM_OWNED_FIELDS:
+            getattr(self, "synced_" + name)[index] = getattr(self, name)[index]
+
+    def _load_component_state(self, index, component):
+        self.position[index] = (component.position._x, component.position._y)
+        self.synced_position[index] = self.position[index]
+        self.size[index] = (component.position.width, component.position.height)
+        self.velocity[index] = (component.velocity.x, component.velocity.y)
+        self.window_size[index] = component.window_size
+        self.should_wrap_screen[index] = component.should_wrap_screen
+
+    def _store_component_state(self, index, component):
+        component.position.x = self.position[index, 0]
+        component.position.y = self.position[index, 1]
+        self.synced_position[index] = self.position[index]
+        component.velocity.x = self.velocity[index, 0]
+        component.velocity.y = self.velocity[index, 1]
+        component.rect.centerx = component.position.centerx
+        component.rect.centery = component.position.centery
+
+
+    ### Movement Section: advances every registered component at once ###
+    @abstractmethod
+    def move(self):
+        pass
+
+    @abstractmethod
+    def move_with_collision(self, group):
+        pass
+
+    def wrap_around_screen(self, axis):
+        count = len(self.components)
+        position = self.position[:count, axis]
+        half_size = self.size[:count, axis] / 2
+        window_size = self.window_size[:count, axis]
+        should_wrap = self.should_wrap_screen[:count, axis]
+
+        center = np.round(position + half_size)
+        past_upper_edge = should_wrap & (center > window_size)
+        past_lower_edge = should_wrap & (center < 0) & ~past_upper_edge
+        position[past_upper_edge] = -half_size[past_upper_edge]
+        position[past_lower_edge] = window_size[past_lower_edge] - half_size[past_lower_edge]
+
+    def sync_rects(self):
+        # only components which moved since they were last synced are written back
+        count = len(self.components)
+        position = self.position[:count]
+        synced_position = self.synced_position[:count]
+        moved_indices = np.flatnonzero((position != synced_position).any(axis=1))
+        if len(moved_indices) == 0:
+            return
+
+        moved_positions = position[moved_indices]
+        synced_position[moved_indices] = moved_positions
+        centers = np.round(moved_positions + (self.size[moved_indices] / 2)).astype(np.int64).tolist()
+
+        components = self.components
+        for index, (x, y), center in zip(moved_indices.tolist(), moved_positions.tolist(), centers):
+            component = components[index]
+            component.position._x = x
+            component.position._y = y
+            component.rect.center = center
+
+
+    ### Collision Section: one vectorized AABB test against a group of static rects ###
+    @staticmethod
+    def get_group_rects(group):
+        rects = [(sprite.rect.x, sprite.rect.y, sprite.rect.width, sprite.rect.height) for sprite in group]
+        if not rects:
+            return np.zeros((0, 4), dtype=np.float64)
+        return np.array(rects, dtype=np.float64)
+
+    def get_first_collisions(self, group_rects):
+        # mirrors pygame.Rect.colliderect on PositionalRect.rect, returning the
+        # index of the first sprite collided (in group order) or -1
+        count = len(self.components)
+        if count == 0 or len(group_rects) == 0:
+            return np.full(count, -1, dtype=np.int64)
+
+        left = np.round(self.position[:count, 0])[:, np.newaxis]
+        top = np.round(self.position[:count, 1])[:, np.newaxis]
+        right = left + self.size[:count, 0][:, np.newaxis]
+        bottom = top + self.size[:count, 1][:, np.newaxis]
+
+        collided = (
+            (left < group_rects[:, 0] + group_rects[:, 2]) &
+            (right > group_rects[:, 0]) &
+            (top < group_rects[:, 1] + group_rects[:, 3]) &
+            (bottom > group_rects[:, 1])
+        )
+        first_collisions = np.argmax(collided, axis=1)
+        first_collisions[~collided.any(axis=1)] = -1
+        return first_collisions
@@ -13,13 +13,13 @@ class AccelerationMovementComponent(AbstractMovementComponent):
                 default_rotation=0, default_acceleration_delta=None, window_size=(800, 600),
                 should_wrap_screen=(True, True), bounce_velocity_ratios=(0, 0, 0, 0),
                 sides_to_jump=(False, False, True, False), movement_type="eight_way_movement",
-                direction_control="direction_and_magnitude", direction_control_y="direction_and_magnitude"):
+                direction_control="direction_and_magnitude", direction_control_y="direction_and_magnitude", clock=None):
 
-        super().__init__(game_mode, parent_sprite, rect)
+        super().__init__(game_mode, parent_sprite, rect, clock)
         self.rect.center = (default_position[0], default_position[1])
         self.window_size = WHTuple(*window_size)
 
-        self.position = PositionalRect(self.rect)
+        self.position = PositionalRect.from_rect(self.rect)
         self.velocity = Vector2()
         self.acceleration = Vector2()
         self.friction = Vector2(-abs(friction[0]), -abs(friction[1]))
@@ -53,30 +53,40 @@ class AccelerationMovementComponent(AbstractMovementComponent):
         self._set_new_physics_state_and_transform_x()
         self._set_new_physics_state_and_transform_y()
 
-    def move_with_collision(self, collide_fn_x, collide_fn_y, group, dokill=None, collide_callback=None):
+    def move_with_collision(self, collide_fn_x, collide_fn_y, group, dokill=None, collide_callback=None, continuous=False):
         self._reset_acceleration()
         self._process_movement_input()
-        self._move_x_with_collision(collide_fn_x, group, dokill, collide_callback)
-        self._move_y_with_collision(collide_fn_y, group, dokill, collide_callback)
+        self._move_x_with_collision(collide_fn_x, group, dokill, collide_callback, continuous)
+        self._move_y_with_collision(collide_fn_y, group, dokill, collide_callback, continuous)
 
-    def _move_x_with_collision(self, collide_fn, group, dokill=None, collide_callback=None):
+    def _move_x_with_collision(self, collide_fn, group, dokill=None, collide_callback=None, continuous=False):
+        previous_rect = self.position.rect
         self._set_new_physics_state_and_transform_x()
 
         sprite_collided = None
         if collide_fn is not None:
-            sprite_collided = collide_fn(group, dokill, collide_callback)
+            swept_sides = self._get_swept_sides(collide_fn, collide_callback) if continuous else None
+            if swept_sides is not None and self.can_sweep_x(previous_rect):
+                sprite_collided = self.get_swept_x_collision(previous_rect, group, dokill, swept_sides)
+            else:
+                sprite_collided = collide_fn(group, dokill, collide_callback)
 
         if sprite_collided is not None:
             self._move_x_back_if_collided(sprite_collided)
             self._apply_bounce_x(sprite_collided)
             self._apply_jump_x(sprite_collided)
 
-    def _move_y_with_collision(self, collide_fn, group, dokill=None, collide_callback=None):
+    def _move_y_with_collision(self, collide_fn, group, dokill=None, collide_callback=None, continuous=False):
+        previous_rect = self.position.rect
         self._set_new_physics_state_and_transform_y()
 
         sprite_collided = None
         if collide_fn is not None:
-            sprite_collided = collide_fn(group, dokill, collide_callback)
+            swept_sides = self._get_swept_sides(collide_fn, collide_callback) if continuous else None
+            if swept_sides is not None and self.can_sweep_y(previous_rect):
+                sprite_collided = self.get_swept_y_collision(previous_rect, group, dokill, swept_sides)
+            else:
+                sprite_collided = collide_fn(group, dokill, collide_callback)
 
         if sprite_collided is not None:
             self._move_y_back_if_collided(sprite_collided)
@@ -305,7 +315,7 @@ class AccelerationMovementComponent(AbstractMovementComponent):
             collide_callback = AbstractMovementComponent.collide_positional_rect
 
         if self.velocity.x > 0 or (self.velocity.x == 0 and self.acceleration.x > 0):
-            sprites_collided = pygame.sprite.spritecollide(self.parent_sprite, group, dokill, collide_callback)
+            sprites_collided = self._spritecollide(group, dokill, collide_callback)
             if sprites_collided:
                 return {"sprite": sprites_collided[0], "side": "right"}
         return None
@@ -315,7 +325,7 @@ class AccelerationMovementComponent(AbstractMovementComponent):
             collide_callback = AbstractMovementComponent.collide_positional_rect
 
         if self.velocity.x < 0 or (self.velocity.x == 0 and self.acceleration.x < 0):
-            sprites_collided = pygame.sprite.spritecollide(self.parent_sprite, group, dokill, collide_callback)
+            sprites_collided = self._spritecollide(group, dokill, collide_callback)
             if sprites_collided:
                 return {"sprite": sprites_collided[0], "side": "left"}
         return None
@@ -332,7 +342,7 @@ class AccelerationMovementComponent(AbstractMovementComponent):
             collide_callback = AbstractMovementComponent.collide_positional_rect
 
         if self.velocity.y > 0 or (self.velocity.y == 0 and self.acceleration.y > 0):
-            sprites_collided = pygame.sprite.spritecollide(self.parent_sprite, group, dokill, collide_callback)
+            sprites_collided = self._spritecollide(group, dokill, collide_callback)
             if sprites_collided:
                 return {"sprite": sprites_collided[0], "side": "bottom"}
         return None
@@ -342,7 +352,7 @@ class AccelerationMovementComponent(AbstractMovementComponent):
             collide_callback = AbstractMovementComponent.collide_positional_rect
 
         if self.velocity.y < 0 or (self.velocity.y == 0 and self.acceleration.y < 0):
-            sprites_collided = pygame.sprite.spritecollide(self.parent_sprite, group, dokill, collide_callback)
+            sprites_collided = self._spritecollide(group, dokill, collide_callback)
             if sprites_collided:
                 return {"sprite": sprites_collided[0], "side": "top"}
         return None
\ No newline at end of file
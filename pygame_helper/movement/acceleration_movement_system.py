@@ -0,0 +1,106 @@
+import numpy as np
+from pygame_helper.movement.abstract_movement_system import AbstractMovementSystem
+
+
+class AccelerationMovementSystem(AbstractMovementSystem):
+
+    ARRAY_FIELDS = AbstractMovementSystem.ARRAY_FIELDS + (
+        ("acceleration", 2, np.float64),
+        ("friction", 2, np.float64),
+        ("constant_acceleration_delta", 2, np.float64),
+        ("bounce_velocity_ratios", 4, np.float64),
+        ("sides_to_jump", 4, np.bool_),
+    )
+
+    def _load_component_state(self, index, component):
+        super()._load_component_state(index, component)
+        self.acceleration[index] = (component.acceleration.x, component.acceleration.y)
+        self.friction[index] = (component.friction.x, component.friction.y)
+        self.constant_acceleration_delta[index] = (
+            component.constant_acceleration_delta.x,
+            component.constant_acceleration_delta.y
+        )
+        self.bounce_velocity_ratios[index] = component.bounce_velocity_ratios
+        self.sides_to_jump[index] = component.sides_to_jump
+
+    def _store_component_state(self, index, component):
+        super()._store_component_state(index, component)
+        component.acceleration.x = self.acceleration[index, 0]
+        component.acceleration.y = self.acceleration[index, 1]
+        component.constant_acceleration_delta.x = self.constant_acceleration_delta[index, 0]
+        component.constant_acceleration_delta.y = self.constant_acceleration_delta[index, 1]
+
+
+    ### Movement Section: Sets physics states & transforms for every component ###
+    def move(self):
+        self._reset_acceleration()
+        frametime = self.frametime
+        self._set_new_physics_state(0, frametime)
+        self._set_new_physics_state(1, frametime)
+        self.sync_rects()
+
+    def move_with_collision(self, group):
+        group_rects = self.get_group_rects(group)
+        self._reset_acceleration()
+        frametime = self.frametime
+
+        self._set_new_physics_state(0, frametime)
+        first_collisions = self.get_first_collisions(group_rects)
+        self._resolve_collisions(0, first_collisions, group_rects)
+
+        self._set_new_physics_state(1, frametime)
+        first_collisions = self.get_first_collisions(group_rects)
+        self._resolve_collisions(1, first_collisions, group_rects)
+
+        self.sync_rects()
+
+    def _reset_acceleration(self):
+        count = len(self.components)
+        self.acceleration[:count] = self.constant_acceleration_delta[:count]
+
+    def _set_new_physics_state(self, axis, frametime):
+        count = len(self.components)
+        position = self.position[:count, axis]
+        velocity = self.velocity[:count, axis]
+        acceleration = self.acceleration[:count, axis]
+
+        acceleration += velocity * self.friction[:count, axis]
+        velocity += acceleration * frametime
+        # PositionalRect.x/y read back rounded, so every step starts from the
+        # rounded position exactly like position.x += ... does per component
+        position[:] = np.round(position) + (velocity * frametime) + (0.5 * acceleration * frametime**2)
+        self.wrap_around_screen(axis)
+
+    def _resolve_collisions(self, axis, first_collisions, group_rects):
+        if len(group_rects) == 0:
+            return
+
+        # NESW column indices of the sides hit when moving forwards/backwards on this axis
+        forward_side, backward_side = (1, 3) if axis == 0 else (2, 0)
+
+        count = len(self.components)
+        collided = first_collisions >= 0
+        walls = group_rects[first_collisions]
+        velocity = self.velocity[:count, axis]
+        acceleration = self.acceleration[:count, axis]
+
+        # sides are decided the same way as get_collision_right/left/bottom/top
+        collided_forwards = collided & ((velocity > 0) | ((velocity == 0) & (acceleration > 0)))
+        collided_backwards = collided & ((velocity < 0) | ((velocity == 0) & (acceleration < 0)))
+
+        position = self.position[:count, axis]
+        position[collided_forwards] = walls[collided_forwards, axis] - self.size[:count, axis][collided_forwards]
+        position[collided_backwards] = walls[collided_backwards, axis] + walls[collided_backwards, axis + 2]
+
+        velocity[collided_forwards] *= self.bounce_velocity_ratios[:count, forward_side][collided_forwards]
+        velocity[collided_backwards] *= self.bounce_velocity_ratios[:count, backward_side][collided_backwards]
+
+        self._apply_jump(axis, collided_forwards & self.sides_to_jump[:count, forward_side], -1)
+        self._apply_jump(axis, collided_backwards & self.sides_to_jump[:count, backward_side], 1)
+
+    def _apply_jump(self, axis, can_jump, direction):
+        # only bodies touching a jumpable side need their keybinder queried
+        for index in np.flatnonzero(can_jump).tolist():
+            keybinder = self.components[index].keybinder
+            if keybinder.is_key_pressed_for_option("jump"):
+                self.velocity[index, axis] = direction * abs(keybinder.get_value_for_option("jump"))
@@ -1,4 +1,3 @@
-import pygame
 from pygame.math import Vector2
 from pygame_helper.rotator2 import Rotator2
 from pygame_helper.positional_rect import PositionalRect
@@ -19,13 +18,13 @@ class TileMovementComponent(AbstractMovementComponent):
                 window_size=(800, 600), should_wrap_screen=(True, True),
                 should_bounce=(False, False, False, False),
                 movement_type="eight_way_movement", direction_control="direction_and_magnitude",
-                direction_control_y="direction_and_magnitude"):
+                direction_control_y="direction_and_magnitude", clock=None):
 
-        super().__init__(game_mode, parent_sprite, rect)
+        super().__init__(game_mode, parent_sprite, rect, clock)
         self.window_size = WHTuple(*window_size)
         self.tile_geometry = WHTuple(*tile_geometry)
 
-        self.position = PositionalRect(self.rect)
+        self.position = PositionalRect.from_rect(self.rect)
         self.tile_position = default_position
         self.velocity = Vector2()
         self.constant_velocity_delta = Vector2()
@@ -287,6 +286,13 @@ class TileMovementComponent(AbstractMovementComponent):
 
 
     ### Collision Section: Only DETECTS collision, no movement occurs ###
+    def _get_collision_query_rect(self, collide_callback):
+        # self.rect has already been shifted onto the neighbouring tile, so on a
+        # tile-sized grid this is a lookup of a single cell
+        if collide_callback is None:
+            return self.rect
+        return super()._get_collision_query_rect(collide_callback)
+
     def get_x_collision(self, group, dokill=False, collide_callback=None):
         sprite_collided = self.get_collision_right(group, dokill, collide_callback)
         if sprite_collided is not None:
@@ -297,7 +303,7 @@ class TileMovementComponent(AbstractMovementComponent):
     def get_collision_right(self, group, dokill=False, collide_callback=None):
         if self.velocity.x > 0:
             self.rect.x += self.tile_geometry.width
-            sprites_collided = pygame.sprite.spritecollide(self.parent_sprite, group, dokill, collide_callback)
+            sprites_collided = self._spritecollide(group, dokill, collide_callback)
             self.rect.x -= self.tile_geometry.width
             if sprites_collided:
                 return {"sprite": sprites_collided[0], "side": "right"}
@@ -306,7 +312,7 @@ class TileMovementComponent(AbstractMovementComponent):
     def get_collision_left(self, group, dokill=False, collide_callback=None):
         if self.velocity.x < 0:
             self.rect.x -= self.tile_geometry.width
-            sprites_collided = pygame.sprite.spritecollide(self.parent_sprite, group, dokill, collide_callback)
+            sprites_collided = self._spritecollide(group, dokill, collide_callback)
             self.rect.x += self.tile_geometry.width
             if sprites_collided:
                 return {"sprite": sprites_collided[0], "side": "left"}
@@ -322,7 +328,7 @@ class TileMovementComponent(AbstractMovementComponent):
     def get_collision_bottom(self, group, dokill=False, collide_callback=None):
         if self.velocity.y > 0:
             self.rect.y += self.tile_geometry.height
-            sprites_collided = pygame.sprite.spritecollide(self.parent_sprite, group, dokill, collide_callback)
+            sprites_collided = self._spritecollide(group, dokill, collide_callback)
             self.rect.y -= self.tile_geometry.height
             if sprites_collided:
                 return {"sprite": sprites_collided[0], "side": "bottom"}
@@ -331,7 +337,7 @@ class TileMovementComponent(AbstractMovementComponent):
     def get_collision_top(self, group, dokill=False, collide_callback=None):
         if self.velocity.y < 0:
             self.rect.y -= self.tile_geometry.height
-            sprites_collided = pygame.sprite.spritecollide(self.parent_sprite, group, dokill, collide_callback)
+            sprites_collided = self._spritecollide(group, dokill, collide_callback)
             self.rect.y += self.tile_geometry.height
             if sprites_collided:
                 return {"sprite": sprites_collided[0], "side": "top"}
@@ -0,0 +1,103 @@
+import numpy as np
+from pygame_helper.movement.abstract_movement_system import AbstractMovementSystem
+
+
+class VelocityMovementSystem(AbstractMovementSystem):
+
+    ARRAY_FIELDS = AbstractMovementSystem.ARRAY_FIELDS + (
+        ("constant_velocity_delta", 2, np.float64),
+        ("should_bounce", 4, np.bool_),
+        ("synced_constant_velocity_delta", 2, np.float64),
+    )
+    SYSTEM_OWNED_FIELDS = AbstractMovementSystem.SYSTEM_OWNED_FIELDS + ("constant_velocity_delta",)
+
+    def _load_component_state(self, index, component):
+        super()._load_component_state(index, component)
+        self.constant_velocity_delta[index] = (component.constant_velocity_delta.x, component.constant_velocity_delta.y)
+        self.should_bounce[index] = component.should_bounce
+
+    def _store_component_state(self, index, component):
+        super()._store_component_state(index, component)
+        component.constant_velocity_delta.x = self.constant_velocity_delta[index, 0]
+        component.constant_velocity_delta.y = self.constant_velocity_delta[index, 1]
+
+
+    ### Movement Section: Sets physics states & transforms for every component ###
+    def move(self):
+        self._reset_velocity()
+        frametime = self.frametime
+        self._set_new_physics_state_x(frametime)
+        self._set_new_physics_state_y(frametime)
+        self.sync_rects()
+
+    def move_with_collision(self, group):
+        group_rects = self.get_group_rects(group)
+        self._reset_velocity()
+        frametime = self.frametime
+
+        self._set_new_physics_state_x(frametime)
+        first_collisions = self.get_first_collisions(group_rects)
+        self._move_x_back_if_collided_and_bounce(first_collisions, group_rects)
+
+        self._set_new_physics_state_y(frametime)
+        first_collisions = self.get_first_collisions(group_rects)
+        self._move_y_back_if_collided_and_bounce(first_collisions, group_rects)
+
+        self.sync_rects()
+
+    def _reset_velocity(self):
+        count = len(self.components)
+        self.velocity[:count] = self.constant_velocity_delta[:count]
+
+    # PositionalRect.x/y read back rounded, so every step starts from the
+    # rounded position exactly like position.x += ... does per component
+    def _set_new_physics_state_x(self, frametime):
+        count = len(self.components)
+        position = self.position[:count, 0]
+        position[:] = np.round(position) + (self.velocity[:count, 0] * frametime)
+        self.wrap_around_screen(0)
+
+    def _set_new_physics_state_y(self, frametime):
+        count = len(self.components)
+        position = self.position[:count, 1]
+        position[:] = np.round(position) + (self.velocity[:count, 1] * frametime)
+        self.wrap_around_screen(1)
+
+    def _move_x_back_if_collided_and_bounce(self, first_collisions, group_rects):
+        if len(group_rects) == 0:
+            return
+
+        count = len(self.components)
+        collided = first_collisions >= 0
+        walls = group_rects[first_collisions]
+
+        # sides are decided the same way as get_collision_right/left
+        collided_right = collided & (self.velocity[:count, 0] > 0)
+        collided_left = collided & (self.velocity[:count, 0] < 0)
+
+        position_x = self.position[:count, 0]
+        position_x[collided_right] = walls[collided_right, 0] - self.size[:count, 0][collided_right]
+        position_x[collided_left] = walls[collided_left, 0] + walls[collided_left, 2]
+
+        bounce_east = collided_right & self.should_bounce[:count, 1]
+        bounce_west = collided_left & self.should_bounce[:count, 3]
+        self.constant_velocity_delta[:count, 0][bounce_east | bounce_west] *= -1
+
+    def _move_y_back_if_collided_and_bounce(self, first_collisions, group_rects):
+        if len(group_rects) == 0:
+            return
+
+        count = len(self.components)
+        collided = first_collisions >= 0
+        walls = group_rects[first_collisions]
+
+        collided_bottom = collided & (self.velocity[:count, 1] > 0)
+        collided_top = collided & (self.velocity[:count, 1] < 0)
+
+        position_y = self.position[:count, 1]
+        position_y[collided_bottom] = walls[collided_bottom, 1] - self.size[:count, 1][collided_bottom]
+        position_y[collided_top] = walls[collided_top, 1] + walls[collided_top, 3]
+
+        bounce_north = collided_top & self.should_bounce[:count, 0]
+        bounce_south = collided_bottom & self.should_bounce[:count, 2]
+        self.constant_velocity_delta[:count, 1][bounce_north | bounce_south] *= -1
@@ -27,6 +27,24 @@ class PositionalRect(object):
         self._width = int(rect.width)
         self._height = int(rect.height)
 
+    # construction paths which bypass multipledispatch
+    @classmethod
+    def from_x_y_width_height(cls, x, y, width, height):
+        positional_rect = cls.__new__(cls)
+        positional_rect._x = float(x)
+        positional_rect._y = float(y)
+        positional_rect._width = int(width)
+        positional_rect._height = int(height)
+        return positional_rect
+
+    @classmethod
+    def from_coords_and_geometry(cls, coords, geometry):
+        return cls.from_x_y_width_height(coords[0], coords[1], geometry[0], geometry[1])
+
+    @classmethod
+    def from_rect(cls, rect):
+        return cls.from_x_y_width_height(rect.x, rect.y, rect.width, rect.height)
+
     
     @property
     def rect(self):
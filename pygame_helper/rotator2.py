@@ -11,6 +11,10 @@ class Rotator2(object):
     UP = 90
     DOWN = -90
 
+    # (cos, sin) of the last rotator get_vector() was called with
+    _cached_vector_rotator = None
+    _cached_vector = None
+
     @dispatch()
     def __init__(self):
         self.set_rotator()
@@ -55,37 +59,64 @@ class Rotator2(object):
 
     @dispatch(Vector2)
     def set_rotator(self, vector):
-        if vector.x == 0 and vector.y == 0:
+        self.set_rotator(self._get_angle_of_vector(vector))
+
+    # bypass multipledispatch and the validation in __setattr__, so the value
+    # given must already be a number
+    @classmethod
+    def from_degrees(cls, number):
+        rotator = cls.__new__(cls)
+        object.__setattr__(rotator, "rotator", float(cls._set_rotator_between_minus_180_and_180(number)))
+        return rotator
+
+    @classmethod
+    def from_vector(cls, vector):
+        return cls.from_degrees(cls._get_angle_of_vector(vector))
+
+    @classmethod
+    def from_rotator(cls, rotator):
+        return cls.from_degrees(rotator.rotator)
+
+    @staticmethod
+    def _get_angle_of_vector(vector):
+        if vector[0] == 0 and vector[1] == 0:
             raise ValueError("Could not create Rotator - magnitude of vector cannot be 0")
 
         positive_x_axis_vector = Vector2(1, 0)
+        vector = Vector2(vector)
         dot_product_value = positive_x_axis_vector.dot(vector)
         cos_of_angle_between_vectors = dot_product_value / (vector.magnitude() * positive_x_axis_vector.magnitude())
         angle_between_vectors_in_radians = math.acos(cos_of_angle_between_vectors)
         angle_between_vectors_in_degrees = math.degrees(angle_between_vectors_in_radians)
         if vector.y < 0:
             angle_between_vectors_in_degrees *= -1
-        self.set_rotator(angle_between_vectors_in_degrees)
+        return angle_between_vectors_in_degrees
 
-    def _set_rotator_between_minus_180_and_180(self, rotator_value):
+    @staticmethod
+    def _set_rotator_between_minus_180_and_180(rotator_value):
         FULL_CIRCLE_DEGREES = 360
-        LOWER_BOUNDARY = -180
         UPPER_BOUNDARY = 180
 
+        # % already lands in [0, 360), so at most one shift is ever needed
         rotator_value %= FULL_CIRCLE_DEGREES
-        while rotator_value <= LOWER_BOUNDARY:
-            rotator_value += FULL_CIRCLE_DEGREES
-        while rotator_value > UPPER_BOUNDARY:
+        if rotator_value > UPPER_BOUNDARY:
             rotator_value -= FULL_CIRCLE_DEGREES
 
         return rotator_value
 
-    def get_vector(self):
-        rotator_in_radians = math.radians(self.rotator)
-        return Vector2(
-            round(math.cos(rotator_in_radians), 10),
-            round(math.sin(rotator_in_radians), 10)
-        )
+    # a Rotator2LookupTable trades precision for speed on this call only
+    def get_vector(self, lookup_table=None):
+        if lookup_table is not None:
+            return lookup_table.get_vector(self)
+
+        if self._cached_vector_rotator != self.rotator:
+            rotator_in_radians = math.radians(self.rotator)
+            object.__setattr__(self, "_cached_vector", (
+                round(math.cos(rotator_in_radians), 10),
+                round(math.sin(rotator_in_radians), 10)
+            ))
+            object.__setattr__(self, "_cached_vector_rotator", self.rotator)
+        return Vector2(self._cached_vector)
 
     def __repr__(self):
         return f"Rotator2({self.rotator})"
@@ -94,6 +125,10 @@ class Rotator2(object):
         return f"{self.rotator}°"
 
     def __setattr__(self, name, number):
+        if type(number) is float and -180 < number <= 180:
+            super().__setattr__(name, number)
+            return
+
         if not isinstance(number, (int, float)):
             raise TypeError("Must provide a number")
 
@@ -109,7 +144,7 @@ class Rotator2(object):
 
         rotator_value = self.rotator + rotator.rotator
         rotator_value = self._set_rotator_between_minus_180_and_180(rotator_value)
-        return Rotator2(rotator_value)
+        return Rotator2.from_degrees(rotator_value)
 
     def __sub__(self, rotator):
         if not isinstance(rotator, Rotator2):
@@ -117,7 +152,7 @@ class Rotator2(object):
 
         rotator_value = self.rotator - rotator.rotator
         rotator_value = self._set_rotator_between_minus_180_and_180(rotator_value)
-        return Rotator2(rotator_value)
+        return Rotator2.from_degrees(rotator_value)
 
     def __mul__(self, number):
         if not isinstance(number, (int, float)):
@@ -125,7 +160,7 @@ class Rotator2(object):
 
         rotator_value = self.rotator * number
         rotator_value = self._set_rotator_between_minus_180_and_180(rotator_value)
-        return Rotator2(rotator_value)
+        return Rotator2.from_degrees(rotator_value)
 
     def __truediv__(self, number):
         if not isinstance(number, (int, float)):
@@ -133,7 +168,7 @@ class Rotator2(object):
 
         rotator_value = self.rotator / number
         rotator_value = self._set_rotator_between_minus_180_and_180(rotator_value)
-        return Rotator2(rotator_value)
+        return Rotator2.from_degrees(rotator_value)
 
     def __floordiv__(self, number):
         if not isinstance(number, (int, float)):
@@ -141,7 +176,7 @@ class Rotator2(object):
 
         rotator_value = self.rotator // number
         rotator_value = self._set_rotator_between_minus_180_and_180(rotator_value)
-        return Rotator2(rotator_value)
+        return Rotator2.from_degrees(rotator_value)
 
     def __mod__(self, number):
         if not isinstance(number, (int, float)):
@@ -149,7 +184,7 @@ class Rotator2(object):
 
         rotator_value = self.rotator % number
         rotator_value = self._set_rotator_between_minus_180_and_180(rotator_value)
-        return Rotator2(rotator_value)
+        return Rotator2.from_degrees(rotator_value)
 
     def __iadd__(self, rotator):
         if not isinstance(rotator, Rotator2):
@@ -237,8 +272,36 @@ class Rotator2(object):
 
     def __neg__(self):
         rotator_value = self._set_rotator_between_minus_180_and_180(-self.rotator)
-        return Rotator2(rotator_value)
+        return Rotator2.from_degrees(rotator_value)
 
     def __abs__(self):
         rotator_value = self._set_rotator_between_minus_180_and_180(abs(self.rotator))
-        return Rotator2(rotator_value)
\ No newline at end of file
+        return Rotator2.from_degrees(rotator_value)
+
+
+class Rotator2LookupTable(object):
+
+    # quantised unit vectors, e.g. the largest error at a resolution of 0.1 degrees is about 9e-4
+    def __init__(self, resolution=0.1):
+        if not 0 < resolution <= 360:
+            raise ValueError("Resolution must lie between 0 and 360 degrees")
+
+        num_entries = round(360 / resolution)
+        self.resolution = 360 / num_entries
+        self._unit_vectors = list()
+        for index in range(num_entries):
+            rotator_in_radians = math.radians(index * self.resolution)
+            self._unit_vectors.append((
+                round(math.cos(rotator_in_radians), 10),
+                round(math.sin(rotator_in_radians), 10)
+            ))
+
+    def get_vector(self, rotator):
+        index = round(rotator.rotator / self.resolution) % len(self._unit_vectors)
+        return Vector2(self._unit_vectors[index])
+
+    def __len__(self):
+        return len(self._unit_vectors)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(resolution={self.resolution})"
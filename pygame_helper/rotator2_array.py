@@ -0,0 +1,115 @@
+import numbers
+import numpy as np
+from pygame_helper.rotator2 import Rotator2
+
+
+class Rotator2Array(object):
+
+    def __init__(self, rotators=()):
+        if isinstance(rotators, Rotator2Array):
+            rotators = rotators.rotators
+        else:
+            rotators = [rotator.rotator if isinstance(rotator, Rotator2) else rotator for rotator in rotators]
+        self.rotators = self._set_rotators_between_minus_180_and_180(np.array(rotators, dtype=np.float64))
+
+    @classmethod
+    def from_degrees(cls, degrees):
+        rotator_array = cls.__new__(cls)
+        rotator_array.rotators = cls._set_rotators_between_minus_180_and_180(np.array(degrees, dtype=np.float64))
+        return rotator_array
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        vectors = np.asarray(vectors, dtype=np.float64).reshape(-1, 2)
+        if np.any((vectors[:, 0] == 0) & (vectors[:, 1] == 0)):
+            raise ValueError("Could not create Rotator - magnitude of vector cannot be 0")
+        return cls.from_degrees(np.degrees(np.arctan2(vectors[:, 1], vectors[:, 0])))
+
+    @staticmethod
+    def _set_rotators_between_minus_180_and_180(rotator_values):
+        FULL_CIRCLE_DEGREES = 360
+        UPPER_BOUNDARY = 180
+
+        rotator_values = np.mod(rotator_values, FULL_CIRCLE_DEGREES)
+        return np.where(rotator_values > UPPER_BOUNDARY, rotator_values - FULL_CIRCLE_DEGREES, rotator_values)
+
+    def get_vector(self):
+        rotators_in_radians = np.radians(self.rotators)
+        return np.round(np.stack((np.cos(rotators_in_radians), np.sin(rotators_in_radians)), axis=-1), 10)
+
+    def to_rotators(self):
+        return [Rotator2.from_degrees(rotator_value) for rotator_value in self.rotators.tolist()]
+
+    def _get_other_rotator_values(self, rotator):
+        if isinstance(rotator, Rotator2Array):
+            return rotator.rotators
+        if isinstance(rotator, Rotator2):
+            return rotator.rotator
+        raise TypeError("Must provide another rotator or rotator array")
+
+    @staticmethod
+    def _get_numbers(number):
+        if isinstance(number, numbers.Real):
+            return number
+        if isinstance(number, np.ndarray) and np.issubdtype(number.dtype, np.number):
+            return number
+        raise TypeError("Must provide a number or an array of numbers")
+
+
+    def __len__(self):
+        return len(self.rotators)
+
+    def __iter__(self):
+        return iter(self.to_rotators())
+
+    def __getitem__(self, index):
+        rotator_values = self.rotators[index]
+        if isinstance(rotator_values, np.ndarray):
+            return Rotator2Array.from_degrees(rotator_values)
+        return Rotator2.from_degrees(float(rotator_values))
+
+    def __setitem__(self, index, rotator):
+        self.rotators[index] = self._set_rotators_between_minus_180_and_180(
+            np.array(self._get_other_rotator_values(rotator), dtype=np.float64)
+        )
+
+    def __repr__(self):
+        return f"Rotator2Array({self.rotators.tolist()})"
+
+    def __str__(self):
+        rotators_joined = ", ".join(f"{rotator_value}°" for rotator_value in self.rotators.tolist())
+        return f"[{rotators_joined}]"
+
+    def __add__(self, rotator):
+        return Rotator2Array.from_degrees(self.rotators + self._get_other_rotator_values(rotator))
+
+    def __sub__(self, rotator):
+        return Rotator2Array.from_degrees(self.rotators - self._get_other_rotator_values(rotator))
+
+    def __mul__(self, number):
+        return Rotator2Array.from_degrees(self.rotators * self._get_numbers(number))
+
+    def __truediv__(self, number):
+        return Rotator2Array.from_degrees(self.rotators / self._get_numbers(number))
+
+    def __iadd__(self, rotator):
+        self.rotators = self._set_rotators_between_minus_180_and_180(self.rotators + self._get_other_rotator_values(rotator))
+        return self
+
+    def __isub__(self, rotator):
+        self.rotators = self._set_rotators_between_minus_180_and_180(self.rotators - self._get_other_rotator_values(rotator))
+        return self
+
+    def __imul__(self, number):
+        self.rotators = self._set_rotators_between_minus_180_and_180(self.rotators * self._get_numbers(number))
+        return self
+
+    def __itruediv__(self, number):
+        self.rotators = self._set_rotators_between_minus_180_and_180(self.rotators / self._get_numbers(number))
+        return self
+
+    def __neg__(self):
+        return Rotator2Array.from_degrees(-self.rotators)
+
+    def __abs__(self):
+        return Rotator2Array.from_degrees(np.abs(self.rotators))
@@ -0,0 +1,163 @@
+import pygame
+from itertools import count
+from pygame_helper.utilities import WHTuple
+
+
+# sprites are hashed into cells by the rect they had when they were last indexed: a sprite moved
+# other than through update() must be re-indexed with refresh() or update_sprite() before the next
+# query, or queries will miss it at its new position. auto_refresh=True refreshes before every
+# query instead, which checks the rect of every sprite in the group each time
+class SpatialHashGroup(pygame.sprite.Group):
+
+    def __init__(self, cell_geometry=(64, 64), *sprites, auto_refresh=False):
+        self.cell_geometry = WHTuple(*cell_geometry)
+        if self.cell_geometry.width <= 0 or self.cell_geometry.height <= 0:
+            raise ValueError("Cell geometry must be positive")
+        self.auto_refresh = auto_refresh
+
+        self.cells = dict()
+        self._sprite_cells = dict()
+        self._sprite_rects = dict()
+        self._sprite_order = dict()
+        self._unindexed_sprites = dict()
+        self._rect_change_listeners = list()
+        self._order_counter = count()
+        super().__init__(*sprites)
+
+
+    ### Group Section: keeps the hash in sync with pygame's add/remove/kill ###
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        self._sprite_order[sprite] = next(self._order_counter)
+        self._unindexed_sprites[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._sprite_order.pop(sprite, None)
+        self._unindexed_sprites.pop(sprite, None)
+        old_rect = self._sprite_rects.get(sprite)
+        self._remove_sprite_from_cells(sprite)
+        if old_rect is not None:
+            self._notify_rect_changed(old_rect)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.refresh()
+
+    # include_moved_sprites=False only indexes sprites added since, without checking every rect
+    def refresh(self, include_moved_sprites=True):
+        self._index_unindexed_sprites()
+        if include_moved_sprites:
+            for sprite, rect in list(self._sprite_rects.items()):
+                if rect != tuple(sprite.rect):
+                    self.update_sprite(sprite)
+
+    def update_sprite(self, sprite):
+        old_rect = self._sprite_rects.get(sprite)
+        new_rect = tuple(sprite.rect)
+        new_cells = self.get_cells_for_rect(sprite.rect)
+        if new_cells != self._sprite_cells.get(sprite):
+            self._remove_sprite_from_cells(sprite)
+            for cell in new_cells:
+                self.cells.setdefault(cell, dict())[sprite] = None
+            self._sprite_cells[sprite] = new_cells
+        self._sprite_rects[sprite] = new_rect
+
+        if old_rect != new_rect:
+            if old_rect is not None:
+                self._notify_rect_changed(old_rect)
+            self._notify_rect_changed(new_rect)
+
+    def _index_unindexed_sprites(self):
+        # sprites are often added to groups in Sprite.__init__, before their rect exists
+        for sprite in list(self._unindexed_sprites):
+            if getattr(sprite, "rect", None) is not None:
+                del self._unindexed_sprites[sprite]
+                self.update_sprite(sprite)
+
+    def _remove_sprite_from_cells(self, sprite):
+        for cell in self._sprite_cells.pop(sprite, ()):
+            sprites_in_cell = self.cells[cell]
+            del sprites_in_cell[sprite]
+            if not sprites_in_cell:
+                del self.cells[cell]
+        self._sprite_rects.pop(sprite, None)
+
+
+    ### Listener Section: listeners are called with every area a sprite enters or leaves ###
+    def add_rect_change_listener(self, listener):
+        self._rect_change_listeners.append(listener)
+
+    def remove_rect_change_listener(self, listener):
+        self._rect_change_listeners.remove(listener)
+
+    def _notify_rect_changed(self, rect):
+        for listener in self._rect_change_listeners:
+            listener(pygame.Rect(rect))
+
+
+    ### Query Section: only sprites in the cells a rect overlaps are tested ###
+    def get_cells_for_rect(self, rect):
+        rect = pygame.Rect(rect)
+        first_column = rect.left // self.cell_geometry.width
+        last_column = max(rect.right - 1, rect.left) // self.cell_geometry.width
+        first_row = rect.top // self.cell_geometry.height
+        last_row = max(rect.bottom - 1, rect.top) // self.cell_geometry.height
+        return tuple(
+            (column, row)
+            for row in range(first_row, last_row + 1)
+            for column in range(first_column, last_column + 1)
+        )
+
+    def get_sprites_in_rect(self, rect):
+        if self.auto_refresh:
+            self.refresh()
+        else:
+            self._index_unindexed_sprites()
+        cells = self.get_cells_for_rect(rect)
+        if len(cells) == 1:
+            candidates = list(self.cells.get(cells[0], ()))
+        else:
+            candidates = dict()
+            for cell in cells:
+                candidates.update(self.cells.get(cell, ()))
+            candidates = list(candidates)
+
+        # same order as iterating the group, so the first hit matches spritecollide
+        candidates.sort(key=self._sprite_order.__getitem__)
+        return candidates
+
+    def spritecollide(self, sprite, dokill=False, collided=None, rect=None):
+        if rect is None:
+            rect = sprite.rect
+
+        sprites_collided = list()
+        for group_sprite in self.get_sprites_in_rect(rect):
+            if collided is not None:
+                is_collided = collided(sprite, group_sprite)
+            else:
+                is_collided = sprite.rect.colliderect(group_sprite.rect)
+
+            if is_collided:
+                if dokill:
+                    group_sprite.kill()
+                sprites_collided.append(group_sprite)
+        return sprites_collided
+
+    def get_cell_occupancy_stats(self):
+        self._index_unindexed_sprites()
+        occupancies = [len(sprites_in_cell) for sprites_in_cell in self.cells.values()]
+        num_occupied_cells = len(occupancies)
+        return {
+            "num_sprites": len(self._sprite_order),
+            "num_occupied_cells": num_occupied_cells,
+            "max_sprites_per_cell": max(occupancies, default=0),
+            "mean_sprites_per_cell": sum(occupancies) / num_occupied_cells if num_occupied_cells else 0.0,
+            "num_sprites_spanning_multiple_cells": sum(1 for cells in self._sprite_cells.values() if len(cells) > 1),
+        }
+
+    def copy(self):
+        return self.__class__(self.cell_geometry, *self.sprites(), auto_refresh=self.auto_refresh)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({len(self)} sprites, {len(self.cells)} cells)>"
@@ -4,10 +4,13 @@ import pygame_helper.exceptions as exceptions
 
 class Timer(object):
     
-    def __init__(self, countdown, auto_start=False, set_timer_to_completed_when_reset=True):
-        if not pygame.display.get_init():
+    def __init__(self, countdown, auto_start=False, set_timer_to_completed_when_reset=True, clock=None):
+        # the default clock is pygame's, which needs pygame to be initialised;
+        # any other clock (e.g. a ManualClock) works headless
+        if clock is None and not pygame.display.get_init():
             raise exceptions.PygameInitError
         
+        self.clock = clock
         self._time_started_seconds = None
         self._countdown = None
         self.countdown = countdown
@@ -46,6 +49,8 @@ class Timer(object):
 
     @property
     def _current_time(self):
+        if self.clock is not None:
+            return float(self.clock.get_ticks()) / 1000
         return float(pygame.time.get_ticks()) / 1000
 
     @property
@@ -0,0 +1,153 @@
+import heapq
+import itertools
+import weakref
+
+
+class ManagedTimer(object):
+
+    __slots__ = ("manager", "countdown", "callback", "repeat", "deadline", "_heap_entry", "_is_completed", "__weakref__")
+
+    def __init__(self, manager, countdown, callback=None, repeat=False):
+        if countdown < 0:
+            raise ValueError("Must provide a valid countdown time (in seconds)")
+        if repeat and countdown == 0:
+            raise ValueError("A repeating timer must have a countdown greater than 0")
+
+        self.manager = manager
+        self.countdown = float(countdown)
+        self.callback = callback
+        self.repeat = repeat
+        self.deadline = None
+        self._heap_entry = None
+        self._is_completed = False
+
+
+    def restart(self):
+        self.manager._schedule_timer(self)
+
+    def cancel(self):
+        self.manager.cancel_timer(self)
+
+
+    def is_running(self):
+        return self._heap_entry is not None
+
+    def is_completed(self):
+        return self._is_completed
+
+    @property
+    def time_remaining(self):
+        if self._heap_entry is None:
+            return float(0)
+        return max(self.deadline - self.manager.time, float(0))
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(countdown={self.countdown}, repeat={self.repeat})"
+
+    def __str__(self):
+        time_remaining_seconds = round(self.time_remaining, 5)
+        return f"Time remaining: {time_remaining_seconds} seconds"
+
+
+class TimerManager(object):
+
+    # timers sit in a min-heap keyed by deadline, so a tick only touches the timers
+    # which expire; cancelled or restarted timers leave a stale entry behind which
+    # is skipped when popped, and the heap is rebuilt once stale entries dominate
+    def __init__(self, time_scale=1.0, clock=None):
+        self.clock = clock
+        self.time = float(0)
+        self.time_scale = time_scale
+        self.is_paused = False
+        self._heap = list()
+        self._sequence = itertools.count()
+        self._num_stale_entries = 0
+        # completed timers have left the heap, so clear() finds them here
+        self._timers = weakref.WeakSet()
+
+
+    def add_timer(self, countdown, callback=None, repeat=False, auto_start=True):
+        timer = ManagedTimer(self, countdown, callback, repeat)
+        self._timers.add(timer)
+        if auto_start:
+            self._schedule_timer(timer)
+        return timer
+
+    def _schedule_timer(self, timer):
+        self._invalidate_heap_entry(timer)
+        timer.deadline = self.time + timer.countdown
+        timer._is_completed = False
+        timer._heap_entry = [timer.deadline, next(self._sequence), timer]
+        heapq.heappush(self._heap, timer._heap_entry)
+
+    def cancel_timer(self, timer):
+        self._invalidate_heap_entry(timer)
+        timer._is_completed = False
+        self._compact_heap_if_mostly_stale()
+
+    def _invalidate_heap_entry(self, timer):
+        if timer._heap_entry is not None:
+            timer._heap_entry[2] = None
+            timer._heap_entry = None
+            self._num_stale_entries += 1
+
+    def _compact_heap_if_mostly_stale(self):
+        if self._num_stale_entries > 64 and self._num_stale_entries * 2 > len(self._heap):
+            self._heap[:] = [entry for entry in self._heap if entry[2] is not None]
+            heapq.heapify(self._heap)
+            self._num_stale_entries = 0
+
+    def clear(self):
+        for timer in self._timers:
+            timer._heap_entry = None
+            timer._is_completed = False
+        self._timers = weakref.WeakSet()
+        self._heap[:] = list()
+        self._num_stale_entries = 0
+
+
+    def pause(self):
+        self.is_paused = True
+
+    def resume(self):
+        self.is_paused = False
+
+
+    def tick(self, elapsed_time=None):
+        if self.is_paused:
+            return list()
+        if elapsed_time is None:
+            if self.clock is None:
+                raise ValueError("A TimerManager without a clock must be given the elapsed_time to tick by")
+            elapsed_time = self.clock.get_time() / 1000
+
+        self.time += elapsed_time * self.time_scale
+        completed_timers = list()
+        heap = self._heap
+        while heap and heap[0][0] <= self.time:
+            deadline, _, timer = heapq.heappop(heap)
+            if timer is None:
+                self._num_stale_entries -= 1
+                continue
+
+            if timer.repeat:
+                timer.deadline = deadline + timer.countdown
+                timer._heap_entry = [timer.deadline, next(self._sequence), timer]
+                heapq.heappush(heap, timer._heap_entry)
+            else:
+                timer._heap_entry = None
+                timer._is_completed = True
+
+            completed_timers.append(timer)
+            if timer.callback is not None:
+                timer.callback(timer)
+
+        return completed_timers
+
+
+    def __len__(self):
+        return len(self._heap) - self._num_stale_entries
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(time_scale={self.time_scale})"
@@ -1,7 +1,9 @@
 from pygame_helper.widgets.base_widget import Widget
+from pygame_helper.widgets.font_registry import FontRegistry, font_registry
+from pygame_helper.widgets.text_render_cache import TextRenderCache, text_render_cache
 from pygame_helper.widgets.text_widget import TextWidget
 from pygame_helper.widgets.progress_bar_widget import ProgressBarWidget
-from pygame_helper.widgets.widget_layout import WidgetLayout
+from pygame_helper.widgets.widget_layout import WidgetLayout, WidgetEntry, WidgetDict
 from pygame_helper.widgets.image_widget import ImageWidget
 from pygame_helper.widgets.box_widget import BoxWidget
 from pygame_helper.widgets.circle_widget import CircleWidget
@@ -1,6 +1,6 @@
 import pygame
 from abc import ABC, abstractmethod
-import collections
+import collections.abc
 import pygame_helper.exceptions as exceptions
 
 
@@ -11,11 +11,12 @@ class Widget(ABC):
             raise exceptions.PygameInitError
 
         super().__init__()
+        self._is_dirty = True
         self.action = None
         self.set_action(action)
     
     def set_action(self, fn):
-        if fn is not None and not isinstance(fn, collections.Callable):
+        if fn is not None and not isinstance(fn, collections.abc.Callable):
             raise TypeError("Must provide a function")
         
         self.action = fn
@@ -25,6 +26,20 @@ class Widget(ABC):
         final_position = (initial_position[0] - widget_geometry_halved[0], initial_position[1] - widget_geometry_halved[1])
         return final_position
 
+    # set_* methods mark a widget dirty, so a retained WidgetLayout only redraws what changed
+    def mark_dirty(self):
+        self._is_dirty = True
+
+    def is_dirty(self):
+        return self._is_dirty
+
+    def clear_dirty(self):
+        self._is_dirty = False
+
+    # the area render() draws over at this position, or None if it is not known
+    def get_rect(self, position):
+        return None
+
     @abstractmethod
     def render(self, window, position):
         pass
\ No newline at end of file
@@ -18,14 +18,17 @@ class BoxWidget(Widget):
 
     def set_dimensions(self, dimensions):
         self.dimensions = dimensions
+        self.mark_dirty()
 
     def set_colour(self, colour):
         if colour == "default":
             colour = pygame.Color(0, 0, 0)
         self.colour = colour
+        self.mark_dirty()
 
     def set_border_thickness(self, border_thickness):
         self.border_thickness = border_thickness
+        self.mark_dirty()
 
     def set_rounded_corners(self, all_corners=0, top_left=0, top_right=0, bottom_left=0, bottom_right=0):
         self.rounded_corners = {
@@ -35,6 +38,10 @@ class BoxWidget(Widget):
             "border_bottom_left_radius": bottom_left,
             "border_bottom_right_radius": bottom_right
         }
+        self.mark_dirty()
+
+    def get_rect(self, position):
+        return pygame.Rect(self.get_centre_position_for_widget(position, self.dimensions), self.dimensions)
 
     def render(self, window, position):
         final_position = self.get_centre_position_for_widget(position, self.dimensions)
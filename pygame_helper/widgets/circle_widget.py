@@ -16,14 +16,20 @@ class CircleWidget(Widget):
 
     def set_radius(self, radius):
         self.radius = radius
+        self.mark_dirty()
 
     def set_colour(self, colour):
         if colour == "default":
             colour = pygame.Color(0, 0, 0)
         self.colour = colour
+        self.mark_dirty()
 
     def set_border_thickness(self, border_thickness):
         self.border_thickness = border_thickness
+        self.mark_dirty()
+
+    def get_rect(self, centre):
+        return pygame.Rect(centre[0] - self.radius, centre[1] - self.radius, self.radius * 2, self.radius * 2)
 
     def render(self, window, centre):
         pygame.draw.circle(window, self.colour, centre, self.radius, self.border_thickness)
\ No newline at end of file
@@ -0,0 +1,35 @@
+import pygame
+
+
+# each font is loaded once per process and shared by everything asking for it, so a font from
+# the registry must not be restyled (set_bold, set_italic, ...); create a separate font for that
+class FontRegistry(object):
+
+    def __init__(self):
+        self._fonts = dict()
+
+    def get_system_font(self, name, size, bold=False, italic=False):
+        key = ("system", name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.SysFont(name, size, bold, italic)
+        return font
+
+    def get_font(self, path, size):
+        key = ("file", path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(path, size)
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+
+    def __len__(self):
+        return len(self._fonts)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self._fonts)} fonts)"
+
+
+font_registry = FontRegistry()
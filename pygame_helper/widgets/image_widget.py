@@ -22,10 +22,16 @@ class ImageWidget(Widget):
             image = image.convert()
             image.set_colorkey((255, 255, 255))
             self.image = image
+            self.mark_dirty()
 
     def set_image_geometry(self, geometry):
         image = pygame.transform.scale(self.image, geometry)
         self.image = image
+        self.mark_dirty()
+
+    def get_rect(self, position):
+        image_geometry = self.image.get_size()
+        return pygame.Rect(self.get_centre_position_for_widget(position, image_geometry), image_geometry)
 
     def render(self, window, position):
         image_geometry = self.image.get_size()
@@ -16,14 +16,27 @@ class LineWidget(Widget):
 
     def set_line_vector(self, line_vector):
         self.line_vector = line_vector
+        self.mark_dirty()
 
     def set_colour(self, colour):
         if colour == "default":
             colour = pygame.Color(0, 0, 0)
         self.colour = colour
+        self.mark_dirty()
 
     def set_thickness(self, thickness):
         self.thickness = thickness
+        self.mark_dirty()
+
+    def get_rect(self, start_position):
+        end_position = (start_position[0] + self.line_vector[0], start_position[1] + self.line_vector[1])
+        line_rect = pygame.Rect(
+            min(start_position[0], end_position[0]),
+            min(start_position[1], end_position[1]),
+            abs(self.line_vector[0]) + 1,
+            abs(self.line_vector[1]) + 1
+        )
+        return line_rect.inflate(self.thickness, self.thickness)
 
     def render(self, window, start_position):
         end_position = (start_position[0] + self.line_vector[0], start_position[1] + self.line_vector[1])
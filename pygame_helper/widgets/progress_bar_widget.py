@@ -19,6 +19,7 @@ class ProgressBarWidget(Widget):
 
     def set_dimensions(self, dimensions):
         self.dimensions = dimensions
+        self.mark_dirty()
 
     def set_colours(self, bg_colour, fg_colour):
         if bg_colour == "default":
@@ -28,14 +29,32 @@ class ProgressBarWidget(Widget):
 
         self.background_bar_colour = bg_colour
         self.foreground_bar_colour = fg_colour
+        self.mark_dirty()
 
     def set_progress_value(self, progress_value):
         if not 0 <= progress_value <= 1:
             raise ValueError("Progress value must lie between 0 and 1")
-        self.progress_value = float(progress_value)
+        if float(progress_value) != self.progress_value:
+            self.progress_value = float(progress_value)
+            self.mark_dirty()
 
     def set_text_widget(self, text_widget):
         self.text_widget = text_widget
+        self.mark_dirty()
+
+    def is_dirty(self):
+        return super().is_dirty() or (self.text_widget is not None and self.text_widget.is_dirty())
+
+    def clear_dirty(self):
+        super().clear_dirty()
+        if self.text_widget is not None:
+            self.text_widget.clear_dirty()
+
+    def get_rect(self, position):
+        bar_rect = pygame.Rect(self.get_centre_position_for_widget(position, self.dimensions), self.dimensions)
+        if self.text_widget is not None:
+            return bar_rect.union(self.text_widget.get_rect(position))
+        return bar_rect
 
     def set_progress_value_then_render(self, progress_value, window, position):
         self.set_progress_value(progress_value)
@@ -0,0 +1,64 @@
+import pygame
+from collections import OrderedDict
+
+
+# rendered text surfaces are shared between everything rendering the same text,
+# so a surface returned from render() must be blitted but never drawn on
+class TextRenderCache(object):
+
+    def __init__(self, max_size=512):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    @staticmethod
+    def get_colour_key(colour):
+        return tuple(pygame.Color(colour))
+
+    # fonts are mutable, so their style is part of the key along with the font itself
+    @staticmethod
+    def get_font_key(font):
+        return font, font.get_bold(), font.get_italic(), font.get_underline(), font.get_strikethrough()
+
+    def render(self, font, text, antialias, colour_key):
+        key = (self.get_font_key(font), text, antialias, colour_key)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, colour_key)
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def get_stats(self):
+        num_lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / num_lookups if num_lookups else 0.0,
+            "size": len(self._surfaces),
+            "max_size": self.max_size,
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(max_size={self.max_size})"
+
+
+text_render_cache = TextRenderCache()
@@ -1,5 +1,10 @@
 import pygame
 from pygame_helper.widgets.base_widget import Widget
+from pygame_helper.widgets.text_render_cache import text_render_cache
+from pygame_helper.widgets.font_registry import font_registry
+
+
+DEFAULT_FONT = ("calibri", 35, True)
 
 
 class TextWidget(Widget):
@@ -9,30 +14,67 @@ class TextWidget(Widget):
         self.text = None
         self.colour = None
         self.font = None
+        self._shared_font_arguments = None
+        self.render_cache = text_render_cache
+        self._colour_key = None
 
         self.set_text(text)
         self.set_colour(colour)
         self.set_font(font)
 
     def set_text(self, text):
-        self.text = text
+        if text != self.text:
+            self.text = text
+            self.mark_dirty()
 
     def set_colour(self, colour):
         if colour == "default":
             colour = pygame.Color(0, 0, 0)
         self.colour = colour
+        self._colour_key = text_render_cache.get_colour_key(colour)
+        self.mark_dirty()
 
     def set_font(self, font):
         if font == "default":
-            font = pygame.font.SysFont("calibri", 35, True)
+            font = font_registry.get_system_font(*DEFAULT_FONT)
+            self._shared_font_arguments = DEFAULT_FONT
+        else:
+            self._shared_font_arguments = None
         self.font = font
+        self.mark_dirty()
+
+    # the default font is shared through the font registry, so the widget swaps it for a font
+    # of its own before restyling; restyle through here rather than on self.font directly
+    def set_font_style(self, bold=None, italic=None, underline=None, strikethrough=None):
+        if self._shared_font_arguments is not None:
+            self.font = pygame.font.SysFont(*self._shared_font_arguments)
+            self._shared_font_arguments = None
+        if bold is not None:
+            self.font.set_bold(bold)
+        if italic is not None:
+            self.font.set_italic(italic)
+        if underline is not None:
+            self.font.set_underline(underline)
+        if strikethrough is not None:
+            self.font.set_strikethrough(strikethrough)
+        self.mark_dirty()
 
     def render_new_text(self, text, window, position):
         self.set_text(text)
         self.render(window, position)
 
+    def get_rect(self, position):
+        if self.render_cache is not None:
+            text_size = self.render_cache.render(self.font, self.text, True, self._colour_key).get_size()
+        else:
+            text_size = self.font.size(self.text)
+        return pygame.Rect(self.get_centre_position_for_widget(position, text_size), text_size)
+
     def render(self, window, position):
-        text_to_be_rendered = self.font.render(self.text, True, self.colour)
+        if self.render_cache is not None:
+            text_to_be_rendered = self.render_cache.render(self.font, self.text, True, self._colour_key)
+        else:
+            text_to_be_rendered = self.font.render(self.text, True, self.colour)
         text_size = text_to_be_rendered.get_size()
         final_position = self.get_centre_position_for_widget(position, text_size)
-        window.blit(text_to_be_rendered, final_position)
\ No newline at end of file
+        window.blit(text_to_be_rendered, final_position)
@@ -1,59 +1,186 @@
+import math
 import pygame
-from dotmap import DotMap
 import pygame_helper.exceptions as exceptions
 
 
+class WidgetEntry(object):
+
+    __slots__ = ("name", "widget", "screen_position", "rect")
+
+    def __init__(self, name, widget, screen_position):
+        self.name = name
+        self.widget = widget
+        self.screen_position = screen_position
+        self.rect = None
+
+    # item access keeps working as it did when entries were DotMaps, e.g. widgets[name]["widget"]
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name!r}, widget={self.widget!r}, screen_position={self.screen_position})"
+
+
+# widgets keep their attribute access from when they were a DotMap, e.g. layout.widgets.BoxWidget_0
+class WidgetDict(dict):
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
 class WidgetLayout(pygame.Surface):
     
-    def __init__(self, geometry, flags=0):
+    # a retained layout only redraws the areas of widgets which changed since the last render;
+    # blit_dirty_rects_only is for windows which keep their contents between frames, as then only
+    # those areas are blitted onto the window, and nothing at all on frames where nothing changed
+    def __init__(self, geometry, flags=0, retained=False, background_colour=(0, 0, 0, 255), smooth_scale=False,
+                 blit_dirty_rects_only=False):
         if not pygame.display.get_init():
             raise exceptions.PygameInitError
         
         super().__init__(geometry, flags)
-        self.fill((0, 0, 0, 255))
-        self.widgets = DotMap()
-        self.widgets_ordered = list()
+        self.background_colour = background_colour
+        self.fill(self.background_colour)
+        self.widgets = WidgetDict()
+        self.retained = retained
+        self.blit_dirty_rects_only = blit_dirty_rects_only
+        self._is_full_redraw_needed = True
+        self._pending_dirty_rects = list()
+        self._pending_drawn_rects = list()
+        self._last_window_rect = None
+        self.smooth_scale = smooth_scale
+        self._scaled_surface = None
+        self._is_scaled_surface_stale = True
+        self._stale_scaled_rects = list()
+
+        # entries in render order; deleting leaves a None behind until the next compaction,
+        # so deleting, renaming and looking up a widget never shifts or scans the list
+        self._entries = list()
+        self._entry_indices = dict()
+        self._num_deleted_entries = 0
+        self._widget_name_counters = dict()
+
+    # a copy of the render order; assign a reordered list of the same names to change it
+    @property
+    def widgets_ordered(self):
+        return [entry.name for entry in self._entries if entry is not None]
+
+    @widgets_ordered.setter
+    def widgets_ordered(self, widget_names):
+        widget_names = list(widget_names)
+        if len(widget_names) != len(self.widgets) or set(widget_names) != set(self.widgets):
+            raise ValueError("widgets_ordered must contain the name of every widget exactly once")
+
+        self._entries = [self.widgets[widget_name] for widget_name in widget_names]
+        self._num_deleted_entries = 0
+        self._reindex_entries()
+        self.invalidate()
 
     def add_widget(self, widget, screen_position, render_position="end", name=None):
-        if render_position == "end":
-            render_position = len(self.widgets_ordered)
-        if name is not None and not isinstance(name, basestring):
+        if name is not None and not isinstance(name, str):
             raise TypeError("Name must be a string object")
 
-        widget_name = self._generate_widget_name(widget) if name==None else name
-        self.widgets[widget_name] = DotMap(widget=widget, screen_position=screen_position)
-        self.widgets_ordered.insert(render_position, widget_name)
+        widget_name = self._generate_widget_name(widget) if name is None else name
+        if widget_name in self.widgets:
+            raise ValueError(f"A widget named {widget_name!r} already exists")
+
+        entry = WidgetEntry(widget_name, widget, screen_position)
+        self.widgets[widget_name] = entry
+        if render_position == "end":
+            self._entry_indices[widget_name] = len(self._entries)
+            self._entries.append(entry)
+        else:
+            self._compact_entries()
+            index = self._get_insert_index(render_position)
+            self._entries.insert(index, entry)
+            self._reindex_entries(index)
+        widget.mark_dirty()
 
     def _generate_widget_name(self, widget):
         class_name_of_widget = type(widget).__name__
-        number_suffix = 0
-        for name in self.widgets.keys():
-            if class_name_of_widget in name:
-                number_suffix += 1
+        number_suffix = self._widget_name_counters.get(class_name_of_widget, 0)
         widget_name = f"{class_name_of_widget}_{number_suffix}"
+        while widget_name in self.widgets:
+            number_suffix += 1
+            widget_name = f"{class_name_of_widget}_{number_suffix}"
+        self._widget_name_counters[class_name_of_widget] = number_suffix + 1
         return widget_name
 
     def change_widget_name(self, old_widget_name, new_widget_name):
-        if not isinstance(new_widget_name, basestring):
+        if not isinstance(new_widget_name, str):
             raise TypeError("New widget name must be a string object")
+        if new_widget_name in self.widgets:
+            raise ValueError(f"A widget named {new_widget_name!r} already exists")
 
-        widget_info =  self.widgets[old_widget_name]
-        del self.widgets[old_widget_name]
-        self.widgets[new_widget_name] = widget_info
-
-        widget_render_position = self.widgets_ordered.index(old_widget_name)
-        self.widgets_ordered[widget_render_position] = new_widget_name
+        entry = self.widgets.pop(old_widget_name)
+        entry.name = new_widget_name
+        self.widgets[new_widget_name] = entry
+        self._entry_indices[new_widget_name] = self._entry_indices.pop(old_widget_name)
 
     def change_widget_screen_position(self, widget_name, new_screen_position):
-        self.widgets[widget_name]["screen_position"] = new_screen_position
+        entry = self.widgets[widget_name]
+        entry.screen_position = new_screen_position
+        entry.widget.mark_dirty()
 
     def change_widget_render_position(self, widget_name, render_position):
-        self.widgets_ordered.remove(widget_name)
-        self.widgets_ordered.insert(render_position, widget_name)
+        entry = self.widgets[widget_name]
+        self._compact_entries()
+        old_index = self._entry_indices[widget_name]
+        del self._entries[old_index]
+        new_index = self._get_insert_index(render_position)
+        self._entries.insert(new_index, entry)
+        # only the entries between the old and new index have shifted
+        self._reindex_entries(min(old_index, new_index), max(old_index, new_index) + 1)
+        entry.widget.mark_dirty()
 
     def delete_widget(self, widget_name):
-        del self.widgets[widget_name]
-        self.widgets_ordered.remove(widget_name)
+        entry = self.widgets.pop(widget_name)
+        self._entries[self._entry_indices.pop(widget_name)] = None
+        self._num_deleted_entries += 1
+        self._invalidate_rect(entry.rect)
+
+    # clamped like list.insert, so positions past either end keep meaning the start or the end
+    def _get_insert_index(self, render_position):
+        num_entries = len(self._entries)
+        if render_position < 0:
+            render_position += num_entries
+        return min(max(render_position, 0), num_entries)
+
+    # entries before the first deleted one keep their indices, so only the rest are reindexed
+    def _compact_entries(self):
+        if self._num_deleted_entries:
+            first_deleted_index = self._entries.index(None)
+            self._entries[first_deleted_index:] = [entry for entry in self._entries[first_deleted_index:] if entry is not None]
+            self._num_deleted_entries = 0
+            self._reindex_entries(first_deleted_index)
+
+    def _reindex_entries(self, start=0, stop=None):
+        entries = self._entries
+        entry_indices = self._entry_indices
+        for index in range(start, len(entries) if stop is None else stop):
+            entry_indices[entries[index].name] = index
+
+    def invalidate(self):
+        self._is_full_redraw_needed = True
+        self._is_scaled_surface_stale = True
+
+    # for anything drawn straight onto the layout surface: the area is not cleared or redrawn,
+    # only rescaled and blitted onto the window with the next render (None for the whole layout)
+    def mark_dirty_rect(self, rect=None):
+        layout_rect = self.get_rect()
+        self._pending_drawn_rects.append(layout_rect if rect is None else pygame.Rect(rect).clip(layout_rect))
+
+    def _invalidate_rect(self, rect):
+        if rect is None:
+            self._is_full_redraw_needed = True
+        else:
+            self._pending_dirty_rects.append(rect)
 
     def print_order_of_widgets(self):
         for num, widget_name in enumerate(self.widgets_ordered):
@@ -62,21 +189,159 @@ class WidgetLayout(pygame.Surface):
     def print_widget_details(self, widget_name):
         print(self.widgets[widget_name])
 
+    # returns the areas of the window which changed, for pygame.display.update(rects)
     def render(self, window, position=(0, 0), size="entire_window"):
-        self._render_widgets_on_widget_layout()
-        self._render_widget_layout_on_window(window, position, size)
+        window_rect = self._get_window_rect(window, position, size)
+        drawn_rects = self._pending_drawn_rects
+        self._pending_drawn_rects = list()
+        if not self.retained:
+            self._render_widgets_on_widget_layout()
+            self._is_scaled_surface_stale = True
+            return [self._render_widget_layout_on_window(window, window_rect)]
+
+        dirty_rects = self._render_dirty_widgets_on_widget_layout() + drawn_rects
+        if window_rect.size != self.get_size():
+            self._stale_scaled_rects.extend(dirty_rects)
+        elif dirty_rects:
+            # the scaled surface is not used at the original size, so it is rescaled whole once it is
+            self._is_scaled_surface_stale = True
+        if not self.blit_dirty_rects_only or window_rect != self._last_window_rect:
+            self._last_window_rect = window_rect
+            return [self._render_widget_layout_on_window(window, window_rect)]
+
+        if window_rect.size == self.get_size():
+            return [window.blit(self, window_rect.move(dirty_rect.topleft), dirty_rect) for dirty_rect in dirty_rects]
+        scaled_surface = self._get_scaled_surface(window_rect.size)
+        window_dirty_rects = list()
+        for dirty_rect in dirty_rects:
+            _, scaled_rect = self._get_aligned_rects(dirty_rect, window_rect.size)
+            window_dirty_rects.append(window.blit(scaled_surface, window_rect.move(scaled_rect.topleft), scaled_rect))
+        return window_dirty_rects
+
+    def _render_dirty_widgets_on_widget_layout(self):
+        self._compact_entries()
+        layout_rect = self.get_rect()
+        dirty_rects = self._pending_dirty_rects
+        self._pending_dirty_rects = list()
+        for entry in self._entries:
+            widget = entry.widget
+            if widget.is_dirty() or entry.rect is None:
+                new_rect = widget.get_rect(entry.screen_position)
+                if new_rect is None:
+                    # the widget could draw anywhere, so it is treated as covering the whole layout
+                    new_rect = layout_rect
+                else:
+                    # one pixel of margin absorbs the truncation of fractional centred positions
+                    new_rect = new_rect.inflate(2, 2)
+                if entry.rect is not None:
+                    dirty_rects.append(entry.rect)
+                dirty_rects.append(new_rect)
+                entry.rect = new_rect
+                widget.clear_dirty()
+
+        if self._is_full_redraw_needed:
+            self._is_full_redraw_needed = False
+            dirty_rects = [layout_rect]
+        if not dirty_rects:
+            return list()
+        # clipped, as Surface.fill moves rects which start off the surface instead of cropping them
+        dirty_rects = [
+            dirty_rect.clip(layout_rect)
+            for dirty_rect in self._expand_rects_to_cover_overlapping_widgets(dirty_rects)
+            if dirty_rect.colliderect(layout_rect)
+        ]
+
+        for dirty_rect in dirty_rects:
+            self.fill(self.background_colour, dirty_rect)
+            for entry in self._entries:
+                if entry.rect.colliderect(dirty_rect):
+                    entry.widget.render(self, entry.screen_position)
+        return dirty_rects
+
+    # widgets are redrawn whole rather than clipped (clipping changes how pygame rasterises
+    # lines), so every dirty rect grows until it contains each widget it touches
+    def _expand_rects_to_cover_overlapping_widgets(self, rects):
+        widget_rects = [entry.rect for entry in self._entries]
+        rects = self._merge_overlapping_rects(rects)
+        while True:
+            expanded_rects = list()
+            for rect in rects:
+                overlapping_indices = rect.collidelistall(widget_rects)
+                expanded_rects.append(rect.unionall([widget_rects[index] for index in overlapping_indices]))
+            expanded_rects = self._merge_overlapping_rects(expanded_rects)
+            if expanded_rects == rects:
+                return rects
+            rects = expanded_rects
+
+    @staticmethod
+    def _merge_overlapping_rects(rects):
+        merged_rects = list()
+        for rect in rects:
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            index = rect.collidelist(merged_rects)
+            while index != -1:
+                rect = rect.union(merged_rects.pop(index))
+                index = rect.collidelist(merged_rects)
+            merged_rects.append(rect)
+        return merged_rects
 
     def _render_widgets_on_widget_layout(self):
-        for widget_name in self.widgets_ordered:
-            self.widgets[widget_name]["widget"].render(
-                window=self,
-                position=self.widgets[widget_name]["screen_position"]
-            )
+        self._compact_entries()
+        for entry in self._entries:
+            # positional, as some widgets name the position differently (e.g. centre, start_position)
+            entry.widget.render(self, entry.screen_position)
 
-    def _render_widget_layout_on_window(self, window, position=(0, 0), size="entire_window"):
+    def _get_window_rect(self, window, position=(0, 0), size="entire_window"):
         if size == "entire_window":
             size = window.get_size()
         elif size == "original":
             size = self.get_size()
-        menu = pygame.transform.scale(self, size)
-        window.blit(menu, position)
\ No newline at end of file
+        return pygame.Rect(position, size)
+
+    def _render_widget_layout_on_window(self, window, window_rect):
+        if window_rect.size == self.get_size():
+            return window.blit(self, window_rect)
+        return window.blit(self._get_scaled_surface(window_rect.size), window_rect)
+
+    # nearest neighbour scaling maps blocks of (gcd of both lengths) pixels exactly onto each other,
+    # so a rect grown to those blocks rescales alone to the same pixels as a rescale of the whole layout
+    def _get_aligned_rects(self, rect, size):
+        if self.smooth_scale:
+            # smoothscale blends in neighbouring pixels
+            rect = rect.inflate(2, 2).clip(self.get_rect())
+        aligned_spans = list()
+        for start, end, source_length, scaled_length in (
+            (rect.left, rect.right, self.get_width(), size[0]),
+            (rect.top, rect.bottom, self.get_height(), size[1])
+        ):
+            num_blocks = math.gcd(source_length, scaled_length)
+            source_block_length, scaled_block_length = source_length // num_blocks, scaled_length // num_blocks
+            first_block, end_block = start // source_block_length, -(-end // source_block_length)
+            aligned_spans.append((
+                first_block * source_block_length, (end_block - first_block) * source_block_length,
+                first_block * scaled_block_length, (end_block - first_block) * scaled_block_length
+            ))
+        (source_x, source_width, scaled_x, scaled_width), (source_y, source_height, scaled_y, scaled_height) = aligned_spans
+        return pygame.Rect(source_x, source_y, source_width, source_height), pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
+
+    # scaled into a reused surface; a retained layout only rescales its dirty areas into it, except
+    # with smooth_scale, as smoothscale filters across the whole surface so it is rescaled whole
+    def _get_scaled_surface(self, size):
+        if self._scaled_surface is None or self._scaled_surface.get_size() != size:
+            self._scaled_surface = pygame.Surface(size, self.get_flags() & pygame.SRCALPHA, self)
+            self._is_scaled_surface_stale = True
+
+        if self._is_scaled_surface_stale or (self.smooth_scale and self._stale_scaled_rects):
+            if self.smooth_scale:
+                pygame.transform.smoothscale(self, size, self._scaled_surface)
+            else:
+                pygame.transform.scale(self, size, self._scaled_surface)
+            self._is_scaled_surface_stale = False
+        else:
+            for stale_rect in self._stale_scaled_rects:
+                source_rect, scaled_rect = self._get_aligned_rects(stale_rect, size)
+                if scaled_rect.width > 0 and scaled_rect.height > 0:
+                    pygame.transform.scale(self.subsurface(source_rect), scaled_rect.size, self._scaled_surface.subsurface(scaled_rect))
+        self._stale_scaled_rects = list()
+        return self._scaled_surface
@@ -0,0 +1,14 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def pygame_display():
+    pygame.display.init()
+    pygame.font.init()
+    yield
+    pygame.quit()
@@ -0,0 +1,98 @@
+import json
+import pygame
+import pytest
+from pygame_helper.abstract_map import AbstractMap
+
+
+class ColourMap(AbstractMap):
+
+    def generate_map(self):
+        if self.window is None:
+            return
+        for y, row in enumerate(self.tile_map):
+            for x, tile in enumerate(row):
+                self.window.fill((tile * 60, 0, 0), (x * 10, y * 10, 10, 10))
+
+
+@pytest.fixture
+def map_path(tmp_path):
+    path = tmp_path / "map.json"
+    path.write_text(json.dumps([[0, 1, 2, 3], [1, 2, 3, 0], [2, 3, 0, 1]]))
+    return str(path)
+
+
+def test_content_drawn_onto_the_map_window_is_rendered(map_path):
+    colour_map = ColourMap(None, map_path, (10, 10))
+    window = pygame.Surface((80, 60))
+    colour_map.render(window)
+    assert window.get_at((5, 5)) == pygame.Color(0, 0, 0)
+
+    colour_map.window.fill((255, 0, 0))
+    colour_map.render(window)
+    assert window.get_at((5, 5)) == pygame.Color(255, 0, 0)
+
+    colour_map.set_viewport((0, 0, 20, 20))
+    colour_map.window.fill((0, 255, 0), (10, 0, 10, 10))
+    colour_map.render(window)
+    assert window.get_at((50, 10)) == pygame.Color(0, 255, 0)
+
+
+def test_cached_scaled_viewport_is_reused_until_the_map_changes(map_path):
+    colour_map = ColourMap(None, map_path, (10, 10))
+    colour_map.cache_scaled = True
+    colour_map.set_viewport((0, 0, 20, 20))
+    window = pygame.Surface((80, 80))
+    colour_map.render(window)
+    assert window.get_at((50, 10)) == pygame.Color(60, 0, 0)
+
+    colour_map.window.fill((0, 255, 0), (10, 0, 10, 10))
+    colour_map.render(window)
+    assert window.get_at((50, 10)) == pygame.Color(60, 0, 0)
+
+    colour_map.invalidate_window()
+    colour_map.render(window)
+    assert window.get_at((50, 10)) == pygame.Color(0, 255, 0)
+
+    colour_map.scroll_viewport(10, 0)
+    colour_map.render(window)
+    assert window.get_at((50, 10)) == pygame.Color(120, 0, 0)
+
+
+def test_viewport_methods_raise_without_a_viewport(map_path):
+    colour_map = ColourMap(None, map_path, (10, 10))
+    with pytest.raises(ValueError):
+        colour_map.scroll_viewport(10, 0)
+    with pytest.raises(ValueError):
+        colour_map.center_viewport_on((5, 5))
+
+
+def test_set_viewport_raises_without_a_tile_map(tmp_path):
+    colour_map = ColourMap(None, str(tmp_path / "missing.json"), (10, 10))
+    with pytest.raises(ValueError):
+        colour_map.set_viewport((0, 0, 20, 20))
+
+
+def test_static_layer_picks_up_tile_objects_added_after_baking(map_path):
+    colour_map = ColourMap(None, map_path, (10, 10))
+    colour_map.bake_static_layer()
+    assert colour_map.update_static_layer() == list()
+
+    tile_object = pygame.sprite.Sprite(colour_map.tile_objects)
+    tile_object.image = pygame.Surface((10, 10))
+    tile_object.image.fill((0, 0, 255))
+    tile_object.rect = pygame.Rect(20, 10, 10, 10)
+    assert colour_map.update_static_layer() == [pygame.Rect(20, 10, 10, 10)]
+    assert colour_map.static_layer.get_at((25, 15)) == pygame.Color(0, 0, 255)
+
+
+def test_static_layer_methods_raise_before_baking(map_path):
+    colour_map = ColourMap(None, map_path, (10, 10))
+    assert colour_map.static_layer is None
+    with pytest.raises(ValueError):
+        colour_map.update_static_layer()
+    with pytest.raises(ValueError):
+        colour_map.draw_static_layer()
+
+    colour_map.bake_static_layer(background_colour=(0, 0, 255))
+    colour_map.draw_static_layer()
+    assert colour_map.window.get_at((5, 5)) == pygame.Color(0, 0, 255)
@@ -0,0 +1,25 @@
+import pytest
+from pygame_helper.binary_tile_map import BinaryTileMap, save_tile_map_as_binary
+
+
+@pytest.mark.parametrize("tile_map", [
+    [["grass", "water", "grass"], ["wall", "grass", "water"]],
+    [[index % 300 for index in range(row, row + 40)] for row in range(10)],
+])
+def test_saved_tile_map_loads_back_unchanged(tile_map, tmp_path):
+    binary_map_path = str(tmp_path / "map.ptm")
+    save_tile_map_as_binary(tile_map, binary_map_path)
+    binary_tile_map = BinaryTileMap(binary_map_path)
+    assert binary_tile_map.to_tile_map() == tile_map
+    assert binary_tile_map.get_chunk(1, 1, 2, 1) == [tile_map[1][1:3]]
+    assert BinaryTileMap.is_binary_tile_map(binary_map_path)
+
+
+@pytest.mark.parametrize("tile_map", [[], [[]], [[], []]])
+def test_empty_tile_maps_can_be_saved_and_loaded(tile_map, tmp_path):
+    binary_map_path = str(tmp_path / "map.ptm")
+    save_tile_map_as_binary(tile_map, binary_map_path)
+    binary_tile_map = BinaryTileMap(binary_map_path)
+    assert len(binary_tile_map) == len(tile_map)
+    assert binary_tile_map.to_tile_map() == tile_map
+    assert binary_tile_map.num_tiles == (0, len(tile_map))
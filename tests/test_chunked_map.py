@@ -0,0 +1,117 @@
+import json
+import random
+import pygame
+import pytest
+from pygame_helper.abstract_chunked_map import AbstractChunkedMap
+from pygame_helper.binary_tile_map import BinaryTileMap, save_tile_map_as_binary
+from pygame_helper.chunk_sources import TileMapChunkSource, ChunkDirectoryChunkSource, split_tile_map_into_chunk_files
+
+
+# 20x12 tiles of 4x4 pixels in chunks of 8x5 tiles, so the last column and row of chunks are partial
+TILE_GEOMETRY = (4, 4)
+CHUNK_GEOMETRY = (8, 5)
+
+
+class TileObject(pygame.sprite.Sprite):
+
+    def __init__(self, rect, *groups):
+        super().__init__(*groups)
+        self.rect = pygame.Rect(rect)
+
+
+class ColourChunkedMap(AbstractChunkedMap):
+
+    def generate_chunk(self, chunk):
+        for tile_x, tile_y, tile in chunk.iterate_tiles():
+            tile_rect = pygame.Rect(tile_x * 4, tile_y * 4, 4, 4)
+            chunk.surface.fill(get_tile_colour(tile), tile_rect.move(-chunk.rect.x, -chunk.rect.y))
+            TileObject(tile_rect, chunk.tile_objects)
+
+
+def get_tile_colour(tile):
+    return (tile * 9 % 256, tile * 5 % 256, 100)
+
+
+@pytest.fixture
+def tile_map():
+    random.seed(3)
+    return [[random.randint(0, 27) for _ in range(20)] for _ in range(12)]
+
+
+def build_chunked_map(tile_map, load_radius=0, evict_radius=1):
+    return ColourChunkedMap(None, TileMapChunkSource(tile_map), TILE_GEOMETRY, CHUNK_GEOMETRY, load_radius, evict_radius)
+
+
+def test_chunks_are_loaded_around_the_camera_and_evicted_beyond_evict_radius(tile_map):
+    chunked_map = build_chunked_map(tile_map)
+    assert chunked_map.num_chunks == (3, 3)
+
+    chunked_map.update_loaded_chunks((0, 0, 20, 10))
+    assert set(chunked_map.chunks) == {(0, 0)}
+    chunked_map.update_loaded_chunks((40, 0, 20, 10))
+    assert set(chunked_map.chunks) == {(0, 0), (1, 0)}
+    chunked_map.update_loaded_chunks((70, 45, 10, 3))
+    assert set(chunked_map.chunks) == {(2, 2)}
+    assert len(chunked_map.tile_objects) == 4 * 2
+
+    chunked_map.load_radius = 1
+    chunked_map.update_loaded_chunks((70, 45, 10, 3))
+    assert set(chunked_map.chunks) == {(1, 1), (2, 1), (1, 2), (2, 2)}
+    with pytest.raises(IndexError):
+        chunked_map.load_chunk((3, 0))
+
+
+def test_evicted_chunks_take_their_tile_objects_with_them(tile_map):
+    chunked_map = build_chunked_map(tile_map)
+    chunk = chunked_map.load_chunk((1, 0))
+    assert len(chunked_map.tile_objects) == 8 * 5
+    assert chunked_map.get_tile_objects_at((8, 0)) == [sprite for sprite in chunk.tile_objects if sprite.rect.topleft == (32, 0)]
+
+    chunked_map.evict_chunk((1, 0))
+    assert len(chunked_map.tile_objects) == 0
+    assert chunked_map.get_tile_objects_at((8, 0)) == []
+
+
+@pytest.mark.parametrize("tile_position, chunk_position", [
+    ((0, 0), (0, 0)), ((7, 4), (0, 0)), ((8, 4), (1, 0)), ((7, 5), (0, 1)), ((8, 5), (1, 1)), ((19, 11), (2, 2)),
+])
+def test_tiles_at_chunk_edges_map_to_the_right_chunk(tile_map, tile_position, chunk_position):
+    chunked_map = build_chunked_map(tile_map)
+    assert chunked_map.get_chunk_at(tile_position) is None
+    assert chunked_map.get_tile_key_at(tile_position) == tile_map[tile_position[1]][tile_position[0]]
+
+    chunked_map.load_chunk(chunk_position)
+    assert chunked_map.get_chunk_at(tile_position).chunk_position == chunk_position
+    assert chunked_map.get_tile_key_at(tile_position) == tile_map[tile_position[1]][tile_position[0]]
+
+
+@pytest.mark.parametrize("camera_position", [(0, 0), (27, 15), (45, 21), (60, 36)])
+def test_rendering_across_chunk_borders_matches_the_tile_map(tile_map, camera_position):
+    chunked_map = build_chunked_map(tile_map)
+    window = pygame.Surface((20, 12))
+    chunked_map.update_loaded_chunks(pygame.Rect(camera_position, window.get_size()))
+    chunked_map.render(window, camera_position)
+
+    for window_y in range(window.get_height()):
+        for window_x in range(window.get_width()):
+            tile_x, tile_y = (camera_position[0] + window_x) // 4, (camera_position[1] + window_y) // 4
+            assert tuple(window.get_at((window_x, window_y)))[:3] == get_tile_colour(tile_map[tile_y][tile_x])
+
+
+@pytest.mark.parametrize("area", [(0, 0, 8, 5), (16, 10, 8, 5), (3, 2, 10, 7), (0, 0, 20, 12), (15, 9, 5, 3)])
+def test_chunk_sources_return_the_same_chunks(tile_map, tmp_path, area):
+    map_path = tmp_path / "map.json"
+    map_path.write_text(json.dumps(tile_map))
+    split_tile_map_into_chunk_files(str(map_path), str(tmp_path / "chunks"), CHUNK_GEOMETRY)
+    save_tile_map_as_binary(tile_map, str(tmp_path / "map.ptm"))
+
+    tile_x, tile_y, num_tiles_x, num_tiles_y = area
+    expected_chunk = [row[tile_x:tile_x + num_tiles_x] for row in tile_map[tile_y:tile_y + num_tiles_y]]
+    for chunk_source in (
+        TileMapChunkSource.from_json(str(map_path)),
+        ChunkDirectoryChunkSource(str(tmp_path / "chunks")),
+        BinaryTileMap(str(tmp_path / "map.ptm")),
+    ):
+        assert tuple(chunk_source.num_tiles) == (20, 12)
+        assert set(chunk_source.tile_keys) == {tile for row in tile_map for tile in row}
+        assert chunk_source.get_chunk(*area) == expected_chunk
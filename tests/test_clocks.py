@@ -0,0 +1,31 @@
+import pygame
+import pytest
+from pygame_helper.clocks import ManualClock
+from pygame_helper.timer_manager import TimerManager
+from pygame_helper.movement.velocity_movement_component import VelocityMovementComponent
+
+
+class FixedFrametimeGameMode(object):
+
+    def __init__(self, fixed_frametime):
+        self.fixed_frametime = fixed_frametime
+
+
+def test_injected_clock_wins_over_the_fixed_frametime():
+    clock = ManualClock()
+    clock.advance(40)
+    velocity_movement_component = VelocityMovementComponent(
+        FixedFrametimeGameMode(0.01), pygame.sprite.Sprite(), pygame.Rect(0, 0, 10, 10), (100, 100), clock=clock
+    )
+    assert velocity_movement_component.frametime == pytest.approx(0.04)
+
+    velocity_movement_component.clock = None
+    assert velocity_movement_component.frametime == pytest.approx(0.01)
+
+
+def test_timer_manager_without_a_clock_needs_an_elapsed_time():
+    timer_manager = TimerManager()
+    with pytest.raises(ValueError):
+        timer_manager.tick()
+    timer_manager.tick(0.5)
+    assert timer_manager.time == pytest.approx(0.5)
@@ -0,0 +1,63 @@
+import pytest
+from pygame_helper.fixed_step_runner import FixedStepRunner
+
+
+class RecordingGameMode(object):
+
+    def __init__(self):
+        self.fixed_frametime = None
+        self.interpolation_alpha = 1.0
+        self.frametimes_during_updates = list()
+        self.num_renders = 0
+
+    def process_input(self):
+        pass
+
+    def update_game_state(self):
+        self.frametimes_during_updates.append(self.fixed_frametime)
+
+    def render(self, window):
+        self.num_renders += 1
+
+
+def test_accumulator_runs_whole_steps_and_carries_the_remainder():
+    game_mode = RecordingGameMode()
+    fixed_step_runner = FixedStepRunner(game_mode, tick_rate=8)
+
+    fixed_step_runner.run_frame(None, elapsed_time=0.3125)
+    assert fixed_step_runner.steps_last_frame == 2
+    assert fixed_step_runner.interpolation_alpha == pytest.approx(0.5)
+
+    fixed_step_runner.run_frame(None, elapsed_time=0.0625)
+    assert fixed_step_runner.steps_last_frame == 1
+    assert fixed_step_runner.total_steps == 3
+    assert fixed_step_runner.accumulator == pytest.approx(0)
+
+
+def test_slow_frames_are_capped_at_max_steps_per_frame():
+    game_mode = RecordingGameMode()
+    fixed_step_runner = FixedStepRunner(game_mode, tick_rate=10, max_steps_per_frame=3)
+
+    fixed_step_runner.run_frame(None, elapsed_time=1.0)
+    assert fixed_step_runner.steps_last_frame == 3
+    assert fixed_step_runner.accumulator == pytest.approx(0.3)
+
+
+def test_fixed_frametime_is_only_set_during_steps():
+    game_mode = RecordingGameMode()
+    fixed_step_runner = FixedStepRunner(game_mode, tick_rate=10)
+
+    fixed_step_runner.run_frame(None, elapsed_time=0.2)
+    assert game_mode.frametimes_during_updates == [0.1, 0.1]
+    assert game_mode.fixed_frametime is None
+
+
+def test_renders_are_forced_after_max_skipped_renders():
+    game_mode = RecordingGameMode()
+    fixed_step_runner = FixedStepRunner(
+        game_mode, tick_rate=10, max_steps_per_frame=1, skip_render_when_behind=True, max_skipped_renders=2
+    )
+
+    rendered = [fixed_step_runner.run_frame(None, elapsed_time=0.5) for _ in range(6)]
+    assert rendered == [False, False, True, False, False, True]
+    assert game_mode.num_renders == 2
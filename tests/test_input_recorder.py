@@ -0,0 +1,60 @@
+import pygame
+import pytest
+from pygame_helper.input_recorder import InputRecorder, InputPlayback
+from pygame_helper.keybinder import Keybinder
+from pygame_helper.keyboard_state import KeyboardState
+
+
+def build_keybinder():
+    keyboard_state = KeyboardState()
+    keybinder = Keybinder("left", "right", "jump", keyboard_state=keyboard_state)
+    keybinder.add_keybinds_and_value_to_multiple_options(
+        ("left", [pygame.K_a], -1),
+        ("right", [pygame.K_d], 1),
+        ("jump", [pygame.K_SPACE], 1)
+    )
+    keybinder.track_keys_for_multiple_options("left", "right")
+    return keybinder, keyboard_state
+
+
+def test_recording_plays_back_the_same_input(tmp_path):
+    keybinder, keyboard_state = build_keybinder()
+    recorder = InputRecorder(keybinder)
+    recorded_frames = list()
+    for frametime, pressed_keys in ((0.016, [pygame.K_a]), (0.017, [pygame.K_a, pygame.K_d, pygame.K_SPACE]), (0.015, [])):
+        keyboard_state.set_pressed_keys(pressed_keys)
+        keybinder.update_pressed_keys_order()
+        recorder.record_frame(frametime)
+        recorded_frames.append((frametime, keybinder.get_pressed_options_mask(), list(keybinder.pressed_keys_order)))
+    recording_path = tmp_path / "input.pghi"
+    recorder.save(recording_path)
+
+    playback_keybinder, _ = build_keybinder()
+    playback = InputPlayback(recording_path, playback_keybinder)
+    played_frames = list()
+    while playback.apply_next_frame():
+        played_frames.append((playback.frametime, playback_keybinder.get_pressed_options_mask(), list(playback_keybinder.pressed_keys_order)))
+    assert played_frames == recorded_frames
+    assert playback.frame_number == 3
+
+    playback.stop()
+    assert playback_keybinder.pressed_keys_order == []
+
+
+def test_keybinders_with_more_options_than_the_mask_holds_are_rejected():
+    keybinder = Keybinder(*(f"option{i}" for i in range(65)))
+    with pytest.raises(ValueError):
+        InputRecorder(keybinder)
+
+    keybinder = Keybinder(*(f"option{i}" for i in range(64)))
+    recorder = InputRecorder(keybinder)
+    keybinder.add_new_option("option64")
+    with pytest.raises(ValueError):
+        recorder.record_frame(0.016)
+
+
+def test_playback_rejects_mismatched_options():
+    keybinder, _ = build_keybinder()
+    recorder = InputRecorder(keybinder)
+    with pytest.raises(ValueError):
+        InputPlayback(recorder.to_bytes(), Keybinder("left", "right"))
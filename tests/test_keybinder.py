@@ -0,0 +1,37 @@
+import pygame
+from pygame_helper.keybinder import Keybinder
+from pygame_helper.keyboard_state import KeyboardState
+
+
+def build_keybinder():
+    keyboard_state = KeyboardState()
+    keybinder = Keybinder("left", "right", keyboard_state=keyboard_state)
+    keybinder.add_keybinds_and_value_to_multiple_options(
+        ("left", [pygame.K_a, pygame.K_LEFT], -1),
+        ("right", [pygame.K_d, pygame.K_RIGHT], 1)
+    )
+    keybinder.track_keys_for_multiple_options("left", "right")
+    return keybinder, keyboard_state
+
+
+def test_pressed_keys_order_follows_the_keyboard_state():
+    keybinder, keyboard_state = build_keybinder()
+    keyboard_state.set_pressed_keys([pygame.K_a])
+    keybinder.update_pressed_keys_order()
+    keyboard_state.set_pressed_keys([pygame.K_a, pygame.K_d])
+    keybinder.update_pressed_keys_order()
+    assert keybinder.pressed_keys_order == [pygame.K_a, pygame.K_d]
+    assert keybinder.is_key_most_recently_pressed_for_option("right")
+
+    keyboard_state.set_pressed_keys([pygame.K_d])
+    keybinder.update_pressed_keys_order()
+    assert keybinder.pressed_keys_order == [pygame.K_d]
+
+
+def test_pressed_keys_order_is_the_live_list():
+    keybinder, _ = build_keybinder()
+    keybinder.pressed_keys_order.append(pygame.K_LEFT)
+    assert keybinder.is_key_most_recently_pressed_for_option("left")
+
+    keybinder.pressed_keys_order.clear()
+    assert not keybinder.is_key_most_recently_pressed_for_option("left")
@@ -0,0 +1,78 @@
+import json
+import random
+import pytest
+from pygame_helper.abstract_map import AbstractMap
+from pygame_helper.binary_tile_map import BinaryTileMap, save_tile_map_as_binary
+from pygame_helper.map_generation import get_autotile_index, describe_tile_map_in_parallel
+
+
+def describe_tile(tile_key, autotile_index):
+    return (tile_key, autotile_index)
+
+
+@pytest.fixture
+def tile_map():
+    random.seed(7)
+    return [[random.choice("aab") for _ in range(23)] for _ in range(17)]
+
+
+def describe_serially(tile_map, tile_keys=None):
+    descriptors = dict()
+    for y, row in enumerate(tile_map):
+        for x, tile_key in enumerate(row):
+            if tile_keys is None or tile_key in tile_keys:
+                descriptors[(x, y)] = (tile_key, describe_tile(tile_key, get_autotile_index(tile_map, x, y)))
+    return descriptors
+
+
+def collect(described_chunks):
+    descriptors = dict()
+    for (tile_x, tile_y), chunk in described_chunks:
+        for row_index, descriptor_row in enumerate(chunk):
+            for column_index, tile_descriptor in enumerate(descriptor_row):
+                if tile_descriptor is not None:
+                    descriptors[(tile_x + column_index, tile_y + row_index)] = tile_descriptor
+    return descriptors
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_chunks_match_a_serial_walk(tile_map, max_workers):
+    described_chunks = describe_tile_map_in_parallel(tile_map, describe_tile, (5, 4), max_workers)
+    assert collect(described_chunks) == describe_serially(tile_map)
+
+
+def test_binary_tile_map_is_read_by_the_workers(tile_map, tmp_path):
+    binary_map_path = str(tmp_path / "map.ptm")
+    save_tile_map_as_binary(tile_map, binary_map_path)
+    described_chunks = describe_tile_map_in_parallel(BinaryTileMap(binary_map_path), describe_tile, (8, 8), 2)
+    assert collect(described_chunks) == describe_serially(tile_map)
+
+
+def test_tiles_outside_tile_keys_are_not_described(tile_map):
+    described_chunks = describe_tile_map_in_parallel(tile_map, describe_tile, (8, 8), 1, {"b"})
+    assert collect(described_chunks) == describe_serially(tile_map, {"b"})
+
+
+class EmptyMap(AbstractMap):
+
+    def generate_map(self):
+        pass
+
+
+def test_tile_objects_are_generated_through_the_process_pool(tile_map, tmp_path):
+    map_path = tmp_path / "map.json"
+    map_path.write_text(json.dumps(tile_map))
+    empty_map = EmptyMap(None, str(map_path), (8, 8))
+    empty_map.tile_key_to_class_mapping["a"] = "grass"
+
+    tile_objects = dict()
+    def create_tile_object(tile_class, tile_position, descriptor):
+        tile_objects[tile_position] = (tile_class, descriptor)
+    empty_map.generate_tile_objects_in_parallel(describe_tile, create_tile_object, (5, 4), 2)
+
+    expected_tile_objects = {
+        tile_position: ("grass", descriptor)
+        for tile_position, (_, descriptor) in describe_serially(tile_map, {"a"}).items()
+    }
+    assert len(tile_objects) == sum(row.count("a") for row in tile_map)
+    assert tile_objects == expected_tile_objects
@@ -0,0 +1,175 @@
+import random
+import pygame
+import pytest
+from pygame_helper.movement.velocity_movement_component import VelocityMovementComponent
+from pygame_helper.movement.velocity_movement_system import VelocityMovementSystem
+from pygame_helper.movement.acceleration_movement_component import AccelerationMovementComponent
+from pygame_helper.movement.acceleration_movement_system import AccelerationMovementSystem
+
+
+class FixedFrametimeGameMode(object):
+
+    def __init__(self, fixed_frametime):
+        self.fixed_frametime = fixed_frametime
+
+
+def build_velocity_component(game_mode, constant_velocity_delta, default_position):
+    return VelocityMovementComponent(
+        game_mode, pygame.sprite.Sprite(), pygame.Rect(0, 0, 10, 10), constant_velocity_delta,
+        default_position=default_position, should_wrap_screen=(False, False)
+    )
+
+
+def test_sync_rects_writes_moved_components_only():
+    game_mode = FixedFrametimeGameMode(0.5)
+    moving_component = build_velocity_component(game_mode, (20, 10), (100, 100))
+    static_component = build_velocity_component(game_mode, (0, 0), (300, 300))
+    velocity_movement_system = VelocityMovementSystem(game_mode)
+    velocity_movement_system.add_multiple_components(moving_component, static_component)
+
+    static_component.rect.x = 0
+    velocity_movement_system.move()
+    assert moving_component.rect.center == (110, 105)
+    assert (moving_component.position.x, moving_component.position.y) == (105, 100)
+    assert static_component.rect.x == 0
+
+
+def test_component_changes_are_picked_up_by_sync_from_components():
+    game_mode = FixedFrametimeGameMode(1)
+    velocity_component = build_velocity_component(game_mode, (10, 0), (100, 100))
+    velocity_movement_system = VelocityMovementSystem(game_mode)
+    velocity_movement_system.add_component(velocity_component)
+
+    velocity_component.constant_velocity_delta = pygame.math.Vector2(0, 10)
+    velocity_movement_system.move()
+    assert velocity_component.rect.center == (110, 100)
+
+    velocity_movement_system.sync_from_component(velocity_component)
+    velocity_movement_system.move()
+    assert velocity_component.rect.center == (110, 110)
+
+    velocity_component.position.x = 200
+    velocity_movement_system.sync_from_components()
+    velocity_movement_system.move()
+    assert velocity_component.rect.center == (205, 120)
+
+
+def test_sync_from_components_keeps_the_integrated_velocity():
+    game_mode = FixedFrametimeGameMode(1)
+    acceleration_component = AccelerationMovementComponent(
+        game_mode, pygame.sprite.Sprite(), pygame.Rect(0, 0, 10, 10), (2, 0), (0, 0),
+        default_position=(100, 100), should_wrap_screen=(False, False)
+    )
+    acceleration_movement_system = AccelerationMovementSystem(game_mode)
+    acceleration_movement_system.add_component(acceleration_component)
+
+    acceleration_movement_system.move()
+    acceleration_movement_system.move()
+    assert acceleration_movement_system.velocity[0, 0] == pytest.approx(4)
+    acceleration_component.friction = pygame.math.Vector2(-0.5, 0)
+    acceleration_movement_system.sync_from_components()
+    assert acceleration_movement_system.velocity[0, 0] == pytest.approx(4)
+    assert acceleration_movement_system.friction[0, 0] == pytest.approx(-0.5)
+
+    acceleration_component.velocity = pygame.math.Vector2(-10, 0)
+    acceleration_movement_system.sync_from_component(acceleration_component)
+    assert acceleration_movement_system.velocity[0, 0] == pytest.approx(-10)
+
+
+def test_sync_from_components_keeps_bounced_constant_velocity_delta():
+    game_mode = FixedFrametimeGameMode(1)
+    velocity_component = VelocityMovementComponent(
+        game_mode, pygame.sprite.Sprite(), pygame.Rect(0, 0, 10, 10), (10, 0),
+        default_position=(100, 100), should_wrap_screen=(False, False), should_bounce=(True, True, True, True)
+    )
+    velocity_movement_system = VelocityMovementSystem(game_mode)
+    velocity_movement_system.add_component(velocity_component)
+    wall = pygame.sprite.Sprite()
+    wall.rect = pygame.Rect(112, 90, 10, 20)
+
+    velocity_movement_system.move_with_collision([wall])
+    assert velocity_movement_system.constant_velocity_delta[0, 0] == -10
+    velocity_movement_system.sync_from_components()
+    assert velocity_movement_system.constant_velocity_delta[0, 0] == -10
+
+
+def build_body(width, height):
+    body = pygame.sprite.Sprite()
+    body.rect = pygame.Rect(0, 0, width, height)
+    return body
+
+
+def build_walls():
+    random.seed(5)
+    walls = pygame.sprite.Group()
+    for _ in range(30):
+        wall = pygame.sprite.Sprite(walls)
+        wall.rect = pygame.Rect(random.randint(0, 380), random.randint(0, 280), random.randint(5, 40), random.randint(5, 40))
+    return walls
+
+
+def build_velocity_components(game_mode):
+    random.seed(6)
+    velocity_components = list()
+    for _ in range(100):
+        body = build_body(random.randint(2, 12), random.randint(2, 12))
+        body.movement = VelocityMovementComponent(
+            game_mode, body, body.rect, (random.uniform(-300, 300), random.uniform(-300, 300)),
+            default_position=(random.uniform(0, 400), random.uniform(0, 300)), window_size=(400, 300),
+            should_wrap_screen=(random.random() < 0.8, random.random() < 0.8),
+            should_bounce=tuple(random.random() < 0.5 for _ in range(4)), movement_type="four_way_movement"
+        )
+        velocity_components.append(body.movement)
+    return velocity_components
+
+
+def build_acceleration_components(game_mode):
+    random.seed(7)
+    acceleration_components = list()
+    for _ in range(100):
+        body = build_body(random.randint(2, 12), random.randint(2, 12))
+        body.movement = AccelerationMovementComponent(
+            game_mode, body, body.rect, (random.uniform(-300, 300), random.uniform(-300, 300)),
+            (random.uniform(0, 2), random.uniform(0, 2)),
+            default_position=(random.uniform(0, 400), random.uniform(0, 300)), window_size=(400, 300),
+            should_wrap_screen=(random.random() < 0.8, random.random() < 0.8),
+            bounce_velocity_ratios=tuple(random.uniform(0, 1) for _ in range(4)), movement_type="four_way_movement"
+        )
+        acceleration_components.append(body.movement)
+    return acceleration_components
+
+
+def assert_same_state(per_component_components, system_components):
+    for per_component_component, system_component in zip(per_component_components, system_components):
+        assert system_component.rect == per_component_component.rect
+        assert system_component.position._x == pytest.approx(per_component_component.position._x, abs=1e-6)
+        assert system_component.position._y == pytest.approx(per_component_component.position._y, abs=1e-6)
+        assert tuple(system_component.velocity) == pytest.approx(tuple(per_component_component.velocity), abs=1e-6)
+
+
+@pytest.mark.parametrize("build_components, system_class", [
+    (build_velocity_components, VelocityMovementSystem),
+    (build_acceleration_components, AccelerationMovementSystem),
+])
+@pytest.mark.parametrize("with_collision", [False, True])
+def test_system_matches_the_per_component_path(build_components, system_class, with_collision):
+    game_mode = FixedFrametimeGameMode(1 / 30)
+    walls = build_walls()
+    per_component_components = build_components(game_mode)
+    system_components = build_components(game_mode)
+    movement_system = system_class(game_mode, capacity=4)
+    movement_system.add_multiple_components(*system_components)
+
+    for _ in range(40):
+        for component in per_component_components:
+            if with_collision:
+                component.move_with_collision(component.get_x_collision, component.get_y_collision, walls)
+            else:
+                component.move()
+        if with_collision:
+            movement_system.move_with_collision(walls)
+        else:
+            movement_system.move()
+
+    movement_system.sync_components()
+    assert_same_state(per_component_components, system_components)
@@ -0,0 +1,87 @@
+import random
+import pygame
+import pytest
+from pygame_helper.positional_rect import PositionalRect
+from pygame_helper.fast_positional_rect import FastPositionalRect
+
+
+SCALAR_ATTRIBUTES = (
+    "x", "y", "top", "left", "bottom", "right", "centerx", "centery", "width", "w", "height", "h"
+)
+PAIR_ATTRIBUTES = (
+    "size", "center", "topleft", "topright", "bottomleft", "bottomright", "midtop", "midbottom", "midleft", "midright"
+)
+
+
+def get_state(positional_rect):
+    state = {name: getattr(positional_rect, name) for name in SCALAR_ATTRIBUTES}
+    state.update({name: tuple(getattr(positional_rect, name)) for name in PAIR_ATTRIBUTES})
+    state["rect"] = positional_rect.rect
+    return state
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fast_positional_rect_matches_positional_rect(seed):
+    random.seed(seed)
+    positional_rect = PositionalRect(10.25, 20.75, 15, 9)
+    fast_positional_rect = FastPositionalRect(10.25, 20.75, 15, 9)
+    assert get_state(fast_positional_rect) == get_state(positional_rect)
+
+    for _ in range(200):
+        if random.random() < 0.7:
+            name = random.choice(SCALAR_ATTRIBUTES)
+            value = random.choice([random.uniform(-100, 100), random.randint(1, 40), random.randint(-50, 50) + 0.5])
+            if name in ("width", "w", "height", "h"):
+                value = abs(value)
+        else:
+            name = random.choice(PAIR_ATTRIBUTES)
+            value = (random.uniform(-100, 100), random.randint(-50, 50) + 0.5)
+            if name == "size":
+                value = (abs(value[0]), abs(value[1]))
+        setattr(positional_rect, name, value)
+        setattr(fast_positional_rect, name, value)
+        assert get_state(fast_positional_rect) == get_state(positional_rect), name
+
+
+@pytest.mark.parametrize("position, rounded", [(10.5, 10), (11.5, 12), (-0.5, 0), (2.4999, 2), (7.5001, 8)])
+def test_positions_are_rounded_like_positional_rect(position, rounded):
+    positional_rect = PositionalRect(position, position, 3, 3)
+    fast_positional_rect = FastPositionalRect(position, position, 3, 3)
+    assert fast_positional_rect.x == positional_rect.x == rounded
+    assert fast_positional_rect.centerx == positional_rect.centerx
+    assert fast_positional_rect.center == positional_rect.center
+    assert fast_positional_rect.rect == positional_rect.rect
+
+
+def test_constructors_accept_the_same_arguments():
+    rect = pygame.Rect(3, 4, 5, 6)
+    assert FastPositionalRect(rect).rect == PositionalRect(rect).rect == rect
+    assert FastPositionalRect((3, 4), (5, 6)).rect == PositionalRect((3, 4), (5, 6)).rect == rect
+
+
+def test_cached_rect_follows_writes():
+    fast_positional_rect = FastPositionalRect(0, 0, 10, 10)
+    rect = fast_positional_rect.rect
+    assert fast_positional_rect.rect is rect
+
+    fast_positional_rect.x = 5.6
+    assert fast_positional_rect.rect == pygame.Rect(6, 0, 10, 10)
+    fast_positional_rect.move_ip(0.3, 0.2)
+    assert fast_positional_rect.rect == pygame.Rect(6, 0, 10, 10)
+    fast_positional_rect.move_ip(0.3, 0.4)
+    assert fast_positional_rect.rect == pygame.Rect(6, 1, 10, 10)
+    fast_positional_rect.set_center(50, 50)
+    assert fast_positional_rect.rect.center == (50, 50)
+
+
+@pytest.mark.parametrize("x, y, width, height", [(1, 2, 3, 4), (10.6, -3.5, 7.9, 8), (0, 0, 0, 0)])
+def test_positional_rect_factories_match_the_constructors(x, y, width, height):
+    positional_rect = PositionalRect(x, y, width, height)
+    assert get_state(PositionalRect.from_x_y_width_height(x, y, width, height)) == get_state(positional_rect)
+    assert get_state(PositionalRect.from_coords_and_geometry((x, y), (width, height))) == get_state(
+        PositionalRect((x, y), (width, height))
+    )
+
+    rect = pygame.Rect(x, y, width, height)
+    assert get_state(PositionalRect.from_rect(rect)) == get_state(PositionalRect(rect))
+    assert type(PositionalRect.from_rect(rect)) is PositionalRect
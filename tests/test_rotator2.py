@@ -0,0 +1,73 @@
+import math
+import random
+import numpy as np
+import pygame
+import pytest
+from pygame_helper.rotator2 import Rotator2, Rotator2LookupTable
+from pygame_helper.rotator2_array import Rotator2Array
+
+
+def normalise_with_loops(rotator_value):
+    while rotator_value > 180:
+        rotator_value -= 360
+    while rotator_value <= -180:
+        rotator_value += 360
+    return rotator_value
+
+
+def test_normalisation_matches_repeated_shifts():
+    random.seed(11)
+    for rotator_value in [180, -180, 540, -540, 0, 360] + [random.uniform(-2000, 2000) for _ in range(1000)]:
+        assert Rotator2(rotator_value).rotator == pytest.approx(normalise_with_loops(rotator_value), abs=1e-9)
+
+
+def test_lookup_table_only_applies_to_the_call_it_is_given_to():
+    lookup_table = Rotator2LookupTable(resolution=1)
+    rotator = Rotator2(30.4)
+    exact_vector = rotator.get_vector()
+    assert exact_vector.x == pytest.approx(math.cos(math.radians(30.4)))
+
+    table_vector = rotator.get_vector(lookup_table)
+    assert table_vector.x == pytest.approx(math.cos(math.radians(30)))
+    assert rotator.get_vector() == exact_vector
+    assert len(lookup_table) == 360
+
+
+def test_rotator_array_matches_rotator2():
+    random.seed(12)
+    rotator_values = [random.uniform(-1000, 1000) for _ in range(200)] + [180, -180, 0]
+    rotator_array = Rotator2Array(rotator_values)
+    rotators = [Rotator2(rotator_value) for rotator_value in rotator_values]
+    assert rotator_array.rotators.tolist() == pytest.approx([rotator.rotator for rotator in rotators], abs=1e-9)
+    np.testing.assert_allclose(rotator_array.get_vector(), [tuple(rotator.get_vector()) for rotator in rotators], atol=1e-9)
+
+    rotator_array *= np.float32(3)
+    assert rotator_array.rotators.tolist() == pytest.approx([(rotator * 3).rotator for rotator in rotators], abs=1e-4)
+
+
+@pytest.mark.parametrize("number", [2, 2.5, np.int64(2), np.float32(2.5), np.float64(2.5), np.array([2.0])])
+def test_rotator_array_accepts_numpy_numbers(number):
+    assert len(Rotator2Array([10]) / number) == 1
+
+
+def test_rotator_array_rejects_non_numbers():
+    with pytest.raises(TypeError):
+        Rotator2Array([10]) * "2"
+
+
+@pytest.mark.parametrize("degrees", [0, 90, 180, -180, 181, -181, 360, 540, -540, 725.5, -0.0, 179.999, 1e6])
+def test_from_degrees_matches_the_constructor(degrees):
+    rotator = Rotator2.from_degrees(degrees)
+    assert rotator.rotator == Rotator2(degrees).rotator
+    assert -180 < rotator.rotator <= 180
+    assert type(rotator.rotator) is float
+    assert rotator.get_vector() == Rotator2(degrees).get_vector()
+
+
+@pytest.mark.parametrize("vector", [(1, 0), (0, 1), (-1, 0), (0, -1), (3, -4), (-2, 5)])
+def test_from_vector_and_from_rotator_match_the_constructor(vector):
+    rotator = Rotator2(pygame.math.Vector2(vector))
+    assert Rotator2.from_vector(vector).rotator == rotator.rotator
+    assert Rotator2.from_rotator(rotator).rotator == Rotator2(rotator).rotator
+    with pytest.raises(ValueError):
+        Rotator2.from_vector((0, 0))
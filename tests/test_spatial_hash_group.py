@@ -0,0 +1,71 @@
+import random
+import pygame
+import pytest
+from pygame_helper.spatial_hash_group import SpatialHashGroup
+from pygame_helper.movement.velocity_movement_component import VelocityMovementComponent
+
+
+def create_sprite(rect, *groups):
+    sprite = pygame.sprite.Sprite(*groups)
+    sprite.rect = pygame.Rect(rect)
+    return sprite
+
+
+def create_random_sprites(rng, num_sprites):
+    return [
+        create_sprite((rng.randint(-50, 500), rng.randint(-50, 500), rng.randint(1, 90), rng.randint(1, 90)))
+        for _ in range(num_sprites)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("collided", [None, pygame.sprite.collide_rect, pygame.sprite.collide_rect_ratio(0.5)])
+def test_spritecollide_matches_pygame(seed, collided):
+    rng = random.Random(seed)
+    sprites = create_random_sprites(rng, 200)
+    spatial_hash_group = SpatialHashGroup((32, 32), *sprites)
+    group = pygame.sprite.Group(*sprites)
+
+    for mover in create_random_sprites(rng, 50):
+        assert spatial_hash_group.spritecollide(mover, False, collided) == pygame.sprite.spritecollide(mover, group, False, collided)
+
+
+def test_moved_sprites_are_missed_until_refreshed():
+    spatial_hash_group = SpatialHashGroup((32, 32))
+    sprite = create_sprite((0, 0, 10, 10), spatial_hash_group)
+    mover = create_sprite((200, 200, 10, 10))
+    assert spatial_hash_group.spritecollide(mover) == list()
+
+    sprite.rect.topleft = (202, 202)
+    assert spatial_hash_group.spritecollide(mover) == list()
+    spatial_hash_group.refresh()
+    assert spatial_hash_group.spritecollide(mover) == [sprite]
+
+
+def test_auto_refresh_finds_moved_sprites():
+    spatial_hash_group = SpatialHashGroup((32, 32), auto_refresh=True)
+    sprite = create_sprite((0, 0, 10, 10), spatial_hash_group)
+    mover = create_sprite((200, 200, 10, 10))
+    assert spatial_hash_group.spritecollide(mover) == list()
+
+    sprite.rect.topleft = (202, 202)
+    assert spatial_hash_group.spritecollide(mover) == [sprite]
+
+
+def test_callbacks_reaching_beyond_the_rects_use_the_whole_group():
+    spatial_hash_group = SpatialHashGroup((8, 8))
+    wall = create_sprite((44, 0, 10, 10), spatial_hash_group)
+    parent_sprite = create_sprite((0, 0, 40, 40))
+    velocity_movement_component = VelocityMovementComponent(None, parent_sprite, parent_sprite.rect, (0, 0), default_position=(20, 20))
+
+    for collide_callback in (pygame.sprite.collide_circle, pygame.sprite.collide_rect_ratio(2)):
+        assert velocity_movement_component._spritecollide(spatial_hash_group, False, collide_callback) == [wall]
+    assert velocity_movement_component._spritecollide(spatial_hash_group, False, pygame.sprite.collide_rect) == list()
+
+
+def test_rect_bounded_callbacks_only_query_nearby_cells():
+    parent_sprite = create_sprite((0, 0, 40, 40))
+    velocity_movement_component = VelocityMovementComponent(None, parent_sprite, parent_sprite.rect, (0, 0), default_position=(20, 20))
+    for collide_callback in (None, VelocityMovementComponent.collide_positional_rect, pygame.sprite.collide_rect_ratio(0.5)):
+        assert velocity_movement_component._get_collision_query_rect(collide_callback) is not None
+    assert velocity_movement_component._get_collision_query_rect(pygame.sprite.collide_circle) is None
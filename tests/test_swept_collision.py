@@ -0,0 +1,88 @@
+import pygame
+import pytest
+from pygame_helper.clocks import ManualClock
+from pygame_helper.spatial_hash_group import SpatialHashGroup
+from pygame_helper.movement import AbstractMovementComponent, VelocityMovementComponent
+
+
+def create_sprite(rect, *groups):
+    sprite = pygame.sprite.Sprite(*groups)
+    sprite.rect = pygame.Rect(rect)
+    return sprite
+
+
+# moves 30 pixels right every call of move_with_collision, starting at rect (0, 0, 10, 10)
+def create_mover():
+    clock = ManualClock()
+    clock.advance(100)
+    mover = create_sprite((0, 0, 10, 10))
+    mover.movement = VelocityMovementComponent(
+        None, mover, mover.rect, (300, 0), default_position=(5, 5),
+        movement_type=AbstractMovementComponent.FOUR_WAY_MOVEMENT,
+        direction_control=AbstractMovementComponent.DIRECTION_ONLY,
+        clock=clock
+    )
+    return mover
+
+
+@pytest.mark.parametrize("group_class", [pygame.sprite.Group, SpatialHashGroup])
+def test_sweep_stops_at_a_wall_the_discrete_test_tunnels_through(group_class):
+    group = group_class()
+    create_sprite((25, 0, 2, 10), group)
+
+    discrete_mover = create_mover()
+    discrete_mover.movement.move_with_collision(discrete_mover.movement.get_x_collision, None, group)
+    assert discrete_mover.rect.x == 30
+
+    swept_mover = create_mover()
+    swept_mover.movement.move_with_collision(swept_mover.movement.get_x_collision, None, group, continuous=True)
+    assert swept_mover.rect.right == 25
+
+
+def test_sweep_reports_the_earliest_wall():
+    group = pygame.sprite.Group()
+    create_sprite((32, 0, 2, 10), group)
+    nearest_wall = create_sprite((20, 0, 2, 10), group)
+    create_sprite((26, 0, 2, 10), group)
+
+    mover = create_mover()
+    previous_rect = mover.movement.position.rect
+    mover.movement._reset_velocity()
+    mover.movement._set_new_physics_state_and_transform_x()
+    assert mover.movement.get_swept_x_collision(previous_rect, group) == {"sprite": nearest_wall, "side": "right"}
+
+
+def test_sweep_ignores_sprites_it_moves_away_from():
+    group = pygame.sprite.Group()
+    create_sprite((3, 0, 4, 10), group)
+
+    mover = create_mover()
+    mover.movement.move_with_collision(mover.movement.get_x_collision, None, group, continuous=True)
+    assert mover.rect.x == 30
+
+
+def test_sweep_ignores_the_parent_sprite():
+    mover = create_mover()
+    group = pygame.sprite.Group(mover)
+    mover.movement.move_with_collision(mover.movement.get_x_collision, None, group, continuous=True)
+    assert mover.rect.x == 30
+
+
+def test_sweep_only_reports_the_sides_of_the_collide_fn():
+    group = pygame.sprite.Group()
+    create_sprite((25, 0, 2, 10), group)
+
+    mover = create_mover()
+    mover.movement.move_with_collision(mover.movement.get_collision_left, None, group, continuous=True)
+    assert mover.rect.x == 30
+
+
+def test_other_collide_callbacks_use_the_discrete_test():
+    group = pygame.sprite.Group()
+    create_sprite((25, 0, 2, 10), group)
+
+    mover = create_mover()
+    mover.movement.move_with_collision(
+        mover.movement.get_x_collision, None, group, collide_callback=lambda sprite, group_sprite: False, continuous=True
+    )
+    assert mover.rect.x == 30
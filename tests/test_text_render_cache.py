@@ -0,0 +1,103 @@
+import pygame
+from pygame_helper.widgets import TextRenderCache, TextWidget
+
+
+WHITE = (255, 255, 255, 255)
+
+
+def test_render_returns_the_cached_surface_on_a_hit():
+    text_render_cache = TextRenderCache()
+    font = pygame.font.Font(None, 20)
+    surface = text_render_cache.render(font, "score", True, WHITE)
+
+    assert text_render_cache.render(font, "score", True, WHITE) is surface
+    assert text_render_cache.get_stats()["hits"] == 1
+    assert text_render_cache.get_stats()["misses"] == 1
+
+
+def test_least_recently_used_surface_is_evicted():
+    text_render_cache = TextRenderCache(max_size=2)
+    font = pygame.font.Font(None, 20)
+    first_surface = text_render_cache.render(font, "a", True, WHITE)
+    text_render_cache.render(font, "b", True, WHITE)
+    text_render_cache.render(font, "a", True, WHITE)
+    text_render_cache.render(font, "c", True, WHITE)
+
+    assert len(text_render_cache) == 2
+    assert text_render_cache.render(font, "a", True, WHITE) is first_surface
+    text_render_cache.render(font, "b", True, WHITE)
+    assert text_render_cache.get_stats()["misses"] == 4
+
+
+def test_changing_the_font_style_misses_the_cache():
+    text_render_cache = TextRenderCache()
+    font = pygame.font.Font(None, 20)
+    surface = text_render_cache.render(font, "score", True, WHITE)
+
+    font.set_underline(True)
+    underlined_surface = text_render_cache.render(font, "score", True, WHITE)
+    assert underlined_surface is not surface
+    assert pygame.image.tostring(underlined_surface, "RGBA") == pygame.image.tostring(font.render("score", True, WHITE), "RGBA")
+
+    font.set_underline(False)
+    assert text_render_cache.render(font, "score", True, WHITE) is surface
+
+
+def test_text_widgets_share_their_default_font_and_its_rendered_text():
+    text_render_cache = TextRenderCache()
+    first_text_widget, second_text_widget = TextWidget("a"), TextWidget("a")
+    first_text_widget.render_cache = second_text_widget.render_cache = text_render_cache
+    assert first_text_widget.font is second_text_widget.font
+
+    first_text_widget.render(pygame.Surface((100, 100)), (50, 50))
+    second_text_widget.render(pygame.Surface((100, 100)), (50, 50))
+    assert text_render_cache.get_stats()["hits"] == 1
+    assert text_render_cache.get_stats()["misses"] == 1
+
+
+def test_restyling_a_text_widget_copies_its_shared_font():
+    first_text_widget, second_text_widget = TextWidget("a"), TextWidget("b")
+    shared_font = second_text_widget.font
+    first_text_widget.clear_dirty()
+
+    first_text_widget.set_font_style(italic=True)
+    assert first_text_widget.is_dirty()
+    assert first_text_widget.font is not shared_font
+    assert first_text_widget.font.get_italic()
+    assert first_text_widget.font.get_bold() == shared_font.get_bold()
+    assert not shared_font.get_italic()
+
+    own_font = first_text_widget.font
+    first_text_widget.set_font_style(underline=True)
+    assert first_text_widget.font is own_font
+    assert own_font.get_underline() and own_font.get_italic()
+
+
+def test_text_widget_renders_its_new_text_and_colour():
+    text_widget = TextWidget("a", colour=WHITE, font=pygame.font.Font(None, 20))
+    text_widget.render_cache = TextRenderCache()
+    old_rect = text_widget.get_rect((50, 50))
+    text_widget.clear_dirty()
+
+    text_widget.set_text("a much longer line")
+    assert text_widget.is_dirty()
+    assert text_widget.get_rect((50, 50)).width > old_rect.width
+
+    text_widget.clear_dirty()
+    text_widget.set_colour((255, 0, 0))
+    assert text_widget.is_dirty()
+    window = pygame.Surface((200, 100))
+    text_widget.render(window, (100, 50))
+    expected_window = pygame.Surface((200, 100))
+    expected_surface = text_widget.font.render("a much longer line", True, (255, 0, 0))
+    expected_window.blit(expected_surface, text_widget.get_centre_position_for_widget((100, 50), expected_surface.get_size()))
+    assert pygame.image.tostring(window, "RGB") == pygame.image.tostring(expected_window, "RGB")
+
+
+def test_clear_empties_the_cache():
+    text_render_cache = TextRenderCache()
+    font = pygame.font.Font(None, 20)
+    surface = text_render_cache.render(font, "score", True, WHITE)
+    text_render_cache.clear()
+    assert len(text_render_cache) == 0
+    assert text_render_cache.render(font, "score", True, WHITE) is not surface
@@ -0,0 +1,69 @@
+import json
+import pygame
+import pytest
+from pygame_helper.abstract_map import AbstractMap
+from pygame_helper.movement.tile_movement_component import TileMovementComponent
+
+
+class EmptyMap(AbstractMap):
+
+    def generate_map(self):
+        pass
+
+
+class TileObject(pygame.sprite.Sprite):
+
+    def __init__(self, tile_position, *groups):
+        super().__init__(*groups)
+        self.image = pygame.Surface((10, 10))
+        self.rect = pygame.Rect(tile_position[0] * 10, tile_position[1] * 10, 10, 10)
+
+
+@pytest.fixture
+def empty_map(tmp_path):
+    map_path = tmp_path / "map.json"
+    map_path.write_text(json.dumps([[0] * 6 for _ in range(4)]))
+    return EmptyMap(None, str(map_path), (10, 10))
+
+
+def test_tile_objects_are_found_by_tile_position(empty_map):
+    first_tile_object = TileObject((1, 2), empty_map.tile_objects)
+    second_tile_object = TileObject((4, 0), empty_map.tile_objects)
+    assert empty_map.get_tile_objects_at((1, 2)) == [first_tile_object]
+    assert empty_map.get_tile_objects_at((4, 0)) == [second_tile_object]
+    assert empty_map.get_tile_objects_at((2, 2)) == []
+
+
+def test_moved_tile_objects_are_found_at_their_new_tile_after_a_refresh(empty_map):
+    tile_object = TileObject((1, 2), empty_map.tile_objects)
+    empty_map.get_tile_objects_at((1, 2))
+    tile_object.rect.topleft = (30, 10)
+    empty_map.tile_objects.refresh()
+    assert empty_map.get_tile_objects_at((1, 2)) == []
+    assert empty_map.get_tile_objects_at((3, 1)) == [tile_object]
+
+
+def test_killed_tile_objects_leave_the_grid(empty_map):
+    first_tile_object = TileObject((1, 2), empty_map.tile_objects)
+    second_tile_object = TileObject((1, 2), empty_map.tile_objects)
+    assert set(empty_map.get_tile_objects_at((1, 2))) == {first_tile_object, second_tile_object}
+
+    first_tile_object.kill()
+    assert empty_map.get_tile_objects_at((1, 2)) == [second_tile_object]
+    empty_map.delete_all_tile_objects()
+    assert empty_map.get_tile_objects_at((1, 2)) == []
+    assert len(empty_map.tile_objects) == 0
+
+
+def test_tile_movement_collides_with_the_neighbouring_tile_only(empty_map):
+    wall = TileObject((3, 1), empty_map.tile_objects)
+    TileObject((5, 1), empty_map.tile_objects)
+    mover = pygame.sprite.Sprite()
+    mover.rect = pygame.Rect(0, 0, 10, 10)
+    mover.movement = TileMovementComponent(None, mover, mover.rect, (1, 1), (10, 10), default_position=(2, 1))
+
+    mover.movement.velocity.x = 1
+    assert mover.movement.get_collision_right(empty_map.tile_objects)["sprite"] is wall
+    mover.movement.velocity.x = -1
+    assert mover.movement.get_collision_left(empty_map.tile_objects) is None
+    assert mover.rect.topleft == (20, 10)
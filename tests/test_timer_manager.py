@@ -0,0 +1,48 @@
+import pytest
+from pygame_helper.timer_manager import TimerManager
+
+
+def test_timers_complete_in_deadline_order():
+    timer_manager = TimerManager()
+    completion_order = list()
+    for name, countdown in (("c", 0.3), ("a", 0.1), ("b", 0.2), ("a2", 0.1)):
+        timer_manager.add_timer(countdown, lambda timer, name=name: completion_order.append(name))
+
+    assert timer_manager.tick(0.15) and completion_order == ["a", "a2"]
+    timer_manager.tick(1)
+    assert completion_order == ["a", "a2", "b", "c"]
+    assert len(timer_manager) == 0
+
+
+def test_repeating_timers_keep_their_cadence():
+    timer_manager = TimerManager()
+    repeating_timer = timer_manager.add_timer(0.25, repeat=True)
+    assert timer_manager.tick(0.3) == [repeating_timer]
+    assert repeating_timer.time_remaining == pytest.approx(0.2)
+    assert timer_manager.tick(0.6) == [repeating_timer, repeating_timer]
+
+
+def test_cancelled_and_restarted_timers_fire_once_at_their_new_deadline():
+    timer_manager = TimerManager()
+    cancelled_timer = timer_manager.add_timer(0.125)
+    restarted_timer = timer_manager.add_timer(0.125)
+    cancelled_timer.cancel()
+    timer_manager.tick(0.0625)
+    restarted_timer.restart()
+    assert timer_manager.tick(0.0625) == []
+    assert timer_manager.tick(0.125) == [restarted_timer]
+    assert not cancelled_timer.is_completed()
+
+
+def test_clear_resets_completed_and_running_timers():
+    timer_manager = TimerManager()
+    completed_timer = timer_manager.add_timer(0.1)
+    running_timer = timer_manager.add_timer(1)
+    timer_manager.tick(0.2)
+    assert completed_timer.is_completed()
+
+    timer_manager.clear()
+    assert not completed_timer.is_completed()
+    assert not running_timer.is_running()
+    assert len(timer_manager) == 0
+    assert timer_manager.tick(2) == []
@@ -0,0 +1,159 @@
+import pygame
+import pytest
+from pygame_helper.widgets import WidgetLayout, BoxWidget
+
+
+def get_pixels(surface):
+    return pygame.image.tostring(surface, "RGB")
+
+
+def build_layout(**kwargs):
+    widget_layout = WidgetLayout((100, 80), retained=True, **kwargs)
+    box_widgets = [BoxWidget((10, 10), colour=(255, 0, 0)), BoxWidget((20, 5), colour=(0, 255, 0))]
+    widget_layout.add_widget(box_widgets[0], (5, 5))
+    widget_layout.add_widget(box_widgets[1], (60, 40))
+    return widget_layout, box_widgets
+
+
+def test_retained_layout_is_blitted_on_idle_frames_by_default():
+    widget_layout, _ = build_layout()
+    window = pygame.Surface((100, 80))
+    widget_layout.render(window, size="original")
+
+    window.fill((0, 0, 0))
+    assert widget_layout.render(window, size="original") == [pygame.Rect(0, 0, 100, 80)]
+    assert window.get_at((6, 6)) == pygame.Color(255, 0, 0)
+
+
+@pytest.mark.parametrize("size", ["original", (200, 160), (150, 110)])
+def test_blit_dirty_rects_only_matches_a_full_blit(size):
+    widget_layout, box_widgets = build_layout(blit_dirty_rects_only=True)
+    window = pygame.Surface((200, 160))
+    widget_layout.render(window, size=size)
+    assert widget_layout.render(window, size=size) == list()
+
+    box_widgets[0].set_colour((0, 0, 255))
+    widget_layout.change_widget_screen_position("BoxWidget_1", (30, 20))
+    dirty_rects = widget_layout.render(window, size=size)
+    assert dirty_rects and all(dirty_rect.width < 100 for dirty_rect in dirty_rects)
+
+    expected_window = pygame.Surface((200, 160))
+    widget_layout.blit_dirty_rects_only = False
+    widget_layout.render(expected_window, size=size)
+    assert get_pixels(window) == get_pixels(expected_window)
+
+
+def test_mark_dirty_rect_blits_direct_draws():
+    widget_layout, _ = build_layout(blit_dirty_rects_only=True)
+    window = pygame.Surface((100, 80))
+    widget_layout.render(window, size="original")
+
+    pygame.draw.rect(widget_layout, (255, 255, 255), (40, 10, 4, 4))
+    assert widget_layout.render(window, size="original") == list()
+    widget_layout.mark_dirty_rect((40, 10, 4, 4))
+    assert widget_layout.render(window, size="original") == [pygame.Rect(40, 10, 4, 4)]
+    assert window.get_at((41, 11)) == pygame.Color(255, 255, 255)
+    assert window.get_at((6, 6)) == pygame.Color(255, 0, 0)
+
+
+@pytest.mark.parametrize("size", [(200, 160), (150, 110), (333, 250), (64, 48)])
+@pytest.mark.parametrize("smooth_scale", [False, True])
+def test_rescaling_dirty_rects_matches_a_full_rescale(size, smooth_scale):
+    widget_layout, box_widgets = build_layout(smooth_scale=smooth_scale)
+    window = pygame.Surface(size)
+    for frame in range(10):
+        box_widgets[frame % 2].set_colour((frame * 20, 100, 255 - frame * 20))
+        widget_layout.change_widget_screen_position("BoxWidget_1", (frame * 9, frame * 7))
+        widget_layout.render(window)
+
+        scale = pygame.transform.smoothscale if smooth_scale else pygame.transform.scale
+        assert get_pixels(window) == get_pixels(scale(widget_layout, size))
+
+
+def assert_entry_indices_are_consistent(widget_layout):
+    for widget_name, index in widget_layout._entry_indices.items():
+        assert widget_layout._entries[index].name == widget_name
+    assert sorted(widget_layout._entry_indices) == sorted(widget_layout.widgets)
+
+
+def test_rename_reorder_and_delete_keep_the_name_to_index_map_in_sync():
+    widget_layout = WidgetLayout((100, 80))
+    for index in range(5):
+        widget_layout.add_widget(BoxWidget((5, 5)), (index * 10, 0))
+    assert widget_layout.widgets_ordered == [f"BoxWidget_{index}" for index in range(5)]
+
+    widget_layout.change_widget_name("BoxWidget_2", "middle")
+    widget_layout.delete_widget("BoxWidget_1")
+    assert widget_layout.widgets_ordered == ["BoxWidget_0", "middle", "BoxWidget_3", "BoxWidget_4"]
+    assert_entry_indices_are_consistent(widget_layout)
+
+    widget_layout.change_widget_render_position("BoxWidget_4", 0)
+    widget_layout.delete_widget("middle")
+    widget_layout.add_widget(BoxWidget((5, 5)), (0, 50), render_position=1)
+    assert widget_layout.widgets_ordered == ["BoxWidget_4", "BoxWidget_5", "BoxWidget_0", "BoxWidget_3"]
+    assert_entry_indices_are_consistent(widget_layout)
+
+    with pytest.raises(ValueError):
+        widget_layout.change_widget_name("BoxWidget_0", "BoxWidget_3")
+    with pytest.raises(KeyError):
+        widget_layout.delete_widget("middle")
+
+
+def test_later_widgets_are_drawn_on_top():
+    widget_layout = WidgetLayout((40, 40))
+    widget_layout.add_widget(BoxWidget((20, 20), colour=(255, 0, 0)), (0, 0), name="red")
+    widget_layout.add_widget(BoxWidget((20, 20), colour=(0, 0, 255)), (10, 10), name="blue")
+    window = pygame.Surface((40, 40))
+    widget_layout.render(window, size="original")
+    assert window.get_at((5, 5)) == pygame.Color(0, 0, 255)
+
+    widget_layout.change_widget_render_position("blue", 0)
+    widget_layout.render(window, size="original")
+    assert window.get_at((5, 5)) == pygame.Color(255, 0, 0)
+
+
+def test_widgets_keep_their_attribute_access():
+    widget_layout = WidgetLayout((100, 80))
+    box_widget = BoxWidget((5, 5))
+    widget_layout.add_widget(box_widget, (10, 10))
+
+    assert widget_layout.widgets.BoxWidget_0.widget is box_widget
+    assert widget_layout.widgets.BoxWidget_0.screen_position == (10, 10)
+    with pytest.raises(AttributeError):
+        widget_layout.widgets.BoxWidget_1
+
+
+def test_assigning_widgets_ordered_reorders_the_widgets():
+    widget_layout = WidgetLayout((40, 40))
+    widget_layout.add_widget(BoxWidget((20, 20), colour=(255, 0, 0)), (0, 0), name="red")
+    widget_layout.add_widget(BoxWidget((20, 20), colour=(0, 255, 0)), (5, 5), name="green")
+    widget_layout.add_widget(BoxWidget((20, 20), colour=(0, 0, 255)), (10, 10), name="blue")
+    widget_layout.delete_widget("green")
+
+    widget_layout.widgets_ordered = ["blue", "red"]
+    assert widget_layout.widgets_ordered == ["blue", "red"]
+    assert_entry_indices_are_consistent(widget_layout)
+    window = pygame.Surface((40, 40))
+    widget_layout.render(window, size="original")
+    assert window.get_at((5, 5)) == pygame.Color(255, 0, 0)
+
+    with pytest.raises(ValueError):
+        widget_layout.widgets_ordered = ["blue"]
+    with pytest.raises(ValueError):
+        widget_layout.widgets_ordered = ["blue", "blue"]
+
+
+@pytest.mark.parametrize("render_position", [0, 2, 5, -1, -3, 100, -100])
+def test_moving_a_widget_matches_moving_it_in_a_list(render_position):
+    widget_layout = WidgetLayout((100, 80))
+    for index in range(7):
+        widget_layout.add_widget(BoxWidget((5, 5)), (index * 10, 0))
+    widget_layout.delete_widget("BoxWidget_5")
+    expected_order = widget_layout.widgets_ordered
+
+    for widget_name in ("BoxWidget_3", "BoxWidget_0", "BoxWidget_6"):
+        expected_order.remove(widget_name)
+        expected_order.insert(render_position, widget_name)
+        widget_layout.change_widget_render_position(widget_name, render_position)
+        assert widget_layout.widgets_ordered == expected_order
+        assert_entry_indices_are_consistent(widget_layout)